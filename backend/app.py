@@ -1,21 +1,39 @@
 import os
+import json
+import asyncio
+import hashlib
 import secrets
 import string
 import smtplib
 import ssl
+import time
+import uuid
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.message import EmailMessage
-from typing import Optional
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, EmailStr, Field
+from typing import Dict, Optional, Tuple
+from fastapi import FastAPI, HTTPException, Header, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, EmailStr, Field, ValidationError
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, String, DateTime, Integer, ForeignKey, Boolean, select, func
+from sqlalchemy import create_engine, String, DateTime, Integer, BigInteger, ForeignKey, Boolean, select, func, delete, insert, case, literal
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, Session, relationship
 from passlib.context import CryptContext
 from datetime import datetime
 from pydantic import BaseModel
 from typing import List
 from sqlalchemy import text
+from search_index import PrefixIndex
+from idempotency import IdempotencyStore, fingerprint
+from structured_log import setup_logging, log_event, request_id_var, elapsed_ms
+from health import ReadinessMonitor, db_check, smtp_check, pool_status
+import db_sqlite
+from dashboard import DashboardCache
+from pubsub import Broker
+import migrate_user_id
+from mailer import BatchMailer
+from auth_tokens import TokenSigner, ACCESS, REFRESH
 
 # -----------------------
 # .env helpers
@@ -52,6 +70,16 @@ DB_URL = getenv_str("DB_URL", "mysql+pymysql://root:@localhost:3306/jogamos?char
 DB_ECHO = getenv_bool("DB_ECHO", False)
 DB_POOL_SIZE = getenv_int("DB_POOL_SIZE", 5)
 DB_POOL_RECYCLE = getenv_int("DB_POOL_RECYCLE", 1800)
+DB_MAX_OVERFLOW = getenv_int("DB_MAX_OVERFLOW", 10)
+
+# SQLite (ex.: DB_URL=sqlite:///auth.db, relativo à pasta backend)
+DB_IS_SQLITE = db_sqlite.is_sqlite(DB_URL)
+if DB_IS_SQLITE:
+    DB_URL = db_sqlite.resolve_sqlite_url(DB_URL, BASE_DIR)
+SQLITE_BUSY_TIMEOUT_MS = getenv_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+SQLITE_MMAP_SIZE = getenv_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_CACHE_SIZE_KB = getenv_int("SQLITE_CACHE_SIZE_KB", 16 * 1024)
+SQLITE_SINGLE_WRITER = getenv_bool("SQLITE_SINGLE_WRITER", True)
 
 SMTP_HOST = getenv_str("SMTP_HOST", "")
 SMTP_PORT = getenv_int("SMTP_PORT", 587)
@@ -61,9 +89,44 @@ SMTP_STARTTLS = getenv_bool("SMTP_STARTTLS", True)
 FROM_EMAIL = getenv_str("FROM_EMAIL", "no-reply@example.com")
 
 TOKEN_TTL_MINUTES = getenv_int("TOKEN_TTL_MINUTES", 10)
+SEARCH_MAX_RESULTS = getenv_int("SEARCH_MAX_RESULTS", 20)
+# Chave dos ids públicos de usuário (/search); vazio = aleatória por processo (ids mudam a cada restart)
+PUBLIC_ID_SECRET = getenv_str("PUBLIC_ID_SECRET", "")
+# Assinatura dos tokens de sessão (JWT); vazio = aleatória por processo (restart desloga todo mundo)
+AUTH_SECRET = getenv_str("AUTH_SECRET", "")
+ACCESS_TOKEN_TTL_SECONDS = getenv_int("ACCESS_TOKEN_TTL_SECONDS", 900)
+REFRESH_TOKEN_TTL_DAYS = getenv_int("REFRESH_TOKEN_TTL_DAYS", 30)
+IDEMPOTENCY_TTL_SECONDS = getenv_int("IDEMPOTENCY_TTL_SECONDS", 600)
+DASHBOARD_CACHE_TTL = getenv_int("DASHBOARD_CACHE_TTL", 30)
+# Canal de push (SSE): comentário de keep-alive a cada N segundos sem eventos
+PUSH_HEARTBEAT_SECONDS = getenv_int("PUSH_HEARTBEAT_SECONDS", 25)
+PUSH_QUEUE_SIZE = getenv_int("PUSH_QUEUE_SIZE", 64)
+
+# Cadastro em lote (/admin/signup-batch): desligado enquanto ADMIN_TOKEN estiver vazio
+ADMIN_TOKEN = getenv_str("ADMIN_TOKEN", "")
+SIGNUP_BATCH_MAX = getenv_int("SIGNUP_BATCH_MAX", 500)
+SIGNUP_BATCH_CHUNK = getenv_int("SIGNUP_BATCH_CHUNK", 100)
+# bcrypt libera o GIL: threads hasheiam em paralelo de verdade
+HASH_WORKERS = getenv_int("HASH_WORKERS", os.cpu_count() or 2)
+# E-mails por sessão SMTP no envio em lote
+MAIL_BATCH_MAX = getenv_int("MAIL_BATCH_MAX", 50)
+
+# Readiness: intervalo das checagens de fundo e saturação máxima do pool
+READY_CHECK_INTERVAL = getenv_int("READY_CHECK_INTERVAL", 5)
+READY_MAX_POOL_SATURATION = float(getenv_str("READY_MAX_POOL_SATURATION", "0.9") or 0.9)
+
+LOG_LEVEL = getenv_str("LOG_LEVEL", "INFO")
+# Fração dos requests 2xx/3xx logados (erros são sempre logados)
+LOG_HTTP_SAMPLE_RATE = float(getenv_str("LOG_HTTP_SAMPLE_RATE", "0.1") or 0.1)
+
+setup_logging(LOG_LEVEL)
+
+# Respostas recentes por Idempotency-Key (signup / resend-token)
+idempotency_store = IdempotencyStore(ttl_seconds=IDEMPOTENCY_TTL_SECONDS)
 
 # Remove limite de 72 bytes do bcrypt puro
 pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
+hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="bcrypt")
 
 # -----------------------
 # SQLAlchemy setup
@@ -71,15 +134,26 @@ pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
 class Base(DeclarativeBase):
     pass
 
+# Opções prefixadas por dialeto: o SQLite simplesmente as ignora
+MYSQL_TABLE_ARGS = {
+    "mysql_engine": "InnoDB",
+    "mysql_charset": "utf8mb4",
+    "mysql_collate": "utf8mb4_unicode_ci",
+}
+
+# PK inteira compacta (8 bytes em vez de até 764 do e-mail utf8mb4 em todo índice/FK).
+# No SQLite só INTEGER PRIMARY KEY vira alias do rowid (auto-increment)
+UserId = BigInteger().with_variant(Integer, "sqlite")
+
+def user_fk(**kwargs):
+    return mapped_column(UserId, ForeignKey("users.id", ondelete="CASCADE"), **kwargs)
+
 class User(Base):
     __tablename__ = "users"
-    __table_args__ = {
-        "mysql_engine": "InnoDB",
-        "mysql_charset": "utf8mb4",
-        "mysql_collate": "utf8mb4_unicode_ci",
-    }
+    __table_args__ = MYSQL_TABLE_ARGS
 
-    email: Mapped[str] = mapped_column(String(191), primary_key=True)
+    id: Mapped[int] = mapped_column(UserId, primary_key=True, autoincrement=True)
+    email: Mapped[str] = mapped_column(String(191), unique=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -95,20 +169,10 @@ class User(Base):
 
 class EmailToken(Base):
     __tablename__ = "email_tokens"
-    __table_args__ = {
-        "mysql_engine": "InnoDB",
-        "mysql_charset": "utf8mb4",
-        "mysql_collate": "utf8mb4_unicode_ci",
-    }
+    __table_args__ = MYSQL_TABLE_ARGS
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    # 🔴 TROQUE 255 -> 191 (deve bater com o PK de users.email)
-    email: Mapped[str] = mapped_column(
-        String(191),
-        ForeignKey("users.email", ondelete="CASCADE"),
-        nullable=False,
-        index=True
-    )
+    user_id: Mapped[int] = user_fk(nullable=False, index=True)
     token: Mapped[str] = mapped_column(String(16), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -120,18 +184,140 @@ class EmailToken(Base):
     user: Mapped[User] = relationship(back_populates="tokens")
 
 
+class UserFavorite(Base):
+    __tablename__ = "user_favorites"
+    __table_args__ = MYSQL_TABLE_ARGS
+
+    user_id: Mapped[int] = user_fk(primary_key=True)
+    sport_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+class Team(Base):
+    __tablename__ = "teams"
+    __table_args__ = MYSQL_TABLE_ARGS
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(120), nullable=False)
+    sport_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_by: Mapped[int] = user_fk(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+class TeamMembership(Base):
+    __tablename__ = "team_memberships"
+    __table_args__ = MYSQL_TABLE_ARGS
+
+    team_id: Mapped[int] = mapped_column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True)
+    user_id: Mapped[int] = user_fk(primary_key=True, index=True)
+    joined_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+class Goal(Base):
+    __tablename__ = "goals"
+    __table_args__ = MYSQL_TABLE_ARGS
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = user_fk(nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(160), nullable=False)
+    target: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
+class UserStats(Base):
+    """Contadores do dashboard, atualizados na mesma transação de cada escrita (nada de COUNT(*) na leitura)."""
+    __tablename__ = "user_stats"
+    __table_args__ = MYSQL_TABLE_ARGS
+
+    user_id: Mapped[int] = user_fk(primary_key=True)
+    teams_active: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    goals_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    goals_completed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+
 engine = create_engine(
     DB_URL,
     echo=DB_ECHO,
     pool_pre_ping=True,
     pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     pool_recycle=DB_POOL_RECYCLE,
+    **(db_sqlite.engine_kwargs(SQLITE_BUSY_TIMEOUT_MS) if DB_IS_SQLITE else {}),
 )
-Base.metadata.create_all(engine)
+if DB_IS_SQLITE:
+    db_sqlite.install_pragmas(
+        engine,
+        busy_timeout_ms=SQLITE_BUSY_TIMEOUT_MS,
+        mmap_size=SQLITE_MMAP_SIZE,
+        cache_size_kb=SQLITE_CACHE_SIZE_KB,
+    )
+# Esquema antigo (PK = e-mail): a migração é um passo explícito, fora do boot
+# (vários workers/--reload migrando ao mesmo tempo corromperiam o banco)
+if migrate_user_id.needs_migration(engine):
+    if not migrate_user_id.RUNNING:
+        raise RuntimeError("Banco no esquema antigo (users.email como PK): rode `python migrate_user_id.py` "
+                           "(na pasta backend) antes de subir o app.")
+else:
+    Base.metadata.create_all(engine)
+
+# Escritas em série no SQLite; no MySQL roda direto na thread do request
+db_writer = db_sqlite.SingleWriter(enabled=DB_IS_SQLITE and SQLITE_SINGLE_WRITER)
 
 def now_utc() -> datetime:
     return datetime.utcnow()
 
+def dialect_insert(model):
+    """insert() do dialeto do engine (com on_duplicate_key_update / on_conflict_do_update)."""
+    dialect = engine.dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert_
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert_
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert_
+    else:
+        raise RuntimeError(f"Upsert não suportado no dialeto {dialect}")
+    return dialect_insert_(model)
+
+def bump_stats(sess: Session, user_id: int, **deltas: int) -> None:
+    """
+    Incrementa contadores de user_stats no banco (x = x + n) num upsert: a linha é
+    criada se faltar, sem corrida entre duas primeiras escritas do mesmo usuário.
+    """
+    now = now_utc()
+    stmt = dialect_insert(UserStats).values(
+        user_id=user_id, updated_at=now, **{name: max(0, delta) for name, delta in deltas.items()}
+    )
+    increments = {name: getattr(UserStats, name) + delta for name, delta in deltas.items()}
+    if engine.dialect.name == "mysql":
+        stmt = stmt.on_duplicate_key_update(**increments, updated_at=now)
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=[UserStats.user_id], set_={**increments, "updated_at": now})
+    sess.execute(stmt)
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -142,37 +328,153 @@ def generate_token(n: int = 6) -> str:
     # token numérico
     return "".join(secrets.choice(string.digits) for _ in range(n))
 
-def send_email(to_email: str, subject: str, content: str) -> None:
-    if not SMTP_HOST:
-        # DEV: log no console
-        print("========== EMAIL DEV ==========")
-        print(f"Para: {to_email}")
-        print(f"Assunto: {subject}")
-        print(f"Conteúdo:\n{content}")
-        print("================================")
-        return
-
+def build_email(to_email: str, subject: str, content: str) -> EmailMessage:
     msg = EmailMessage()
     msg["From"] = FROM_EMAIL
     msg["To"] = to_email
     msg["Subject"] = subject
     msg.set_content(content)
+    return msg
 
+def send_emails(messages: List[EmailMessage]) -> None:
+    """Envia todas as mensagens numa única sessão SMTP."""
+    if not SMTP_HOST:
+        # DEV: log no console
+        for msg in messages:
+            log_event("email.dev", to=msg["To"], subject=msg["Subject"], content=msg.get_content())
+        return
+
+    context = ssl.create_default_context()
     if SMTP_PORT == 465 and not SMTP_STARTTLS:
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, context=context) as server:
-            if SMTP_USER and SMTP_PASSWORD:
-                server.login(SMTP_USER, SMTP_PASSWORD)
-            server.send_message(msg)
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, context=context)
     else:
-        context = ssl.create_default_context()
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            if SMTP_STARTTLS:
-                server.starttls(context=context)
-            if SMTP_USER and SMTP_PASSWORD:
-                server.login(SMTP_USER, SMTP_PASSWORD)
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    with server:
+        if SMTP_STARTTLS:
+            server.starttls(context=context)
+        if SMTP_USER and SMTP_PASSWORD:
+            server.login(SMTP_USER, SMTP_PASSWORD)
+        for msg in messages:
             server.send_message(msg)
 
+def send_email(to_email: str, subject: str, content: str) -> None:
+    send_emails([build_email(to_email, subject, content)])
+
+def verification_email(to_email: str, token: str) -> EmailMessage:
+    return build_email(
+        to_email,
+        "Seu token de verificação",
+        f"Olá!\n\nSeu token de verificação é: {token}\nEle expira em {TOKEN_TTL_MINUTES} minutos.\n",
+    )
+
+# -----------------------
+# Escritas de signup / resend-token (poucos statements, regra no próprio banco)
+# -----------------------
+def upsert_users_stmt(accounts: List[Tuple[str, str]], now: datetime):
+    """
+    INSERT de (email, password_hash) em um statement; e-mail que já existe e NÃO foi
+    verificado ganha senha e data novas. Verificado fica intacto (a condição roda no
+    banco, sem SELECT antes).
+    """
+    values = [{"email": email, "password_hash": password_hash, "is_verified": False, "created_at": now}
+              for email, password_hash in accounts]
+    stmt = dialect_insert(User).values(values)
+    if engine.dialect.name == "mysql":
+        # ON DUPLICATE KEY UPDATE não tem WHERE: cada coluna mantém o valor se já verificado
+        verified = User.is_verified.is_(True)
+        return stmt.on_duplicate_key_update(
+            password_hash=case((verified, User.password_hash), else_=stmt.inserted.password_hash),
+            created_at=case((verified, User.created_at), else_=stmt.inserted.created_at),
+        )
+    return stmt.on_conflict_do_update(
+        index_elements=[User.email],  # índice UNIQUE
+        set_={"password_hash": stmt.excluded.password_hash, "created_at": stmt.excluded.created_at},
+        where=User.is_verified.is_(False),
+    )
+
+def insert_token_if_unverified(sess: Session, email: str, token: str, now: datetime) -> bool:
+    """INSERT ... SELECT FROM users WHERE não verificado. False se o usuário não existe ou já foi verificado."""
+    exp = now + timedelta(minutes=TOKEN_TTL_MINUTES)
+    source = select(
+        User.id, literal(token, String), literal(exp, DateTime()), literal(now, DateTime())
+    ).where(User.email == email, User.is_verified.is_(False))
+    res = sess.execute(
+        insert(EmailToken).from_select(["user_id", "token", "expires_at", "created_at"], source)
+    )
+    return res.rowcount == 1
+
+def reject_if_verified(email: str) -> None:
+    """
+    Leitura pelo índice UNIQUE de e-mail, fora do writer: e-mail já verificado é
+    recusado antes do bcrypt e da escrita. O upsert condicional continua cobrindo
+    quem verificar entre esta leitura e o signup_write.
+    """
+    with engine.connect() as conn:
+        if conn.scalar(select(User.is_verified).where(User.email == email)):
+            raise HTTPException(status_code=400, detail="E-mail já cadastrado e verificado.")
+
+def signup_write(email: str, password_hash: str) -> str:
+    """Upsert do usuário + token, 2 statements numa transação. Retorna o token."""
+    token = generate_token(6)
+    now = now_utc()
+    with Session(engine) as sess, sess.begin():
+        sess.execute(upsert_users_stmt([(email, password_hash)], now))
+        # O upsert garante a linha: 0 linhas aqui = já verificado
+        if not insert_token_if_unverified(sess, email, token, now):
+            raise HTTPException(status_code=400, detail="E-mail já cadastrado e verificado.")
+    return token
+
+def signup_batch_write(accounts: List[Tuple[str, str]]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Cadastro em lote numa transação, em blocos de SIGNUP_BATCH_CHUNK: por bloco,
+    1 SELECT de quem já existe, 1 upsert multi-linha, 1 SELECT dos ids e 1 INSERT
+    dos tokens. Retorna {email: (status, token)}.
+    """
+    now = now_utc()
+    exp = now + timedelta(minutes=TOKEN_TTL_MINUTES)
+    out: Dict[str, Tuple[str, Optional[str]]] = {}
+    with Session(engine) as sess, sess.begin():
+        for i in range(0, len(accounts), SIGNUP_BATCH_CHUNK):
+            chunk = accounts[i:i + SIGNUP_BATCH_CHUNK]
+            existing = dict(sess.execute(
+                select(User.email, User.is_verified).where(User.email.in_([email for email, _ in chunk]))
+            ).all())
+            todo = []
+            for email, password_hash in chunk:
+                if existing.get(email):
+                    out[email] = ("already_verified", None)
+                else:
+                    todo.append((email, password_hash))
+            if not todo:
+                continue
+            sess.execute(upsert_users_stmt(todo, now))
+            ids = dict(sess.execute(
+                select(User.email, User.id)
+                .where(User.email.in_([email for email, _ in todo]), User.is_verified.is_(False))
+            ).all())
+            tokens = []
+            for email, _ in todo:
+                if email not in ids:  # verificado entre o SELECT e o upsert
+                    out[email] = ("already_verified", None)
+                    continue
+                token = generate_token(6)
+                tokens.append({"user_id": ids[email], "token": token, "expires_at": exp, "created_at": now})
+                out[email] = ("updated" if email in existing else "created", token)
+            if tokens:
+                sess.execute(insert(EmailToken), tokens)
+    return out
+
+def resend_write(email: str) -> str:
+    """Novo token em 1 statement; o SELECT extra só roda para montar o erro."""
+    token = generate_token(6)
+    with Session(engine) as sess, sess.begin():
+        if insert_token_if_unverified(sess, email, token, now_utc()):
+            return token
+        verified = sess.scalar(select(User.is_verified).where(User.email == email))
+    if verified is None:
+        raise HTTPException(status_code=404, detail="Usuário não encontrado.")
+    raise HTTPException(status_code=400, detail="Usuário já verificado.")
+
 # -----------------------
 # Schemas
 # -----------------------
@@ -191,58 +493,205 @@ class LoginIn(BaseModel):
     email: EmailStr
     password: str
 
+# -----------------------
+# Catálogo de esportes (chave = nome do ícone no app)
+# -----------------------
+SPORTS_CATALOG = [
+    ("futebol", "Futebol"),
+    ("volei", "Vôlei"),
+    ("basquete", "Basquete"),
+    ("tenis", "Tênis"),
+    ("natacao", "Natação"),
+    ("corrida", "Corrida"),
+    ("caminhada", "Caminhada"),
+    ("skate", "Skate"),
+    ("bmx", "BMX"),
+    ("badminton", "Badminton"),
+    ("jiujitsu", "Jiu-Jitsu"),
+    ("judo", "Judô"),
+    ("karate", "Karatê"),
+    ("boxe", "Boxe"),
+    ("muaythai", "Muay Thai"),
+    ("yoga", "Yoga"),
+    ("pilates", "Pilates"),
+    ("crossfit", "Crossfit"),
+    ("ciclismo", "Ciclismo"),
+    ("surf", "Surf"),
+    ("escalada", "Escalada"),
+    ("rugby", "Rugby"),
+    ("beisebol", "Beisebol"),
+    ("handebol", "Handebol"),
+    ("tenisdemesa", "Tênis de mesa"),
+    ("golfe", "Golfe"),
+    ("hoquei", "Hóquei"),
+    ("esgrima", "Esgrima"),
+]
+SPORT_KEYS = {key for key, _ in SPORTS_CATALOG}
+# Favoritos sempre na ordem do catálogo (a mesma em que o app monta a seleção)
+SPORT_ORDER = {key: i for i, (key, _) in enumerate(SPORTS_CATALOG)}
+
+# Payload de /me/dashboard por usuário (invalidado a cada escrita que o afeta)
+dashboard_cache = DashboardCache(ttl_seconds=DASHBOARD_CACHE_TTL)
+
+# E-mails do cadastro em lote: uma sessão SMTP por lote, fora do request
+mailer = BatchMailer(send_emails, max_batch=MAIL_BATCH_MAX)
+
+# Deltas do dashboard para quem está conectado em /me/events (tópico = e-mail)
+push_broker = Broker(queue_size=PUSH_QUEUE_SIZE)
+
+def push(email: str, type: str, **fields) -> None:
+    push_broker.publish(email, {"type": type, **fields})
+
+# Índice de busca (esportes + usuários verificados), montado no startup
+search_index = PrefixIndex()
+
+_public_id_key = PUBLIC_ID_SECRET.encode("utf-8") or secrets.token_bytes(32)
+
+def public_user_id(user_id: int) -> str:
+    """Id opaco para respostas públicas (não revela e-mail nem a sequência de users.id)."""
+    return hashlib.blake2b(str(user_id).encode(), key=_public_id_key[:64], digest_size=8).hexdigest()
+
+# Sessão: o login devolve access/refresh; /me/* identifica o usuário pelo access token
+token_signer = TokenSigner(AUTH_SECRET.encode("utf-8") or secrets.token_bytes(32),
+                           access_ttl=ACCESS_TOKEN_TTL_SECONDS, refresh_ttl=REFRESH_TOKEN_TTL_DAYS * 86400)
+
+def require_session(authorization: Optional[str]) -> str:
+    """E-mail do usuário do header Authorization: Bearer <access>; 401 se ausente/inválido/expirado."""
+    scheme, _, token = (authorization or "").partition(" ")
+    payload = token_signer.verify(token.strip(), ACCESS) if scheme.lower() == "bearer" else None
+    if payload is None:
+        raise HTTPException(status_code=401, detail="Sessão inválida ou expirada.",
+                            headers={"WWW-Authenticate": "Bearer"})
+    return payload["email"]
+
+def display_name(email: str) -> str:
+    return email.split("@", 1)[0]
+
+def index_user(user_id: int, email: str) -> None:
+    # /search é público: só o nome de exibição (parte local, ex.: "carol.silva"); domínio e e-mail nunca
+    search_index.add("user", public_user_id(user_id), label=display_name(email))
+
 # -----------------------
 # FastAPI app
 # -----------------------
 app = FastAPI(title="Auth API (MySQL)", version="2.0.0")
 
+@app.middleware("http")
+async def _request_context(request: Request, call_next):
+    # Propaga o request id (do cliente ou gerado) para todos os logs do request
+    rid = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = request_id_var.set(rid)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = rid
+        status = response.status_code
+        log_event("http.request", level=logging.WARNING if status >= 400 else logging.INFO,
+                  sample_rate=1.0 if status >= 400 else LOG_HTTP_SAMPLE_RATE,
+                  method=request.method, path=request.url.path, status=status, ms=elapsed_ms(start))
+        return response
+    except Exception:
+        log_event("http.error", level=logging.ERROR, exc_info=True,
+                  method=request.method, path=request.url.path, ms=elapsed_ms(start))
+        raise
+    finally:
+        request_id_var.reset(token)
+
 @app.on_event("startup")
 def _startup_log():
-    print("[STARTUP] DB_URL:", DB_URL)
-    print("[STARTUP] SMTP_HOST:", SMTP_HOST or "(DEV mode)")
-    print("[STARTUP] SMTP_PORT:", SMTP_PORT)
-    print("[STARTUP] SMTP_STARTTLS:", SMTP_STARTTLS)
-    print("[STARTUP] FROM_EMAIL:", FROM_EMAIL)
     try:
-        print("[STARTUP] PASSLIB schemes:", pwd_context.schemes())
+        schemes = pwd_context.schemes()
     except Exception as e:
-        print("[STARTUP] PASSLIB error:", repr(e))
+        schemes = repr(e)
+    log_event(
+        "startup",
+        db_url=DB_URL,
+        db_single_writer=db_writer.enabled,
+        smtp_host=SMTP_HOST or "(DEV mode)",
+        smtp_port=SMTP_PORT,
+        smtp_starttls=SMTP_STARTTLS,
+        from_email=FROM_EMAIL,
+        passlib_schemes=schemes,
+    )
+
+_readiness_checks = {"db": db_check(engine)}
+if SMTP_HOST:
+    _readiness_checks["smtp"] = smtp_check(SMTP_HOST, SMTP_PORT)
+readiness = ReadinessMonitor(_readiness_checks, interval=READY_CHECK_INTERVAL)
+
+@app.on_event("startup")
+def _start_readiness():
+    readiness.start()
+
+@app.on_event("shutdown")
+def _stop_readiness():
+    readiness.stop()
+
+@app.on_event("shutdown")
+def _stop_db_writer():
+    db_writer.shutdown()
+
+@app.on_event("startup")
+def _start_mailer():
+    mailer.start()
+
+@app.on_event("shutdown")
+def _stop_mailer():
+    mailer.stop()
+    hash_pool.shutdown(wait=False)
+
+@app.on_event("startup")
+def _build_search_index():
+    for key, name in SPORTS_CATALOG:
+        search_index.add("sport", key, label=name, text=key)
+    with Session(engine) as sess:
+        for user_id, email in sess.execute(select(User.id, User.email).where(User.is_verified.is_(True))):
+            index_user(user_id, email)
+    log_event("startup.search_index", docs=len(search_index))
 
 # -----------------------
 # Endpoints
 # -----------------------
+@app.get("/healthz")
+def healthz():
+    # Liveness: sem I/O
+    return {"status": "ok"}
+
+@app.get("/readyz")
+def readyz():
+    snap = readiness.snapshot()
+    pool = pool_status(engine)
+    saturated = pool.get("saturation", 0.0) >= READY_MAX_POOL_SATURATION
+    ready = snap["ok"] and not saturated
+    body = {"status": "ready" if ready else "not_ready", "pool": pool, "pool_saturated": saturated,
+            "push": push_broker.stats(), "mailer": mailer.stats(), **snap}
+    return JSONResponse(body, status_code=200 if ready else 503)
+
 @app.post("/auth/signup")
-def signup(body: SignupIn):
+def signup(
+    body: SignupIn,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    result, replayed = idempotency_store.run(
+        "signup", idempotency_key, fingerprint(body.model_dump()), lambda: _signup(body)
+    )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+def _signup(body: SignupIn):
     email = body.email.lower().strip()
-    password = body.password
+    reject_if_verified(email)  # 1 SELECT indexado em vez de bcrypt + upsert
+    # bcrypt fora da escrita: não segura o writer do SQLite
+    password_hash = hash_password(body.password)
 
-    with Session(engine) as sess:
-        # existe?
-        user = sess.get(User, email)
-        if user:
-            if user.is_verified:
-                raise HTTPException(status_code=400, detail="E-mail já cadastrado e verificado.")
-            # atualiza senha e data
-            user.password_hash = hash_password(password)
-            user.created_at = now_utc()
-        else:
-            user = User(email=email, password_hash=hash_password(password), is_verified=False)
-            sess.add(user)
-
-        # gera token e grava
-        token = generate_token(6)
-        exp = now_utc() + timedelta(minutes=TOKEN_TTL_MINUTES)
-        sess.add(EmailToken(email=email, token=token, expires_at=exp))
-
-        sess.commit()  # grava no banco antes de enviar e-mail
+    # grava no banco (commit) antes de enviar e-mail
+    token = db_writer.run(lambda: signup_write(email, password_hash))
 
     # envia e-mail após commit
     try:
-        send_email(
-            to_email=email,
-            subject="Seu token de verificação",
-            content=f"Olá!\n\nSeu token de verificação é: {token}\nEle expira em {TOKEN_TTL_MINUTES} minutos.\n"
-        )
+        send_emails([verification_email(email, token)])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro ao enviar e-mail: {e}")
 
@@ -253,44 +702,50 @@ def verify_email(body: VerifyIn):
     email = body.email.lower().strip()
     token_in = body.token.strip()
 
-    with Session(engine) as sess:
-        # pega o último token válido
-        t = (
-            sess.query(EmailToken)
-            .filter(EmailToken.email == email)
-            .order_by(EmailToken.id.desc())
-            .first()
-        )
-        
-        exp = t.expires_at
-        if exp is None or exp < now_utc():
-            raise HTTPException(status_code=400, detail="Token não encontrado ou expirado.")
-        if token_in != t.token:
-            raise HTTPException(status_code=400, detail="Token inválido.")
-
-        user = sess.get(User, email)
-        if not user:
-            raise HTTPException(status_code=404, detail="Usuário não encontrado.")
-        user.is_verified = True
-        sess.commit()
+    def write() -> int:
+        with Session(engine) as sess:
+            # pega o último token (e o usuário dono dele) numa consulta só
+            row = sess.execute(
+                select(EmailToken, User)
+                .join(User, EmailToken.user_id == User.id)
+                .where(User.email == email)
+                .order_by(EmailToken.id.desc())
+                .limit(1)
+            ).first()
+            if row is None:
+                raise HTTPException(status_code=400, detail="Token não encontrado ou expirado.")
+            t, user = row
+
+            exp = t.expires_at
+            if exp is None or exp < now_utc():
+                raise HTTPException(status_code=400, detail="Token não encontrado ou expirado.")
+            if token_in != t.token:
+                raise HTTPException(status_code=400, detail="Token inválido.")
+
+            user.is_verified = True
+            sess.commit()
+            return user.id
 
+    user_id = db_writer.run(write)
+    index_user(user_id, email)
     return {"message": "E-mail verificado com sucesso."}
 
 @app.post("/auth/resend-token")
-def resend_token(body: ResendIn):
-    email = body.email.lower().strip()
-
-    with Session(engine) as sess:
-        user = sess.get(User, email)
-        if not user:
-            raise HTTPException(status_code=404, detail="Usuário não encontrado.")
-        if user.is_verified:
-            raise HTTPException(status_code=400, detail="Usuário já verificado.")
+def resend_token(
+    body: ResendIn,
+    response: Response,
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    result, replayed = idempotency_store.run(
+        "resend-token", idempotency_key, fingerprint(body.model_dump()), lambda: _resend_token(body)
+    )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
 
-        token = generate_token(6)
-        exp = now_utc() + timedelta(minutes=TOKEN_TTL_MINUTES)
-        sess.add(EmailToken(email=email, token=token, expires_at=exp))
-        sess.commit()
+def _resend_token(body: ResendIn):
+    email = body.email.lower().strip()
+    token = db_writer.run(lambda: resend_write(email))
 
     try:
         send_email(
@@ -309,7 +764,7 @@ def login(body: LoginIn):
     password = body.password
 
     with Session(engine) as sess:
-        user = sess.get(User, email)
+        user = get_user(sess, email)
         if not user:
             raise HTTPException(status_code=401, detail="Credenciais inválidas.")
         if not user.is_verified:
@@ -317,9 +772,117 @@ def login(body: LoginIn):
 
         if not verify_password(password, user.password_hash):
             raise HTTPException(status_code=401, detail="Credenciais inválidas.")
+        user_id = user.id
+
+    return {"message": "Login OK", **token_signer.pair(str(user_id), email=email)}
+
+@app.post("/auth/refresh")
+def refresh_session(refresh_token: str):
+    payload = token_signer.verify(refresh_token, REFRESH)
+    if payload is None:
+        raise HTTPException(status_code=401, detail="Sessão inválida ou expirada.")
+    with Session(engine) as sess:
+        user = sess.get(User, int(payload["sub"]))
+        # Conta removida (ou e-mail trocado) desde o login: refresh não vale mais
+        if not user or user.email != payload["email"]:
+            raise HTTPException(status_code=401, detail="Sessão inválida ou expirada.")
+    return token_signer.pair(payload["sub"], email=payload["email"])
+
+# -----------------------
+# Cadastro em lote (clubes/times inscrevendo o elenco todo)
+# -----------------------
+class BatchAccountIn(BaseModel):
+    # Validado linha a linha (SignupIn): uma linha ruim não derruba o lote
+    email: str
+    password: str
 
-    # Se quiser emitir JWT, este é o ponto; por ora, retornamos 200 simples
-    return {"message": "Login OK"}
+class SignupBatchIn(BaseModel):
+    accounts: List[BatchAccountIn] = Field(min_length=1)
+
+def require_admin(token: Optional[str]) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not secrets.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Acesso negado.")
+
+@app.post("/admin/signup-batch")
+def signup_batch(
+    body: SignupBatchIn,
+    response: Response,
+    x_admin_token: Optional[str] = Header(default=None, alias="X-Admin-Token"),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    require_admin(x_admin_token)
+    if len(body.accounts) > SIGNUP_BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"Máximo de {SIGNUP_BATCH_MAX} contas por lote.")
+    result, replayed = idempotency_store.run(
+        "signup-batch", idempotency_key, fingerprint(body.model_dump()), lambda: _signup_batch(body)
+    )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+def _signup_batch(body: SignupBatchIn):
+    start = time.perf_counter()
+    # 1) validação por linha; e-mail repetido no lote só vale na 1ª ocorrência
+    rows = []      # (índice, email, senha) válidos
+    results = []   # um item por linha do lote, na mesma ordem
+    seen = set()
+    for i, acc in enumerate(body.accounts):
+        try:
+            valid = SignupIn(email=acc.email.strip(), password=acc.password)
+        except ValidationError as e:
+            results.append({"email": acc.email, "status": "invalid", "detail": e.errors()[0]["msg"]})
+            continue
+        email = valid.email.lower().strip()
+        if email in seen:
+            results.append({"email": email, "status": "duplicate"})
+            continue
+        seen.add(email)
+        rows.append((i, email, valid.password))
+        results.append({"email": email, "status": None})
+
+    # 2) bcrypt em paralelo, fora da escrita
+    hashes = list(hash_pool.map(hash_password, [password for _, _, password in rows]))
+
+    # 3) usuários + tokens numa transação em blocos
+    written = db_writer.run(lambda: signup_batch_write([(email, h) for (_, email, _), h in zip(rows, hashes)]))
+
+    # 4) e-mails para o envio em lote (não espera o SMTP)
+    messages = []
+    for i, email, _ in rows:
+        status, token = written[email]
+        results[i]["status"] = status
+        if token:
+            messages.append(verification_email(email, token))
+    mailer.submit(messages)
+
+    counts: Dict[str, int] = {}
+    for item in results:
+        counts[item["status"]] = counts.get(item["status"], 0) + 1
+    log_event("signup_batch", total=len(results), ms=elapsed_ms(start), **counts)
+    return {"total": len(results), "counts": counts, "results": results}
+
+# -----------------------
+# Respostas com ETag (o app revalida com If-None-Match e recebe 304)
+# -----------------------
+def etag_json(request: Request, payload, max_age: int = 0) -> Response:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+    if etag in [t.strip() for t in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/sports")
+def sports_catalog(request: Request):
+    # Lista estável: o app guarda em cache local e usa offline
+    return etag_json(request, [{"key": key, "name": name} for key, name in SPORTS_CATALOG], max_age=86400)
+
+@app.get("/search")
+def search(q: str = "", limit: int = SEARCH_MAX_RESULTS):
+    limit = max(1, min(limit, SEARCH_MAX_RESULTS))
+    return {"query": q, "results": search_index.search(q, limit=limit)}
 
 class FavoritesIn(BaseModel):
     email: str
@@ -337,17 +900,216 @@ def set_favorites(body: FavoritesIn):
     sports = list(dict.fromkeys(sports))
     if len(sports) != 3:
         raise HTTPException(status_code=400, detail="Esportes repetidos não são permitidos.")
+    if not SPORT_KEYS.issuperset(sports):
+        raise HTTPException(status_code=400, detail="Esporte desconhecido.")
+    sports.sort(key=SPORT_ORDER.__getitem__)
 
     now = datetime.utcnow()
 
-    with engine.begin() as conn:
-        # remove antigos
-        conn.execute(text("DELETE FROM user_favorites WHERE email=:email"), {"email": email})
-        # insere novos
-        for s in sports:
-            conn.execute(
-                text("INSERT INTO user_favorites (email, sport_key, created_at) VALUES (:email, :sport, :created_at)"),
-                {"email": email, "sport": s, "created_at": now}
+    def write() -> None:
+        with engine.begin() as conn:
+            user_id = conn.scalar(text("SELECT id FROM users WHERE email=:email"), {"email": email})
+            if user_id is None:
+                raise HTTPException(status_code=404, detail="Usuário não encontrado.")
+            # remove antigos
+            conn.execute(text("DELETE FROM user_favorites WHERE user_id=:user_id"), {"user_id": user_id})
+            # insere novos
+            for s in sports:
+                conn.execute(
+                    text("INSERT INTO user_favorites (user_id, sport_key, created_at) VALUES (:user_id, :sport, :created_at)"),
+                    {"user_id": user_id, "sport": s, "created_at": now}
+                )
+
+    db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    push(email, "favorites", sports=sports)
+
+    return {"message": "Favoritos salvos com sucesso.", "email": email, "sports": sports}
+
+# -----------------------
+# Times e metas (cada escrita ajusta user_stats na mesma transação)
+# -----------------------
+# Usuário de todas as escritas abaixo = dono do access token (Authorization: Bearer)
+class TeamIn(BaseModel):
+    name: str = Field(min_length=1, max_length=120)
+    sport_key: str
+
+class GoalIn(BaseModel):
+    title: str = Field(min_length=1, max_length=160)
+    target: int = Field(default=1, ge=1)
+
+class GoalProgressIn(BaseModel):
+    amount: int = Field(default=1, ge=1)
+
+def get_user(sess: Session, email: str) -> Optional[User]:
+    return sess.scalar(select(User).where(User.email == email))
+
+def require_user(sess: Session, email: str) -> User:
+    user = get_user(sess, email)
+    if not user:
+        raise HTTPException(status_code=404, detail="Usuário não encontrado.")
+    return user
+
+@app.post("/teams")
+def create_team(body: TeamIn, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+    if body.sport_key not in SPORT_KEYS:
+        raise HTTPException(status_code=400, detail="Esporte desconhecido.")
+
+    def write() -> int:
+        with Session(engine) as sess, sess.begin():
+            user = require_user(sess, email)
+            team = Team(name=body.name.strip(), sport_key=body.sport_key, created_by=user.id)
+            sess.add(team)
+            sess.flush()
+            sess.add(TeamMembership(team_id=team.id, user_id=user.id))
+            bump_stats(sess, user.id, teams_active=1)
+            return team.id
+
+    team_id = db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    push(email, "counters", delta={"teams_active": 1})
+    push(email, "team", team_id=team_id, name=body.name.strip(), sport_key=body.sport_key)
+    return {"id": team_id, "name": body.name.strip(), "sport_key": body.sport_key}
+
+@app.post("/teams/{team_id}/join")
+def join_team(team_id: int, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+
+    def write() -> bool:
+        with Session(engine) as sess, sess.begin():
+            user = require_user(sess, email)
+            if not sess.get(Team, team_id):
+                raise HTTPException(status_code=404, detail="Time não encontrado.")
+            if sess.get(TeamMembership, (team_id, user.id)):
+                return False  # já é membro: contador não muda
+            sess.add(TeamMembership(team_id=team_id, user_id=user.id))
+            bump_stats(sess, user.id, teams_active=1)
+            return True
+
+    joined = db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    if joined:
+        push(email, "counters", delta={"teams_active": 1})
+    return {"team_id": team_id, "joined": joined}
+
+@app.post("/teams/{team_id}/leave")
+def leave_team(team_id: int, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+
+    def write() -> bool:
+        with Session(engine) as sess, sess.begin():
+            user = require_user(sess, email)
+            res = sess.execute(
+                delete(TeamMembership).where(TeamMembership.team_id == team_id, TeamMembership.user_id == user.id)
+            )
+            if res.rowcount:
+                bump_stats(sess, user.id, teams_active=-1)
+            return bool(res.rowcount)
+
+    left = db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    if left:
+        push(email, "counters", delta={"teams_active": -1})
+    return {"team_id": team_id, "left": left}
+
+@app.post("/goals")
+def create_goal(body: GoalIn, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+
+    def write() -> int:
+        with Session(engine) as sess, sess.begin():
+            user = require_user(sess, email)
+            goal = Goal(user_id=user.id, title=body.title.strip(), target=body.target)
+            sess.add(goal)
+            sess.flush()
+            bump_stats(sess, user.id, goals_total=1)
+            return goal.id
+
+    goal_id = db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    push(email, "counters", delta={"goals_total": 1})
+    return {"id": goal_id, "title": body.title.strip(), "target": body.target, "progress": 0}
+
+@app.post("/goals/{goal_id}/progress")
+def goal_progress(goal_id: int, body: GoalProgressIn, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+
+    def write():
+        with Session(engine, expire_on_commit=False) as sess, sess.begin():
+            goal = sess.scalar(
+                select(Goal).join(User, Goal.user_id == User.id)
+                .where(Goal.id == goal_id, User.email == email).with_for_update(of=Goal)
             )
+            if not goal:
+                raise HTTPException(status_code=404, detail="Meta não encontrada.")
+            completed_now = False
+            if goal.completed_at is None:
+                goal.progress = min(goal.target, goal.progress + body.amount)
+                if goal.progress >= goal.target:
+                    goal.completed_at = now_utc()
+                    bump_stats(sess, goal.user_id, goals_completed=1)
+                    completed_now = True
+            return goal, completed_now
+
+    goal, completed_now = db_writer.run(write)
+    dashboard_cache.invalidate(email)
+    if completed_now:
+        push(email, "counters", delta={"goals_completed": 1})
+    return {"id": goal.id, "progress": goal.progress, "target": goal.target,
+            "completed": goal.completed_at is not None}
+
+@app.get("/me/dashboard")
+def me_dashboard(request: Request, authorization: Optional[str] = Header(default=None)):
+    email = require_session(authorization)
+
+    def build() -> dict:
+        with Session(engine) as sess:
+            user = require_user(sess, email)
+            stats = sess.get(UserStats, user.id)
+            # As 3 linhas têm o mesmo created_at: a ordem vem do catálogo, não do banco
+            favorites = sorted(
+                sess.scalars(select(UserFavorite.sport_key).where(UserFavorite.user_id == user.id)),
+                key=lambda key: SPORT_ORDER.get(key, len(SPORT_ORDER)),
+            )
+        return {
+            "email": email,
+            "name": display_name(email),
+            "teams_active": stats.teams_active if stats else 0,
+            "goals_total": stats.goals_total if stats else 0,
+            "goals_completed": stats.goals_completed if stats else 0,
+            "favorites": favorites,
+        }
+
+    return etag_json(request, dashboard_cache.get(email, build), max_age=DASHBOARD_CACHE_TTL)
+
+def sse_event(event: dict) -> str:
+    return f"id: {event.get('id', 0)}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+@app.get("/me/events")
+async def me_events(request: Request, authorization: Optional[str] = Header(default=None)):
+    """
+    Server-Sent Events com deltas do dashboard (counters, team, favorites, resync).
+    Ao conectar, o cliente recebe "hello" e deve recarregar /me/dashboard
+    (deltas de quando estava desconectado não são reenviados).
+    """
+    email = require_session(authorization)
+
+    async def stream():
+        async with push_broker.subscribe(email) as sub:
+            yield sse_event({"type": "hello"})
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=PUSH_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"  # mantém proxies/NAT abertos
+                    continue
+                yield sse_event(event)
 
-    return {"message": "Favoritos salvos com sucesso.", "email": email, "sports": sports}
\ No newline at end of file
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
\ No newline at end of file
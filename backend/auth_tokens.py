@@ -0,0 +1,69 @@
+# backend/auth_tokens.py
+"""
+Tokens de sessão (JWT HS256, só com a biblioteca padrão).
+
+- access: curto, vai no header Authorization: Bearer dos endpoints /me/*.
+- refresh: longo, só serve para POST /auth/refresh (que devolve um par novo).
+O `typ` no payload impede usar um refresh como access e vice-versa. O app lê o
+`exp` do access para renovar antes de expirar (services/session.jwt_expiry).
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Optional
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(part: str) -> bytes:
+    return base64.urlsafe_b64decode(part + "=" * (-len(part) % 4))
+
+
+class TokenSigner:
+    _HEADER = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+    def __init__(self, secret: bytes, access_ttl: int = 900, refresh_ttl: int = 30 * 86400):
+        self.secret = secret
+        self.ttls = {ACCESS: access_ttl, REFRESH: refresh_ttl}
+
+    def _sign(self, signing_input: str) -> str:
+        return _b64encode(hmac.new(self.secret, signing_input.encode("ascii"), hashlib.sha256).digest())
+
+    def issue(self, typ: str, sub: str, now: Optional[float] = None, **claims: Any) -> str:
+        iat = int(now if now is not None else time.time())
+        payload = {"sub": sub, "typ": typ, "iat": iat, "exp": iat + self.ttls[typ], **claims}
+        body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+        signing_input = f"{self._HEADER}.{body}"
+        return f"{signing_input}.{self._sign(signing_input)}"
+
+    def pair(self, sub: str, **claims: Any) -> Dict[str, Any]:
+        """Resposta de login/refresh: access + refresh do mesmo usuário."""
+        now = time.time()
+        return {
+            "access_token": self.issue(ACCESS, sub, now, **claims),
+            "refresh_token": self.issue(REFRESH, sub, now, **claims),
+            "token_type": "bearer",
+            "expires_in": self.ttls[ACCESS],
+        }
+
+    def verify(self, token: str, typ: str) -> Optional[Dict[str, Any]]:
+        """Payload se a assinatura, o tipo e o exp conferem; None caso contrário."""
+        try:
+            header, body, signature = token.split(".")
+            if header != self._HEADER or not hmac.compare_digest(signature, self._sign(f"{header}.{body}")):
+                return None
+            payload = json.loads(_b64decode(body))
+        except ValueError:
+            return None
+        if not isinstance(payload, dict) or payload.get("typ") != typ:
+            return None
+        if not isinstance(payload.get("exp"), int) or payload["exp"] <= time.time():
+            return None
+        return payload
@@ -0,0 +1,114 @@
+# backend/bench_db.py
+"""
+Benchmark do caminho de banco: SQLite (WAL + writer único) x SQLite sem writer x MySQL.
+
+Cada alvo roda num subprocesso com seu DB_URL (bench_runner). Carga: N threads fazendo
+escritas no formato do signup (User + EmailToken, sem bcrypt) e leituras por PK.
+
+Uso (na pasta backend):
+    python bench_db.py
+    BENCH_MYSQL_URL="mysql+pymysql://root@localhost:3306/jogamos_bench?charset=utf8mb4" python bench_db.py
+"""
+import json
+import os
+import threading
+import time
+
+import bench_runner
+
+N_THREADS = int(os.getenv("BENCH_THREADS", "8"))
+N_OPS = int(os.getenv("BENCH_OPS", "300"))        # por thread
+READ_RATIO = float(os.getenv("BENCH_READ_RATIO", "0.7"))
+
+
+def child() -> None:
+    """Roda dentro do subprocesso: DB_URL já está no ambiente."""
+    import random
+    from datetime import timedelta
+    from sqlalchemy.orm import Session
+    import app
+
+    # Base limpa para o alvo
+    app.Base.metadata.drop_all(app.engine)
+    app.Base.metadata.create_all(app.engine)
+
+    fixed_hash = app.hash_password("bench-password")  # bcrypt fora da medição
+    lat = {"read": [], "write": []}
+    errors = {"locked": 0, "other": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(N_THREADS + 1)
+
+    def write(email: str) -> None:
+        # Mesmo padrão do signup: lê antes de escrever (upgrade de lock no SQLite)
+        with Session(app.engine) as sess:
+            user = app.get_user(sess, email)
+            if user is None:
+                user = app.User(email=email, password_hash=fixed_hash, is_verified=False)
+                sess.add(user)
+            sess.add(app.EmailToken(user=user, token=app.generate_token(6),
+                                    expires_at=app.now_utc() + timedelta(minutes=10)))
+            sess.commit()
+
+    def read(email: str) -> None:
+        with Session(app.engine) as sess:
+            app.get_user(sess, email)
+
+    def worker(tid: int) -> None:
+        rnd = random.Random(tid)
+        mine = []
+        barrier.wait()
+        for i in range(N_OPS):
+            is_read = mine and rnd.random() < READ_RATIO
+            start = time.perf_counter()
+            try:
+                if is_read:
+                    read(rnd.choice(mine))
+                else:
+                    email = f"bench-{tid}-{i}@example.com"
+                    app.db_writer.run(lambda: write(email))
+                    mine.append(email)
+            except Exception as e:
+                with lock:
+                    errors["locked" if "locked" in str(e) else "other"] += 1
+                continue
+            with lock:
+                lat["read" if is_read else "write"].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(N_THREADS)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+    app.db_writer.shutdown()
+
+    def p(values, q):
+        if not values:
+            return None
+        values = sorted(values)
+        return round(values[min(len(values) - 1, int(len(values) * q))] * 1000, 3)
+
+    total = len(lat["read"]) + len(lat["write"])
+    print(json.dumps({
+        "ops_per_s": round(total / wall, 1),
+        "reads": len(lat["read"]),
+        "writes": len(lat["write"]),
+        "read_p50_ms": p(lat["read"], 0.5), "read_p99_ms": p(lat["read"], 0.99),
+        "write_p50_ms": p(lat["write"], 0.5), "write_p99_ms": p(lat["write"], 0.99),
+        "errors": errors,
+    }))
+
+
+def report(name: str, r: dict) -> None:
+    print(f"{name:28s} {r['ops_per_s']:9.1f} ops/s  "
+          f"read p50/p99 {r['read_p50_ms']}/{r['read_p99_ms']} ms  "
+          f"write p50/p99 {r['write_p50_ms']}/{r['write_p99_ms']} ms  erros {r['errors']}")
+
+
+if __name__ == "__main__":
+    bench_runner.main(__file__, child, report,
+                      header=f"threads={N_THREADS} ops/thread={N_OPS} read_ratio={READ_RATIO}",
+                      sqlite_targets=(("sqlite WAL + writer único", {"SQLITE_SINGLE_WRITER": "true"}),
+                                      ("sqlite WAL sem writer", {"SQLITE_SINGLE_WRITER": "false"})))
@@ -0,0 +1,112 @@
+# backend/bench_keys.py
+"""
+Benchmark das chaves de usuário: esquema antigo (PK = e-mail String(191), filhas
+com FK por e-mail) x novo (users.id BIGINT + e-mail UNIQUE, filhas por user_id).
+
+Para cada esquema insere N usuários com e-mails em ordem aleatória (como no
+signup real), cada um com 1 token e 3 favoritos, em transações de BATCH usuários.
+Mede usuários/s e o tamanho de dados e índices por tabela:
+  - SQLite: tabela virtual dbstat (páginas de cada b-tree);
+  - MySQL: information_schema.TABLES (data_length / index_length) após ANALYZE.
+
+Uso (na pasta backend):
+    python bench_keys.py
+    BENCH_MYSQL_URL="mysql+pymysql://root@localhost:3306/jogamos_bench?charset=utf8mb4" python bench_keys.py
+"""
+import json
+import os
+import time
+
+import bench_runner
+
+N_USERS = int(os.getenv("BENCH_USERS", "20000"))
+BATCH = int(os.getenv("BENCH_BATCH", "200"))
+TABLES = ("users", "email_tokens", "user_favorites")
+SPORTS = ("futebol", "volei", "skate")
+
+
+def child() -> None:
+    """Roda dentro do subprocesso: DB_URL já está no ambiente."""
+    import random
+    import uuid
+    from datetime import timedelta
+    from sqlalchemy import insert, text
+    import app
+    import migrate_user_id
+
+    new_md = app.Base.metadata
+    legacy_md = migrate_user_id.legacy_metadata()
+    now = app.now_utc()
+    exp = now + timedelta(minutes=10)
+    rnd = random.Random(42)
+    emails = [f"{uuid.UUID(int=rnd.getrandbits(128)).hex[:12]}@example.com" for _ in range(N_USERS)]
+
+    def insert_legacy(conn, email: str) -> None:
+        t = legacy_md.tables
+        conn.execute(insert(t["users"]), {"email": email, "password_hash": "x" * 60, "is_verified": False,
+                                          "created_at": now})
+        conn.execute(insert(t["email_tokens"]), {"email": email, "token": "123456", "expires_at": exp,
+                                                 "created_at": now})
+        conn.execute(insert(t["user_favorites"]), [{"email": email, "sport_key": s, "created_at": now}
+                                                   for s in SPORTS])
+
+    def insert_new(conn, email: str) -> None:
+        user_id = conn.execute(insert(app.User), {"email": email, "password_hash": "x" * 60,
+                                                  "is_verified": False, "created_at": now}).inserted_primary_key[0]
+        conn.execute(insert(app.EmailToken), {"user_id": user_id, "token": "123456", "expires_at": exp,
+                                              "created_at": now})
+        conn.execute(insert(app.UserFavorite), [{"user_id": user_id, "sport_key": s, "created_at": now}
+                                                for s in SPORTS])
+
+    def sizes(conn) -> dict:
+        out = {name: {"data_kb": 0.0, "index_kb": 0.0} for name in TABLES}
+        if app.engine.dialect.name == "sqlite":
+            kinds = {name: (kind, table) for kind, name, table in
+                     conn.execute(text("SELECT type, name, tbl_name FROM sqlite_master"))}
+            for name, size in conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")):
+                kind, table = kinds.get(name, (None, None))
+                if table in out:
+                    out[table]["index_kb" if kind == "index" else "data_kb"] += size / 1024
+        else:
+            for name in TABLES:
+                conn.execute(text(f"ANALYZE TABLE {name}"))
+            rows = conn.execute(text(
+                "SELECT table_name, data_length, index_length FROM information_schema.TABLES "
+                "WHERE table_schema = DATABASE()"
+            ))
+            for name, data, index in rows:
+                if name in out:
+                    out[name] = {"data_kb": data / 1024, "index_kb": index / 1024}
+        return {name: {k: round(v, 1) for k, v in s.items()} for name, s in out.items()}
+
+    results = {}
+    for layout, md, write in (("antigo", legacy_md, insert_legacy), ("user_id", new_md, insert_new)):
+        new_md.drop_all(app.engine)
+        legacy_md.drop_all(app.engine)
+        md.create_all(app.engine)
+        start = time.perf_counter()
+        for i in range(0, N_USERS, BATCH):
+            with app.engine.begin() as conn:
+                for email in emails[i:i + BATCH]:
+                    write(conn, email)
+        wall = time.perf_counter() - start
+        with app.engine.begin() as conn:
+            results[layout] = {"users_per_s": round(N_USERS / wall, 1), "sizes": sizes(conn)}
+    new_md.drop_all(app.engine)
+    new_md.create_all(app.engine)
+    print(json.dumps(results))
+
+
+def report(name: str, results: dict) -> None:
+    print(f"\n{name}")
+    for layout, r in results.items():
+        total_data = sum(s["data_kb"] for s in r["sizes"].values())
+        total_index = sum(s["index_kb"] for s in r["sizes"].values())
+        print(f"  {layout:8s} {r['users_per_s']:9.1f} usuários/s  dados {total_data:9.1f} KB  índices {total_index:9.1f} KB")
+        for table, s in r["sizes"].items():
+            print(f"      {table:16s} dados {s['data_kb']:9.1f} KB  índices {s['index_kb']:9.1f} KB")
+
+
+if __name__ == "__main__":
+    bench_runner.main(__file__, child, report,
+                      header=f"usuários={N_USERS} (1 token + {len(SPORTS)} favoritos cada) lote={BATCH}")
@@ -0,0 +1,101 @@
+# backend/bench_logging.py
+"""
+Benchmark do pipeline de logs.
+
+1) Custo por chamada: log_event (enqueue) x handler síncrono (JSON + write) com N threads.
+2) Overhead por request: GET /search com log de todo request x logger desligado.
+
+Uso (na pasta backend):
+    DB_URL=sqlite:///bench.db python bench_logging.py
+"""
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from structured_log import JsonFormatter, setup_logging, shutdown_logging, log_event, logger
+
+N_CALLS = int(os.getenv("BENCH_CALLS", "20000"))
+N_THREADS = int(os.getenv("BENCH_THREADS", "8"))
+N_REQUESTS = int(os.getenv("BENCH_REQUESTS", "2000"))
+
+
+def run_threads(fn, calls_per_thread: int, threads: int) -> float:
+    """Retorna µs por chamada (tempo de parede / total de chamadas)."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for i in range(calls_per_thread):
+            fn(i)
+
+    ts = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in ts:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in ts:
+        t.join()
+    return (time.perf_counter() - start) / (calls_per_thread * threads) * 1e6
+
+
+def bench_calls(sink_path: str):
+    per_thread = N_CALLS // N_THREADS
+
+    # Síncrono: formata e escreve na thread chamadora (equivalente ao print)
+    sync_logger = logging.getLogger("bench.sync")
+    sync_logger.propagate = False
+    h = logging.FileHandler(sink_path, encoding="utf-8")
+    h.setFormatter(JsonFormatter())
+    sync_logger.handlers[:] = [h]
+    sync_logger.setLevel(logging.INFO)
+    sync_us = run_threads(
+        lambda i: sync_logger.info("bench.event", extra={"fields": {"i": i, "path": "/search"}}),
+        per_thread, N_THREADS,
+    )
+    h.close()
+
+    queued_us = run_threads(lambda i: log_event("bench.event", i=i, path="/search"), per_thread, N_THREADS)
+    sampled_us = run_threads(lambda i: log_event("bench.event", sample_rate=0.01, i=i), per_thread, N_THREADS)
+
+    print(f"[calls] threads={N_THREADS} calls={per_thread * N_THREADS}")
+    print(f"  handler síncrono : {sync_us:8.2f} µs/chamada")
+    print(f"  enqueue (fila)   : {queued_us:8.2f} µs/chamada")
+    print(f"  enqueue 1% amost.: {sampled_us:8.2f} µs/chamada")
+
+
+def bench_requests():
+    os.environ.setdefault("LOG_HTTP_SAMPLE_RATE", "1")
+    from fastapi.testclient import TestClient
+    import app
+
+    app.LOG_HTTP_SAMPLE_RATE = 1.0
+    with TestClient(app.app) as c:
+        def timed(n):
+            start = time.perf_counter()
+            for _ in range(n):
+                c.get("/search", params={"q": "vo"})
+            return (time.perf_counter() - start) / n * 1e6
+
+        timed(100)  # aquecimento
+        logger.setLevel(logging.CRITICAL)
+        off_us = timed(N_REQUESTS)
+        logger.setLevel(logging.INFO)
+        on_us = timed(N_REQUESTS)
+
+    print(f"[requests] n={N_REQUESTS} GET /search")
+    print(f"  logs desligados  : {off_us:8.1f} µs/request")
+    print(f"  log por request  : {on_us:8.1f} µs/request")
+    print(f"  overhead         : {on_us - off_us:8.1f} µs/request")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        # Listener escreve em arquivo para não poluir o terminal
+        sink = open(os.path.join(tmp, "queued.log"), "w", encoding="utf-8")
+        setup_logging("INFO", stream=sink)
+        bench_calls(os.path.join(tmp, "sync.log"))
+        bench_requests()
+        shutdown_logging()
+        sink.close()
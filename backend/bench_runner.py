@@ -0,0 +1,72 @@
+# backend/bench_runner.py
+"""
+Esqueleto comum dos benchmarks de banco (bench_db, bench_signup, bench_keys, bench_signup_batch).
+
+O app lê a config (DB_URL etc.) no import, então cada alvo roda num subprocesso
+`python <script> --child` com o seu ambiente. O filho imprime um JSON na última
+linha do stdout; o pai só formata. Alvos SQLite usam um arquivo temporário; o
+MySQL entra quando BENCH_MYSQL_URL está definida.
+
+Uso num script de benchmark:
+    if __name__ == "__main__":
+        bench_runner.main(__file__, child, report, header="...")
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+Target = Tuple[str, Dict[str, str]]  # (nome, env extra)
+
+
+def run_child(script: str, name: str, env: Dict[str, str]) -> Optional[dict]:
+    """Roda `script --child` com env por cima do ambiente atual; None (e imprime o erro) se falhou."""
+    full_env = {**os.environ, "LOG_LEVEL": "WARNING", "SMTP_HOST": "", **env}
+    proc = subprocess.run([sys.executable, script, "--child"], env=full_env, capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(script)))
+    if proc.returncode != 0:
+        print(f"{name}: FALHOU: {proc.stderr.strip().splitlines()[-1] if proc.stderr else proc.returncode}")
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(
+    script: str,
+    child: Callable[[], None],
+    report: Callable[[str, dict], None],
+    header: str = "",
+    sqlite_targets: Sequence[Target] = (("sqlite", {}),),
+    mysql: bool = True,
+    env: Optional[Dict[str, str]] = None,
+) -> None:
+    """Ponto de entrada: `--child` roda a carga; senão roda os alvos e chama report(nome, resultado)."""
+    if "--child" in sys.argv:
+        child()
+        sys.exit(0)
+
+    if header:
+        print(header)
+    env = env or {}
+    failed = False
+
+    def run(name: str, target_env: Dict[str, str]) -> None:
+        nonlocal failed
+        results = run_child(script, name, {**env, **target_env})
+        if results is None:
+            failed = True
+        else:
+            report(name, results)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (name, extra) in enumerate(sqlite_targets):
+            run(name, {"DB_URL": f"sqlite:///{os.path.join(tmp, f'{i}.db')}", **extra})
+    if mysql:
+        mysql_url = os.getenv("BENCH_MYSQL_URL")
+        if mysql_url:
+            run("mysql", {"DB_URL": mysql_url})
+        else:
+            print("mysql: defina BENCH_MYSQL_URL para comparar")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,131 @@
+# backend/bench_signup.py
+"""
+Benchmark do caminho de escrita de signup / resend-token: versão antiga
+(SELECT do usuário, depois UPDATE/INSERT, depois INSERT do token) x upsert
+com escrita condicional (app.signup_write / app.resend_write).
+
+Mede só o banco (bcrypt e e-mail fora): statements e mediana de tempo por operação.
+No SQLite local não há ida e volta de rede, então o ganho aparece mais no MySQL.
+Cenários: signup novo, signup repetido (não verificado), resend-token e
+signup de e-mail já verificado (rejeitado). No "upsert" o signup é o do endpoint:
+reject_if_verified (leitura, fora do writer) + signup_write (2 statements no writer).
+No endpoint o verificado também deixa de pagar o bcrypt (~250 ms), que fica fora daqui.
+
+Uso (na pasta backend):
+    python bench_signup.py
+    BENCH_MYSQL_URL="mysql+pymysql://root@localhost:3306/jogamos_bench?charset=utf8mb4" python bench_signup.py
+"""
+import json
+import os
+import statistics
+import time
+
+import bench_runner
+
+N_OPS = int(os.getenv("BENCH_OPS", "500"))   # por cenário
+
+
+def child() -> None:
+    """Roda dentro do subprocesso: DB_URL já está no ambiente."""
+    from datetime import timedelta
+    from fastapi import HTTPException
+    from sqlalchemy import event, update
+    from sqlalchemy.orm import Session
+    import app
+
+    app.Base.metadata.drop_all(app.engine)
+    app.Base.metadata.create_all(app.engine)
+
+    fixed_hash = app.hash_password("bench-password")  # bcrypt fora da medição
+    statements = [0]
+
+    @event.listens_for(app.engine, "before_cursor_execute")
+    def _count(*_args):
+        statements[0] += 1
+
+    # Caminho antigo, como era nos endpoints
+    def legacy_signup(email: str) -> str:
+        with Session(app.engine) as sess:
+            user = app.get_user(sess, email)
+            if user:
+                if user.is_verified:
+                    raise HTTPException(status_code=400, detail="E-mail já cadastrado e verificado.")
+                user.password_hash = fixed_hash
+                user.created_at = app.now_utc()
+            else:
+                user = app.User(email=email, password_hash=fixed_hash, is_verified=False)
+                sess.add(user)
+            token = app.generate_token(6)
+            sess.add(app.EmailToken(user=user, token=token,
+                                    expires_at=app.now_utc() + timedelta(minutes=app.TOKEN_TTL_MINUTES)))
+            sess.commit()
+            return token
+
+    def legacy_resend(email: str) -> str:
+        with Session(app.engine) as sess:
+            user = app.get_user(sess, email)
+            if not user:
+                raise HTTPException(status_code=404, detail="Usuário não encontrado.")
+            if user.is_verified:
+                raise HTTPException(status_code=400, detail="Usuário já verificado.")
+            token = app.generate_token(6)
+            sess.add(app.EmailToken(user=user, token=token,
+                                    expires_at=app.now_utc() + timedelta(minutes=app.TOKEN_TTL_MINUTES)))
+            sess.commit()
+            return token
+
+    # Como no endpoint: leitura que recusa verificado (fora do writer) + upsert
+    def upsert_signup(email: str) -> str:
+        app.reject_if_verified(email)
+        return app.db_writer.run(lambda: app.signup_write(email, fixed_hash))
+
+    variants = {
+        "antigo": (lambda email: app.db_writer.run(lambda: legacy_signup(email)),
+                   lambda email: app.db_writer.run(lambda: legacy_resend(email))),
+        "upsert": (upsert_signup, lambda email: app.db_writer.run(lambda: app.resend_write(email))),
+    }
+
+    def measure(fn, emails) -> dict:
+        statements[0] = 0
+        errors = 0
+        samples = []
+        for email in emails:
+            start = time.perf_counter()
+            try:
+                fn(email)
+            except HTTPException:
+                errors += 1
+            samples.append(time.perf_counter() - start)
+        return {
+            "ms_per_op": round(statistics.median(samples) * 1000, 3),  # mediana: menos ruído de fsync
+            "stmts_per_op": round(statements[0] / len(emails), 2),
+            "rejected": errors,
+        }
+
+    results = {}
+    for name, (signup, resend) in variants.items():
+        emails = [f"bench-{name}-{i}@example.com" for i in range(N_OPS)]
+        r = results[name] = {}
+        r["signup novo"] = measure(signup, emails)
+        r["signup repetido"] = measure(signup, emails)
+        r["resend-token"] = measure(resend, emails)
+        with Session(app.engine) as sess, sess.begin():
+            sess.execute(update(app.User).where(app.User.email.in_(emails)).values(is_verified=True))
+        r["signup verificado"] = measure(signup, emails)
+    app.db_writer.shutdown()
+    print(json.dumps(results))
+
+
+def report(name: str, results: dict) -> None:
+    print(f"\n{name}")
+    old, new = results["antigo"], results["upsert"]
+    for scenario in old:
+        o, n = old[scenario], new[scenario]
+        change = (n["ms_per_op"] / o["ms_per_op"] - 1) * 100 if o["ms_per_op"] else 0.0
+        print(f"  {scenario:18s} antigo {o['ms_per_op']:7.3f} ms ({o['stmts_per_op']} stmts)  "
+              f"upsert {n['ms_per_op']:7.3f} ms ({n['stmts_per_op']} stmts)  tempo {change:+.0f}%")
+
+
+if __name__ == "__main__":
+    bench_runner.main(__file__, child, report, header=f"ops/cenário={N_OPS}",
+                      sqlite_targets=(("sqlite WAL + writer único", {}),))
@@ -0,0 +1,72 @@
+# backend/bench_signup_batch.py
+"""
+Benchmark do cadastro em lote: N chamadas a /auth/signup (uma por pessoa) x uma
+chamada a /admin/signup-batch com as mesmas N contas.
+
+Roda o app in-process (TestClient) num SQLite temporário, com SMTP em modo DEV
+(o custo de SMTP real só aumenta a diferença: 1 sessão por lote x 1 por signup).
+O ganho do hash paralelo depende dos núcleos disponíveis (HASH_WORKERS, padrão
+= nº de CPUs); com 1 CPU sobra só o ganho de banco e de e-mail, medido à
+parte com hash fixo.
+
+Uso (na pasta backend):
+    python bench_signup_batch.py
+    BENCH_ACCOUNTS=200 HASH_WORKERS=8 python bench_signup_batch.py
+"""
+import json
+import os
+import time
+
+import bench_runner
+
+N_ACCOUNTS = int(os.getenv("BENCH_ACCOUNTS", "40"))
+ADMIN_TOKEN = "bench-admin-token"
+
+
+def child() -> None:
+    """Roda dentro do subprocesso: DB_URL/ADMIN_TOKEN já estão no ambiente."""
+    from fastapi.testclient import TestClient
+    import app
+
+    accounts = lambda prefix: [{"email": f"{prefix}-{i}@example.com", "password": f"senha-{i}"}  # noqa: E731
+                               for i in range(N_ACCOUNTS)]
+    results = {}
+    with TestClient(app.app) as client:
+        start = time.perf_counter()
+        for acc in accounts("serial"):
+            assert client.post("/auth/signup", json=acc).status_code == 200
+        results["serial"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        r = client.post("/admin/signup-batch", json={"accounts": accounts("batch")},
+                        headers={"X-Admin-Token": ADMIN_TOKEN})
+        results["batch"] = time.perf_counter() - start
+        assert r.status_code == 200 and r.json()["counts"].get("created") == N_ACCOUNTS, r.text
+        results["hash_workers"] = app.HASH_WORKERS
+
+        # Só banco + e-mail (hash fixo): o que sobra quando o bcrypt não paraleliza
+        fixed_hash = app.hash_password("bench-password")
+        start = time.perf_counter()
+        for acc in accounts("serial-db"):
+            token = app.db_writer.run(lambda: app.signup_write(acc["email"], fixed_hash))
+            app.send_emails([app.verification_email(acc["email"], token)])
+        results["serial_db"] = time.perf_counter() - start
+        start = time.perf_counter()
+        written = app.db_writer.run(lambda: app.signup_batch_write([(acc["email"], fixed_hash)
+                                                                    for acc in accounts("batch-db")]))
+        app.mailer.submit([app.verification_email(email, token) for email, (_, token) in written.items()])
+        results["batch_db"] = time.perf_counter() - start
+    print(json.dumps(results))
+
+
+def report(name: str, r: dict) -> None:
+    print(f"{name}: contas={N_ACCOUNTS} hash_workers={r['hash_workers']} cpus={os.cpu_count()}")
+    for label, serial, batch in (("com bcrypt (HTTP)", "serial", "batch"), ("só banco + e-mail", "serial_db", "batch_db")):
+        print(f"{label}")
+        for name in (serial, batch):
+            print(f"  {name:9s} {r[name] * 1000:9.1f} ms  {N_ACCOUNTS / r[name]:9.1f} contas/s")
+        print(f"  lote {r[serial] / r[batch]:.1f}x mais rápido")
+
+
+if __name__ == "__main__":
+    bench_runner.main(__file__, child, report, mysql=False, env={"ADMIN_TOKEN": ADMIN_TOKEN})
@@ -0,0 +1,41 @@
+# backend/dashboard.py
+"""
+Cache em memória do payload de GET /me/dashboard, por usuário.
+
+Os números já vêm prontos da tabela user_stats (contadores mantidos a cada
+escrita); o cache só evita repetir a leitura quando a tela é reaberta.
+Toda escrita que muda o dashboard de alguém chama invalidate(email).
+Cache por processo: com vários workers, o TTL limita a defasagem.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+
+class DashboardCache:
+    def __init__(self, ttl_seconds: int = 30, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, email: str, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(email)
+            if hit is not None and hit[0] > now:
+                self._entries.move_to_end(email)
+                return hit[1]
+        payload = build()
+        with self._lock:
+            self._entries[email] = (now + self.ttl_seconds, payload)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def invalidate(self, *emails: str) -> None:
+        with self._lock:
+            for email in emails:
+                self._entries.pop(email, None)
@@ -0,0 +1,72 @@
+# backend/db_sqlite.py
+"""
+Modo SQLite (single-node / CI).
+
+- PRAGMAs aplicados em toda conexão nova: WAL, synchronous=NORMAL, mmap, busy_timeout.
+- SingleWriter: fila com uma única thread escritora. Leituras seguem em paralelo
+  (WAL não bloqueia leitores); escritas nunca disputam o lock do arquivo entre si,
+  o que elimina os "database is locked" sob concorrência.
+"""
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def resolve_sqlite_url(url: str, base_dir: str) -> str:
+    """Caminho relativo (sqlite:///auth.db) passa a ser relativo à pasta do backend."""
+    u = make_url(url)
+    db = u.database
+    if db and db != ":memory:" and not db.startswith("file:") and not os.path.isabs(db):
+        u = u.set(database=os.path.join(base_dir, db))
+    return u.render_as_string(hide_password=False)
+
+
+def engine_kwargs(busy_timeout_ms: int) -> Dict[str, Any]:
+    # check_same_thread=False: a conexão do pool pode trocar de thread (threadpool do FastAPI)
+    return {"connect_args": {"check_same_thread": False, "timeout": busy_timeout_ms / 1000}}
+
+
+def install_pragmas(engine, *, busy_timeout_ms: int, mmap_size: int, cache_size_kb: int) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        try:
+            cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            cur.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+            cur.execute(f"PRAGMA cache_size={-int(cache_size_kb)}")  # negativo = KiB
+            cur.execute("PRAGMA temp_store=MEMORY")
+            cur.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cur.close()
+
+
+class SingleWriter:
+    """Executa funções de escrita em série numa thread dedicada."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer") if enabled else None
+        )
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """Bloqueia o chamador até a escrita terminar; exceções são repassadas."""
+        if self._executor is None:
+            return fn()
+        # Mantém ContextVars (request id dos logs) dentro da thread escritora
+        ctx = contextvars.copy_context()
+        return self._executor.submit(ctx.run, fn).result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
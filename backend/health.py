@@ -0,0 +1,102 @@
+# backend/health.py
+"""
+Readiness com cache.
+
+As checagens (DB, SMTP) rodam numa thread de fundo a cada `interval` segundos;
+GET /readyz só lê o último snapshot, então muitos probes não geram carga no DB.
+A saturação do pool é lida na hora (é só contador em memória).
+"""
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from structured_log import log_event
+
+Check = Callable[[], None]  # levanta exceção se não estiver ok
+
+
+def pool_status(engine) -> Dict[str, Any]:
+    """Uso do pool do SQLAlchemy (QueuePool); outros pools retornam o que houver."""
+    pool = engine.pool
+    try:
+        size = pool.size()
+        checked_out = pool.checkedout()
+        max_overflow = max(getattr(pool, "_max_overflow", 0), 0)
+    except AttributeError:
+        return {"type": type(pool).__name__}
+    capacity = size + max_overflow
+    return {
+        "type": type(pool).__name__,
+        "size": size,
+        "max_overflow": max_overflow,
+        "checked_out": checked_out,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def db_check(engine) -> Check:
+    from sqlalchemy import text
+
+    def check():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    return check
+
+
+def smtp_check(host: str, port: int, timeout: float = 2.0) -> Check:
+    # Só abre o TCP: não faz handshake/login a cada rodada
+    def check():
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    return check
+
+
+class ReadinessMonitor:
+    def __init__(self, checks: Dict[str, Check], interval: float = 5.0):
+        self.checks = checks
+        self.interval = interval
+        self._snapshot: Dict[str, Any] = {"checks": {}, "checked_at": None}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.refresh()  # primeiro snapshot antes de aceitar tráfego
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="readiness", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    def refresh(self) -> None:
+        results: Dict[str, Any] = {}
+        for name, check in self.checks.items():
+            start = time.perf_counter()
+            try:
+                check()
+                results[name] = {"ok": True}
+            except Exception as e:
+                results[name] = {"ok": False, "error": repr(e)}
+                log_event("readiness.check_failed", check=name, error=repr(e))
+            results[name]["ms"] = round((time.perf_counter() - start) * 1000, 1)
+        # Troca atômica da referência: leitores nunca veem snapshot parcial
+        self._snapshot = {"checks": results, "checked_at": time.time()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        checked_at = snap["checked_at"]
+        age = None if checked_at is None else round(time.time() - checked_at, 1)
+        # Snapshot velho (thread travada/morta) também conta como não pronto
+        fresh = age is not None and age <= self.interval * 3
+        ok = fresh and all(r["ok"] for r in snap["checks"].values())
+        return {"ok": ok, "age_s": age, "checks": snap["checks"]}
@@ -0,0 +1,116 @@
+# backend/idempotency.py
+"""
+Store em memória para o header Idempotency-Key.
+
+- A primeira requisição com uma chave executa o handler; as repetidas recebem a
+  mesma resposta (sucesso ou erro 4xx) sem refazer bcrypt/DB/SMTP.
+- Duplicatas concorrentes esperam a primeira terminar em vez de executar em paralelo.
+- Erros 5xx/inesperados liberam a chave, para que um retry possa tentar de novo.
+- A chave é amarrada ao corpo da requisição (fingerprint): reutilizá-la com
+  outro corpo retorna 422.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def fingerprint(payload: Any) -> str:
+    raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("fingerprint", "done", "result", "error", "abandoned", "expires_at")
+
+    def __init__(self, fp: str):
+        self.fingerprint = fp
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[HTTPException] = None
+        self.abandoned = False
+        self.expires_at = float("inf")  # só expira depois de concluída
+
+
+class IdempotencyStore:
+    def __init__(self, ttl_seconds: int = 600, max_entries: int = 10000, wait_timeout: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+
+    def _purge_locked(self, now: float) -> None:
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+        # Limite de memória: descarta as concluídas mais antigas
+        if len(self._entries) > self.max_entries:
+            finished = sorted(
+                (e.expires_at, k) for k, e in self._entries.items() if e.done.is_set()
+            )
+            for _, k in finished[: len(self._entries) - self.max_entries]:
+                del self._entries[k]
+
+    def run(self, scope: str, key: Optional[str], fp: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Executa `fn` uma única vez por (scope, key).
+        Retorna (resultado, replayed). Sem chave, apenas executa `fn`.
+        """
+        if not key:
+            return fn(), False
+
+        full_key = (scope, key.strip())
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                self._purge_locked(now)
+                entry = self._entries.get(full_key)
+                owner = entry is None
+                if owner:
+                    entry = _Entry(fp)
+                    self._entries[full_key] = entry
+
+            if owner:
+                return self._execute(full_key, entry, fn), False
+
+            if entry.fingerprint != fp:
+                raise HTTPException(status_code=422, detail="Idempotency-Key reutilizada com outro conteúdo.")
+            if not entry.done.wait(self.wait_timeout):
+                raise HTTPException(status_code=409, detail="Requisição original ainda em processamento.")
+            if entry.abandoned:
+                continue  # a original falhou; tenta assumir a chave
+            if entry.error is not None:
+                raise HTTPException(status_code=entry.error.status_code, detail=entry.error.detail)
+            return entry.result, True
+
+    def _execute(self, full_key, entry: _Entry, fn: Callable[[], Any]) -> Any:
+        try:
+            result = fn()
+        except HTTPException as e:
+            if e.status_code >= 500:
+                self._abandon(full_key, entry)
+            else:
+                entry.error = e
+                self._finish(entry)
+            raise
+        except BaseException:
+            self._abandon(full_key, entry)
+            raise
+        entry.result = result
+        self._finish(entry)
+        return result
+
+    def _finish(self, entry: _Entry) -> None:
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        entry.done.set()
+
+    def _abandon(self, full_key, entry: _Entry) -> None:
+        with self._lock:
+            if self._entries.get(full_key) is entry:
+                del self._entries[full_key]
+        entry.abandoned = True
+        entry.done.set()
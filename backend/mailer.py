@@ -0,0 +1,90 @@
+# backend/mailer.py
+"""
+Envio de e-mails em lote, fora do request.
+
+submit() só enfileira; uma thread junta o que chegou (até max_batch, esperando
+no máximo `linger` segundos por mais mensagens) e entrega tudo numa única
+chamada de send_many (no app: uma sessão SMTP por lote, em vez de uma por e-mail).
+Lote que falha é logado e contado; o usuário pode pedir /auth/resend-token.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from structured_log import log_event, elapsed_ms
+
+
+class BatchMailer:
+    def __init__(self, send_many: Callable[[List[Any]], None], max_batch: int = 50, linger: float = 0.2):
+        self.send_many = send_many
+        self.max_batch = max_batch
+        self.linger = linger
+        self._queue: "queue.Queue" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._batches = 0
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="mailer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Para depois de tentar entregar o que já está na fila."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def submit(self, messages: List[Any]) -> int:
+        self.start()  # no-op se já está rodando
+        for msg in messages:
+            self._queue.put(msg)
+        return len(messages)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"queued": self._queue.qsize(), "sent": self._sent, "failed": self._failed,
+                    "batches": self._batches}
+
+    # -----------------------
+    # Thread de envio
+    # -----------------------
+    def _next_batch(self) -> List[Any]:
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=max(0.0, remaining)) if remaining > 0
+                             else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            start = time.perf_counter()
+            try:
+                self.send_many(batch)
+            except Exception as e:
+                with self._lock:
+                    self._failed += len(batch)
+                log_event("email.batch_failed", level=logging.ERROR, count=len(batch), error=repr(e))
+                continue
+            with self._lock:
+                self._sent += len(batch)
+                self._batches += 1
+            log_event("email.batch_sent", count=len(batch), ms=elapsed_ms(start))
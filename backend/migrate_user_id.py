@@ -0,0 +1,140 @@
+# backend/migrate_user_id.py
+"""
+Migração do esquema antigo (users.email como PK, tabelas filhas com a coluna
+email) para users.id BIGINT auto-increment + e-mail UNIQUE, com as filhas
+referenciando user_id.
+
+Passo único e explícito, com o app parado (o app se recusa a subir enquanto
+detecta o esquema antigo):
+    cd backend && python migrate_user_id.py
+Passos: renomeia as tabelas antigas para *_old, cria as novas, copia os dados
+(INSERT ... SELECT com JOIN por e-mail) e apaga as *_old.
+No MySQL DDL não é transacional: faça backup antes de rodar.
+"""
+import logging
+import sys
+import time
+from typing import List
+
+from sqlalchemy import (
+    Boolean, Column, DateTime, ForeignKey, Integer, MetaData, String, Table, inspect, text,
+)
+
+from structured_log import log_event, elapsed_ms
+
+# True só dentro de main(): o import do app não recusa o esquema antigo nem roda create_all
+RUNNING = False
+
+# Ordem de dependência (pais antes dos filhos)
+TABLES = ["users", "email_tokens", "user_favorites", "teams", "team_memberships", "goals", "user_stats"]
+
+# Cópia de cada tabela: colunas novas <- SELECT sobre a *_old (alias o) com JOIN em users (alias u)
+COPY_SQL = {
+    "users": (
+        "INSERT INTO users (email, password_hash, is_verified, created_at) "
+        "SELECT o.email, o.password_hash, o.is_verified, o.created_at FROM users_old o ORDER BY o.created_at"
+    ),
+    "email_tokens": (
+        "INSERT INTO email_tokens (id, user_id, token, expires_at, created_at) "
+        "SELECT o.id, u.id, o.token, o.expires_at, o.created_at FROM email_tokens_old o JOIN users u ON u.email = o.email"
+    ),
+    "user_favorites": (
+        "INSERT INTO user_favorites (user_id, sport_key, created_at) "
+        "SELECT u.id, o.sport_key, o.created_at FROM user_favorites_old o JOIN users u ON u.email = o.email"
+    ),
+    "teams": (
+        "INSERT INTO teams (id, name, sport_key, created_by, created_at) "
+        "SELECT o.id, o.name, o.sport_key, u.id, o.created_at FROM teams_old o JOIN users u ON u.email = o.created_by"
+    ),
+    "team_memberships": (
+        "INSERT INTO team_memberships (team_id, user_id, joined_at) "
+        "SELECT o.team_id, u.id, o.joined_at FROM team_memberships_old o JOIN users u ON u.email = o.email"
+    ),
+    "goals": (
+        "INSERT INTO goals (id, user_id, title, target, progress, completed_at, created_at) "
+        "SELECT o.id, u.id, o.title, o.target, o.progress, o.completed_at, o.created_at "
+        "FROM goals_old o JOIN users u ON u.email = o.email"
+    ),
+    "user_stats": (
+        "INSERT INTO user_stats (user_id, teams_active, goals_total, goals_completed, updated_at) "
+        "SELECT u.id, o.teams_active, o.goals_total, o.goals_completed, o.updated_at "
+        "FROM user_stats_old o JOIN users u ON u.email = o.email"
+    ),
+}
+
+
+def needs_migration(engine) -> bool:
+    insp = inspect(engine)
+    if not insp.has_table("users"):
+        return False
+    return "id" not in {c["name"] for c in insp.get_columns("users")}
+
+
+def migrate(engine, metadata: MetaData) -> List[str]:
+    """Migra as tabelas antigas existentes; retorna os nomes migrados."""
+    insp = inspect(engine)
+    present = [name for name in TABLES if insp.has_table(name)]
+    if any(insp.has_table(f"{name}_old") for name in TABLES):
+        raise RuntimeError("Migração user_id: existem tabelas *_old de uma execução interrompida; revise o banco.")
+    log_event("db.migrate_user_id.start", level=logging.WARNING, tables=present)
+    start = time.perf_counter()
+
+    with engine.begin() as conn:
+        for name in present:
+            conn.execute(text(f"ALTER TABLE {name} RENAME TO {name}_old"))
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        for name in present:
+            conn.execute(text(COPY_SQL[name]))
+        for name in reversed(present):
+            conn.execute(text(f"DROP TABLE {name}_old"))
+    log_event("db.migrate_user_id.done", level=logging.WARNING, tables=present, ms=elapsed_ms(start))
+    return present
+
+
+# -----------------------
+# Esquema antigo (referência e benchmark)
+# -----------------------
+def legacy_metadata() -> MetaData:
+    """Tabelas como eram antes da migração (PK/FK por e-mail)."""
+    md = MetaData()
+    email_fk = lambda **kw: Column("email", String(191), ForeignKey("users.email", ondelete="CASCADE"), **kw)  # noqa: E731
+    opts = {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"}
+    Table("users", md,
+          Column("email", String(191), primary_key=True),
+          Column("password_hash", String(255), nullable=False),
+          Column("is_verified", Boolean, nullable=False, default=False),
+          Column("created_at", DateTime(), nullable=False), **opts)
+    Table("email_tokens", md,
+          Column("id", Integer, primary_key=True, autoincrement=True),
+          email_fk(nullable=False, index=True),
+          Column("token", String(16), nullable=False),
+          Column("expires_at", DateTime(), nullable=False),
+          Column("created_at", DateTime(), nullable=False), **opts)
+    Table("user_favorites", md,
+          email_fk(primary_key=True),
+          Column("sport_key", String(64), primary_key=True),
+          Column("created_at", DateTime(), nullable=False), **opts)
+    return md
+
+
+# -----------------------
+# Linha de comando
+# -----------------------
+def main() -> int:
+    global RUNNING
+    RUNNING = True
+    import app  # config (DB_URL) e esquema novo; o import não mexe no banco com RUNNING
+
+    if not needs_migration(app.engine):
+        print("Nada a migrar: users já tem a coluna id.")
+        return 0
+    tables = migrate(app.engine, app.Base.metadata)
+    print(f"Migradas: {', '.join(tables)}")
+    return 0
+
+
+if __name__ == "__main__":
+    # O app importa `migrate_user_id`, não `__main__`: a flag vale no módulo que ele enxerga
+    import migrate_user_id
+    sys.exit(migrate_user_id.main())
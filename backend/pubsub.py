@@ -0,0 +1,76 @@
+# backend/pubsub.py
+"""
+Pub/sub em memória (por processo) para o canal de push (SSE).
+
+- Cada conexão é uma corrotina + uma fila asyncio pequena: milhares de
+  conexões ociosas custam só memória, sem thread por cliente.
+- publish() pode ser chamado de endpoints síncronos (threadpool): a entrega
+  passa para o event loop com call_soon_threadsafe.
+- Cliente lento: se a fila enche, ela é esvaziada e recebe um único
+  {"type": "resync"} (o app recarrega o dashboard em vez de perder deltas).
+Com vários workers, cada um só vê os próprios publishes; trocar por Redis
+pub/sub mantendo esta interface.
+"""
+import asyncio
+import itertools
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Set
+
+
+class Subscriber:
+    __slots__ = ("queue", "loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = loop
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        # Roda no event loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class Broker:
+    def __init__(self, queue_size: int = 64):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._topics: Dict[str, Set[Subscriber]] = {}
+        self._ids = itertools.count(1)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[Subscriber]:
+        sub = Subscriber(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._topics.setdefault(topic, set()).add(sub)
+        try:
+            yield sub
+        finally:
+            with self._lock:
+                subs = self._topics.get(topic)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._topics[topic]
+
+    def publish(self, topic: str, event: Dict[str, Any]) -> int:
+        """Entrega para todos os inscritos no tópico; retorna quantos eram."""
+        with self._lock:
+            subs = list(self._topics.get(topic, ()))
+        if not subs:
+            return 0
+        event = {"id": next(self._ids), **event}
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+            except RuntimeError:
+                pass  # loop já fechado (shutdown)
+        return len(subs)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"topics": len(self._topics), "subscribers": sum(len(s) for s in self._topics.values())}
@@ -0,0 +1,115 @@
+# backend/search_index.py
+"""
+Índice de busca em memória (prefixos) para o endpoint GET /search.
+
+- Normaliza sem acentos e sem caixa ("Vôlei" -> "volei").
+- Cada documento é quebrado em tokens; cada prefixo de token aponta para o documento.
+- add/remove são incrementais e thread-safe (uvicorn roda endpoints sync em threads).
+"""
+import re
+import threading
+import unicodedata
+from typing import Dict, List, Set, Tuple
+
+DocId = Tuple[str, str]  # (kind, key)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Remove acentos e aplica casefold."""
+    nfkd = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in nfkd if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(normalize(text))
+
+
+class PrefixIndex:
+    # Ordem de exibição por tipo (esportes primeiro)
+    KIND_ORDER = {"sport": 0, "user": 1}
+
+    def __init__(self, max_prefix: int = 16):
+        self.max_prefix = max_prefix
+        self._lock = threading.Lock()
+        self._docs: Dict[DocId, Dict[str, str]] = {}
+        self._doc_tokens: Dict[DocId, Set[str]] = {}
+        self._prefixes: Dict[str, Set[DocId]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _prefixes_of(self, tokens: Set[str]) -> Set[str]:
+        out: Set[str] = set()
+        for tok in tokens:
+            for i in range(1, min(len(tok), self.max_prefix) + 1):
+                out.add(tok[:i])
+        return out
+
+    def add(self, kind: str, key: str, label: str, text: str = "") -> None:
+        """Indexa (ou reindexa) um documento. `text` é conteúdo extra pesquisável."""
+        doc_id = (kind, key)
+        tokens = set(tokenize(f"{label} {text}"))
+        with self._lock:
+            self._remove_locked(doc_id)
+            self._docs[doc_id] = {"type": kind, "key": key, "label": label, "norm": normalize(label)}
+            self._doc_tokens[doc_id] = tokens
+            for p in self._prefixes_of(tokens):
+                self._prefixes.setdefault(p, set()).add(doc_id)
+
+    def remove(self, kind: str, key: str) -> None:
+        with self._lock:
+            self._remove_locked((kind, key))
+
+    def _remove_locked(self, doc_id: DocId) -> None:
+        tokens = self._doc_tokens.pop(doc_id, None)
+        if tokens is None:
+            return
+        self._docs.pop(doc_id, None)
+        for p in self._prefixes_of(tokens):
+            bucket = self._prefixes.get(p)
+            if bucket is not None:
+                bucket.discard(doc_id)
+                if not bucket:
+                    del self._prefixes[p]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+        """Todos os tokens da consulta precisam casar como prefixo de algum token do documento."""
+        q_tokens = tokenize(query)
+        if not q_tokens:
+            return []
+        q_norm = " ".join(q_tokens)
+
+        with self._lock:
+            # Começa pelo bucket mais seletivo
+            buckets = sorted(
+                (self._prefixes.get(t[: self.max_prefix], set()) for t in q_tokens),
+                key=len,
+            )
+            candidates = set(buckets[0])
+            for b in buckets[1:]:
+                candidates &= b
+                if not candidates:
+                    return []
+
+            # Tokens maiores que max_prefix precisam de checagem completa
+            long_tokens = [t for t in q_tokens if len(t) > self.max_prefix]
+            hits = []
+            for doc_id in candidates:
+                if long_tokens:
+                    doc_tokens = self._doc_tokens[doc_id]
+                    if not all(any(dt.startswith(t) for dt in doc_tokens) for t in long_tokens):
+                        continue
+                hits.append(self._docs[doc_id])
+
+        def rank(doc):
+            norm = doc["norm"]
+            return (
+                0 if norm == q_norm else 1 if norm.startswith(q_norm) else 2,
+                self.KIND_ORDER.get(doc["type"], 9),
+                norm,
+            )
+
+        hits.sort(key=rank)
+        return [{"type": d["type"], "key": d["key"], "label": d["label"]} for d in hits[:limit]]
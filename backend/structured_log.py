@@ -0,0 +1,98 @@
+# backend/structured_log.py
+"""
+Logging estruturado (JSON) sem bloquear as threads de request.
+
+- O caminho do request só faz um enqueue (QueueHandler); a serialização JSON e a
+  escrita no stdout acontecem na thread do QueueListener.
+- request_id_var (ContextVar) é capturado no momento do log e vai em todo evento.
+- log_event(..., sample_rate=0.1) permite amostrar eventos de alto volume.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+LOGGER_NAME = "jogamos"
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+logger = logging.getLogger(LOGGER_NAME)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Uma linha JSON por evento. Campos extras vêm em record.fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        doc = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "event": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            doc.update(fields)
+        if record.exc_info:
+            doc["exc"] = self.formatException(record.exc_info)
+        return json.dumps(doc, ensure_ascii=False, default=str)
+
+
+class _EnqueueOnlyHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler.prepare() padrão formata a mensagem na thread chamadora.
+    Aqui só anexamos o request_id (o ContextVar só existe nesta thread)
+    e deixamos a formatação para o listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = request_id_var.get()
+        return record
+
+
+def setup_logging(level: str = "INFO", stream=None) -> logging.Logger:
+    """Instala o par QueueHandler/QueueListener (idempotente)."""
+    global _listener
+    if _listener is not None:
+        return logger
+
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    sink = logging.StreamHandler(stream or sys.stdout)
+    sink.setFormatter(JsonFormatter())
+
+    logger.handlers[:] = [_EnqueueOnlyHandler(q)]
+    logger.setLevel(level.upper())
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(q, sink, respect_handler_level=False)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return logger
+
+
+def shutdown_logging() -> None:
+    """Esvazia a fila e para o listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_event(event: str, level: int = logging.INFO, sample_rate: float = 1.0, exc_info=None, **fields: Any) -> None:
+    """Loga um evento estruturado; com sample_rate < 1 só uma fração é emitida."""
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, event, extra={"fields": fields}, exc_info=exc_info)
+
+
+def elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
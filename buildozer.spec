@@ -27,6 +27,8 @@ source.include_exts = py,png,jpg,kv,atlas
 # (list) List of exclusions using pattern matching
 # Do not prefix with './'
 #source.exclude_patterns = license,images/*/*.jpg
+# Ícones vão no atlas (rode antes: python tools/build_atlas.py); PNGs originais ficam fora do APK
+source.exclude_patterns = assets/icons/*.png
 
 # (str) Application versioning (method 1)
 version = 0.1
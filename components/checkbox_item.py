@@ -1,27 +1,60 @@
+from kivy.properties import BooleanProperty, ObjectProperty, StringProperty
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.selectioncontrol import MDCheckbox
 from kivymd.uix.label import MDLabel
 from kivy.uix.image import Image
 
-class MDCheckboxItem(MDBoxLayout):
+
+class MDCheckboxItem(RecycleDataViewBehavior, MDBoxLayout):
+    """
+    Linha (ícone + checkbox + texto) reciclada pelo RecycleView.
+    O estado marcado vive em `selection` (fora do widget); a view só o reflete.
+    """
+    key = StringProperty("")
+    text = StringProperty("")
+    icon_path = StringProperty("")
+    active = BooleanProperty(False)
+    selection = ObjectProperty(None, allownone=True)
+
     def __init__(self, text="", icon_path=None, **kwargs):
         super().__init__(orientation="horizontal", spacing=10, padding=10, **kwargs)
-        self.text = text
-        self.active = False
+        self._refreshing = False
 
         self.checkbox = MDCheckbox()
-        self.checkbox.bind(active=self.on_active)
+        self.checkbox.bind(active=self._on_checkbox)
 
-        if icon_path:
-            # Usando Image do Kivy
-            self.icon = Image(source=icon_path, size_hint=(None, None), size=(40, 40))
-            self.add_widget(self.icon)
+        # Usando Image do Kivy
+        self.icon = Image(size_hint=(None, None), size=(40, 40))
+        self.add_widget(self.icon)
 
-        self.label = MDLabel(text=text, halign="left")
+        self.label = MDLabel(halign="left")
 
         self.add_widget(self.checkbox)
         self.add_widget(self.label)
 
-    def on_active(self, checkbox, value):
-        self.active = value
+        self.text = text
+        self.icon_path = icon_path or ""
+        self.on_icon_path(self, self.icon_path)
 
+    def on_text(self, _instance, value):
+        self.label.text = value
+
+    def on_icon_path(self, _instance, value):
+        self.icon.source = value
+        self.icon.opacity = 1 if value else 0
+
+    def refresh_view_attrs(self, rv, index, data):
+        # Reaproveitada para outra linha: aplica os dados sem disparar escrita no modelo
+        self._refreshing = True
+        try:
+            super().refresh_view_attrs(rv, index, data)
+            self.active = bool(self.selection and self.selection.is_selected(self.key))
+            self.checkbox.active = self.active
+        finally:
+            self._refreshing = False
+
+    def _on_checkbox(self, _checkbox, value):
+        self.active = value
+        if not self._refreshing and self.selection is not None:
+            self.selection.set(self.key, value)
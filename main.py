@@ -1,39 +1,88 @@
-from ui.widgets import JogamosTextField  # garante registro no Factory
+# Antes de qualquer import do Kivy: mede os imports e trata --profile-startup
+from services.startup_profile import profiler
+from services.frame_monitor import frame_monitor  # também trata --frame-monitor
+from services.leak_monitor import leak_monitor  # também trata --leak-check
 import os
+import sys
 import time
-from typing import Dict
+import importlib
+import threading
+from typing import Dict, NamedTuple, Set, Tuple
 
-from kivy.utils import platform
-from kivy.metrics import dp
+with profiler.phase("import kivy", cat="import"):
+    from kivy.utils import platform
+    from kivy.metrics import dp
 
-from kivy.lang import Builder
-from kivy.clock import Clock
-from kivy.metrics import dp
-from kivy.uix.screenmanager import ScreenManager, FadeTransition
-from kivy.logger import Logger, LOG_LEVELS
+    from kivy.lang import Builder
+    from kivy.clock import Clock
+    from kivy.metrics import dp
+    from kivy.uix.screenmanager import ScreenManager, FadeTransition, NoTransition
+    from kivy.uix.widget import Widget
+    from kivy.factory import Factory
+    from kivy.logger import Logger, LOG_LEVELS
 
-from kivymd.app import MDApp
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.button import MDButton, MDButtonText, MDButtonIcon
-from kivymd.uix.spinner import MDSpinner
-from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.label import MDLabel
+with profiler.phase("import kivymd", cat="import"):
+    from ui.widgets import JogamosTextField  # garante registro no Factory
+    from kivymd.app import MDApp
+    from ui.feedback import UIFeedback
 
-# Telas (importe ANTES de carregar os .kv)
-from screens.auth import LoginScreen, SignupScreen, ForgotPasswordScreen, VerifyTokenScreen
-from screens.home import HomeScreen
-from screens.cadastro import CadastroScreen
-from screens.sports import ChooseSportsScreen
-from screens.dashboard import DashboardScreen                  # <-- você já importava, vamos usar
-from screens.shell import AppShellScreen
+# Telas são importadas sob demanda (ver MyApp.SCREENS / _create_screen)
+with profiler.phase("import services.api", cat="import"):
+    from services.api import ApiClient
+    from services.repository import Repository
+    from services.session import token_store
+    from services.push import PushSubscriber
 
 
-from kivy.core.window import Window
-Window.clearcolor = (0.97, 0.97, 0.98, 1)
+with profiler.phase("create window", cat="window"):
+    from kivy.core.window import Window
+    Window.clearcolor = (0.97, 0.97, 0.98, 1)
 
 
 class RootManager(ScreenManager):
-    pass
+    """
+    ScreenManager com telas preguiçosas: `lazy_factories[name]()` constrói a tela
+    na primeira vez que ela é pedida (current = name, get_screen, goto).
+    """
+
+    def __init__(self, **kwargs):
+        self.lazy_factories = {}
+        super().__init__(**kwargs)
+
+    def knows(self, name: str) -> bool:
+        return name in self.screen_names or name in self.lazy_factories
+
+    def get_screen(self, name):
+        if name not in self.screen_names and name in self.lazy_factories:
+            with frame_monitor.operation(f"build:{name}"):
+                self.add_widget(self.lazy_factories[name]())
+        return super().get_screen(name)
+
+
+class ScreenSpec(NamedTuple):
+    """Tela registrada + arquivos dos quais ela depende (usado pelo hot reload)."""
+    name: str
+    module: str
+    cls: str
+    kv: Tuple[str, ...] = ()
+    deps: Tuple[str, ...] = ()  # outros módulos .py usados pela tela
+
+
+class _ReloadEventHandler:
+    """Handler do watchdog: repassa caminhos .kv/.py alterados (roda na thread do observer)."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    # "opened"/"closed_no_write" também disparam ao *ler* o KV: ignorados
+    EVENT_TYPES = {"modified", "created", "moved", "closed"}
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in self.EVENT_TYPES:
+            return
+        for path in (getattr(event, "src_path", None), getattr(event, "dest_path", None)):
+            if path and path.endswith((".kv", ".py")):
+                self.callback(path)
 
 class MyApp(MDApp):
     """
@@ -55,18 +104,59 @@ class MyApp(MDApp):
         os.path.join("kv", "viewport.kv"),   # <-- se não existir, apenas logaremos aviso
     ]
 
-    # Pastas a observar para .py (screens)
+    # KV com regras globais: mudança reconstrói o root inteiro
+    GLOBAL_KV = {
+        os.path.join("kv", "theme.kv"),
+        os.path.join("kv", "viewport.kv"),
+    }
+    GLOBAL_MODULES = {"ui.widgets"}
+
+    # Telas e suas dependências (KV / módulos)
+    SCREENS = [
+        ScreenSpec("login", "screens.auth", "LoginScreen", (os.path.join("kv", "auth.kv"),)),
+        ScreenSpec("signup", "screens.auth", "SignupScreen", (os.path.join("kv", "auth.kv"),)),
+        ScreenSpec("forgot", "screens.auth", "ForgotPasswordScreen", (os.path.join("kv", "auth.kv"),)),
+        ScreenSpec("verify", "screens.auth", "VerifyTokenScreen", (os.path.join("kv", "auth.kv"),)),
+        ScreenSpec("cadastro", "screens.cadastro", "CadastroScreen", (os.path.join("kv", "cadastro.kv"),)),
+        ScreenSpec("home", "screens.home", "HomeScreen", (os.path.join("kv", "home.kv"),)),
+        ScreenSpec("dashboard", "screens.dashboard", "DashboardScreen", (os.path.join("kv", "dashboard.kv"),)),
+        ScreenSpec("choose_sports", "screens.sports", "ChooseSportsScreen", (os.path.join("kv", "sports.kv"),),
+                   ("components.checkbox_item",)),
+        # O shell embute Dashboard e ChooseSports (ver shell.kv)
+        ScreenSpec("shell", "screens.shell", "AppShellScreen",
+                   (os.path.join("kv", "shell.kv"), os.path.join("kv", "dashboard.kv"), os.path.join("kv", "sports.kv")),
+                   ("screens.dashboard", "screens.sports", "components.checkbox_item")),
+    ]
+
+    # Telas prováveis a seguir, construídas com o app ocioso (uma por frame)
+    PREWARM = {
+        "login": ["signup", "dashboard"],
+        "signup": ["verify"],
+        "verify": ["login"],
+        "dashboard": ["choose_sports"],
+    }
+    PREWARM_DELAY = 1.0  # segundos após entrar na tela
+
+    # Pastas a observar para .py
     WATCH_PY_DIRS = [
         os.path.join(os.getcwd(), "screens"),
+        os.path.join(os.getcwd(), "components"),
+        os.path.join(os.getcwd(), "ui"),
     ]
 
-    _error_dialog = None
-    _loader_dialog = None
+    feedback = None
+    _api = None
+    _repo = None
+    _push = None
 
     # -----------------------
     # Ciclo de vida do App
     # -----------------------
     def build(self):
+        with profiler.phase("MyApp.build"):
+            return self._build_app()
+
+    def _build_app(self):
         Logger.setLevel(LOG_LEVELS["debug"])
         Logger.info("App: montando UI")
 
@@ -75,131 +165,310 @@ class MyApp(MDApp):
         self.theme_cls.primary_hue = "600"
         self.theme_cls.theme_style = "Light"  # ou "Dark"
 
-        # Carrega todos os KV na ordem
+        # Loader/erro/toast: instâncias únicas, montadas com o app ocioso (ver on_start)
+        self.feedback = UIFeedback()
+
+        # Só os KV globais agora; os das telas carregam na 1ª navegação
+        self._loaded_kv: Set[str] = set()
         for kv in self.KV_FILES:
-            if os.path.exists(kv):
-                try:
-                    Logger.debug(f"KV: carregando {kv}")
-                    Builder.load_file(kv)
-                except Exception as e:
-                    Logger.exception(f"KV: erro ao carregar {kv}: {e}")
-            else:
-                Logger.warning(f"KV: arquivo não encontrado (ok se opcional) -> {kv}")
+            if kv in self.GLOBAL_KV:
+                self._load_kv(kv)
 
         # Monta o ScreenManager inicial
-        root = self._build_root()
+        with profiler.phase("build root"):
+            root = self._build_root()
 
         # Inicia o observador de arquivos (hot-reload)
-        self._start_hot_reload()
+        with profiler.phase("start hot reload"):
+            self._start_hot_reload()
 
         # Dump de telas ao iniciar (ajuda a diagnosticar navegação)
         Clock.schedule_once(lambda *_: self._debug_screens(root), 0)
 
         return root
 
+    def on_start(self):
+        profiler.mark("on_start")
+        frame_monitor.start(self)
+        leak_monitor.schedule_checkpoint("start")
+        # Lê os tokens salvos em background; o ApiClient os encontra prontos
+        token_store.start_load()
+        # schedule_once(0) roda após o primeiro frame desenhado
+        Clock.schedule_once(self._on_first_frame, 0)
+        Clock.schedule_once(self.feedback.prewarm, self.PREWARM_DELAY)
+        # Fila de sincronização: começa depois que a UI já apareceu
+        Clock.schedule_once(lambda *_: self.repo.sync.start(), self.PREWARM_DELAY)
+
+    def _on_first_frame(self, *args):
+        if not profiler.enabled:
+            return
+        profiler.mark("first frame")
+        path = profiler.write()
+        Logger.info(f"Profile: timeline de startup gravada em {path}")
+        for line in profiler.summary():
+            Logger.info(f"Profile: {line}")
+        if profiler.exit_after:
+            self.stop()
+
+    def on_pause(self):
+        # Em segundo plano o canal de push fica fechado (bateria); volta no on_resume
+        if self._push is not None:
+            self._push.stop()
+        return True
+
+    def on_resume(self):
+        # Voltou ao primeiro plano: provável mudança de rede, tenta a fila já
+        if self._repo is not None:
+            self._repo.sync.kick()
+        if self._push is not None:
+            self._push.start()
+
+    def on_stop(self):
+        if self._push is not None:
+            self._push.stop()
+        report = frame_monitor.stop()
+        if report:
+            Logger.info(f"Frames: relatório gravado em {report}")
+        report = leak_monitor.write()
+        if report:
+            Logger.info(f"Leak: relatório gravado em {report}")
+        if self._repo is not None:
+            self._repo.close()
+        # Fecha o pool de conexões HTTP compartilhado
+        if self._api is not None:
+            Logger.info(f"Api: cache GET {self._api.cache.stats()}")
+            self._api.close()
+        observer = getattr(self, "_observer", None)
+        if observer is not None:
+            observer.stop()
+
+    def _load_kv(self, kv: str):
+        if os.path.exists(kv):
+            try:
+                Logger.debug(f"KV: carregando {kv}")
+                with profiler.phase(f"kv {kv}", cat="kv"):
+                    Builder.load_file(kv)
+            except Exception as e:
+                Logger.exception(f"KV: erro ao carregar {kv}: {e}")
+        else:
+            Logger.warning(f"KV: arquivo não encontrado (ok se opcional) -> {kv}")
+        self._loaded_kv.add(kv)
+
+    def _create_screen(self, spec: ScreenSpec):
+        """Importa os módulos e carrega os KV da tela (se ainda não) e a instancia."""
+        start = time.perf_counter()
+        # Módulos ANTES dos KV: as classes precisam estar no Factory
+        for mod in (*spec.deps, spec.module):
+            if mod not in sys.modules:
+                with profiler.phase(f"import {mod}", cat="import"):
+                    importlib.import_module(mod)
+        for kv in self.KV_FILES:
+            if kv in spec.kv and kv not in self._loaded_kv:
+                self._load_kv(kv)
+        with profiler.phase(f"screen {spec.name}", cat="screen"):
+            screen = self._screen_class(spec)(name=spec.name)
+        Logger.debug(f"Tela: '{spec.name}' construída em {(time.perf_counter() - start) * 1000:.1f} ms")
+        return screen
+
     def _build_root(self) -> ScreenManager:
-        """(Re)monta o ScreenManager e registra as telas."""
+        """(Re)monta o ScreenManager; as telas são construídas sob demanda."""
         sm = RootManager(transition=FadeTransition())
+        for spec in self.SCREENS:
+            sm.lazy_factories[spec.name] = lambda spec=spec: self._create_screen(spec)
+        sm.bind(current=self._schedule_prewarm)
+        if frame_monitor.enabled:
+            sm.bind(current=lambda sm, cur: frame_monitor.hold(f"transition:{cur}", sm.transition.duration))
+        if leak_monitor.enabled:
+            sm.bind(current=lambda sm, cur: leak_monitor.schedule_checkpoint(f"nav:{cur}"))
 
-        # Telas públicas / auth
-        sm.add_widget(LoginScreen(name="login"))
-        sm.add_widget(SignupScreen(name="signup"))
-        sm.add_widget(ForgotPasswordScreen(name="forgot"))
-        sm.add_widget(VerifyTokenScreen(name="verify"))
-
-        # Telas internas
-        sm.add_widget(CadastroScreen(name="cadastro"))
-        #sm.add_widget(EsportesScreen(name="esportes"))
-        sm.add_widget(HomeScreen(name="home"))
-        sm.add_widget(DashboardScreen(name="dashboard"))       # <-- ADICIONADA
-        sm.add_widget(ChooseSportsScreen(name="choose_sports"))# <-- se não usar, pode remover
-        sm.add_widget(AppShellScreen(name="shell"))
-
-        # ... depois de sm.add_widget(LoginScreen(name="login")) e as demais:
-        print("[Debug] telas no ScreenManager =", [s.name for s in sm.screens])
         sm.current = "login"  # força abrir na tela de Login enquanto migramos o resto
-        print("[Debug] tela atual =", sm.current)
+        Logger.debug(f"Telas: construídas {sm.screen_names}; atual '{sm.current}'")
         return sm
 
-        # Primeira tela (por segurança; a 1ª adicionada já seria a atual)
-        if sm.current not in sm.screen_names:
-            sm.current = "login"
+    def _schedule_prewarm(self, sm, current):
+        pending = [n for n in self.PREWARM.get(current, []) if n not in sm.screen_names]
+        if pending:
+            Clock.schedule_once(lambda *_: self._prewarm_next(sm, pending), self.PREWARM_DELAY)
 
-        return sm
+    def _prewarm_next(self, sm, pending):
+        """Constrói uma tela por callback para não estourar o orçamento de um frame."""
+        if sm is not self.root or not pending:
+            return
+        name = pending.pop(0)
+        if name not in sm.screen_names and sm.knows(name):
+            sm.get_screen(name)
+        if pending:
+            Clock.schedule_once(lambda *_: self._prewarm_next(sm, pending), 0)
+
+    @staticmethod
+    def _screen_class(spec: ScreenSpec):
+        # Sempre pelo módulo atual: após reload, a classe nova é usada
+        return getattr(importlib.import_module(spec.module), spec.cls)
 
     # -----------------------------------
-    # Hot Reload (KV + opcionalmente .py)
+    # Hot Reload (KV + .py), por eventos
     # -----------------------------------
     def _start_hot_reload(self):
-        """Inicia um agendador que observa alterações em KV e (opcional) .py."""
-        # Mapa caminho -> última modificação
-        self._kv_mtimes: Dict[str, float] = {}
-        for kv in self.KV_FILES:
-            try:
-                self._kv_mtimes[kv] = os.path.getmtime(kv)
-            except FileNotFoundError:
-                self._kv_mtimes[kv] = 0.0
+        """Observa KV e .py com watchdog; sem watchdog, cai para polling."""
+        if platform == "android":
+            return
 
-        # (Opcional) observar .py das pastas registradas
-        self._py_mtime = self._scan_py_mtime()
+        self._pending_changes: Set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._reload_trigger = Clock.create_trigger(self._apply_pending_changes, 0.15)
 
-        # Checa a cada 0.7s
+        try:
+            from watchdog.observers import Observer
+        except ImportError:
+            Logger.warning("[HOT-RELOAD] watchdog indisponível; usando polling")
+            self._start_polling()
+            return
+
+        handler = _ReloadEventHandler(self._on_fs_change)
+        observer = Observer()
+        observer.daemon = True
+        dirs = {os.path.abspath(os.path.dirname(kv)) for kv in self.KV_FILES}
+        dirs.update(os.path.abspath(d) for d in self.WATCH_PY_DIRS)
+        for d in sorted(dirs):
+            if os.path.isdir(d):
+                observer.schedule(handler, d, recursive=True)
+        observer.start()
+        self._observer = observer
+
+    def _on_fs_change(self, path: str):
+        """Chamado na thread do watchdog: só acumula e agenda (debounce) na thread principal."""
+        rel = os.path.relpath(os.path.abspath(path))
+        with self._pending_lock:
+            self._pending_changes.add(rel)
+        self._reload_trigger()
+
+    def _start_polling(self):
+        """Fallback sem watchdog: compara mtimes a cada 0.7s."""
+        self._mtimes: Dict[str, float] = self._scan_mtimes()
         Clock.schedule_interval(self._poll_changes, 0.7)
 
-    def _scan_py_mtime(self) -> float:
-        """Retorna o maior mtime entre os .py observados em WATCH_PY_DIRS."""
-        max_mtime = 0.0
+    def _scan_mtimes(self) -> Dict[str, float]:
+        mtimes: Dict[str, float] = {}
+        for kv in self.KV_FILES:
+            try:
+                mtimes[kv] = os.path.getmtime(kv)
+            except FileNotFoundError:
+                pass
         for d in self.WATCH_PY_DIRS:
             if not os.path.isdir(d):
                 continue
             for root, _, files in os.walk(d):
                 for f in files:
                     if f.endswith(".py"):
-                        path = os.path.join(root, f)
+                        path = os.path.relpath(os.path.join(root, f))
                         try:
-                            mt = os.path.getmtime(path)
-                            if mt > max_mtime:
-                                max_mtime = mt
+                            mtimes[path] = os.path.getmtime(path)
                         except FileNotFoundError:
                             pass
-        return max_mtime
+        return mtimes
 
     def _poll_changes(self, *args):
-        """Verifica alterações e aplica hot reload."""
-        # 1) Recarrega KV alterados, mantendo ordem
-        kv_changed = False
-        for kv in self.KV_FILES:
-            try:
-                current = os.path.getmtime(kv)
-            except FileNotFoundError:
-                current = 0.0
-            if current > self._kv_mtimes.get(kv, 0.0):
-                Logger.info(f"[HOT-RELOAD] Recarregando KV: {kv}")
-                try:
-                    Builder.unload_file(kv)
-                except Exception as e:
-                    Logger.warning(f"[HOT-RELOAD] Aviso ao descarregar {kv}: {e}")
-                try:
-                    Builder.load_file(kv)
-                    self._kv_mtimes[kv] = current
-                    kv_changed = True
-                except Exception as e:
-                    Logger.exception(f"[HOT-RELOAD] ERRO ao recarregar {kv}: {e}")
+        current = self._scan_mtimes()
+        changed = {p for p, mt in current.items() if mt > self._mtimes.get(p, 0.0)}
+        self._mtimes = current
+        if changed:
+            with self._pending_lock:
+                self._pending_changes.update(changed)
+            self._apply_pending_changes()
+
+    @staticmethod
+    def _module_for(path: str):
+        """'screens/auth.py' -> 'screens.auth' (somente se já importado)."""
+        name = os.path.splitext(os.path.normpath(path))[0].replace(os.sep, ".")
+        return name if name in sys.modules else None
+
+    def _reload_module(self, name: str) -> bool:
+        """Recarrega um módulo, liberando no Factory as classes de widget definidas nele."""
+        mod = sys.modules[name]
+        widgets = [
+            obj for obj in vars(mod).values()
+            if isinstance(obj, type) and issubclass(obj, Widget) and obj.__module__ == name
+        ]
+        for cls in widgets:
+            Factory.unregister(cls.__name__)
+        try:
+            importlib.reload(mod)
+            return True
+        except Exception as e:
+            Logger.exception(f"[HOT-RELOAD] ERRO ao recarregar {name}: {e}")
+            for cls in widgets:  # mantém as classes antigas utilizáveis
+                if cls.__name__ not in Factory.classes:
+                    Factory.register(cls.__name__, cls=cls)
+            return False
+
+    def _apply_pending_changes(self, *args):
+        """Recarrega só os KV/módulos alterados e reconstrói só as telas afetadas."""
+        with self._pending_lock:
+            changed, self._pending_changes = self._pending_changes, set()
+        if not changed or not self.root:
+            return
+        start = time.perf_counter()
 
-        # Se algum KV mudou, reconstruímos o root para aplicar novas regras
-        if kv_changed:
-            current_name = self.root.current if self.root else "login"
-            new_root = self._build_root()
-            self._swap_root(new_root, current_name)
-
-        # 2) (Opcional) Detecta mudanças em .py e reconstrói root
-        new_py_mtime = self._scan_py_mtime()
-        if new_py_mtime > self._py_mtime:
-            Logger.info("[HOT-RELOAD] Alteração em .py detectada. Reconstruindo telas…")
-            self._py_mtime = new_py_mtime
+        # 1) KV alterados, mantendo a ordem de KV_FILES
+        # KV ainda não carregados (telas não visitadas) entram frescos quando forem usados
+        changed_kv = [kv for kv in self.KV_FILES if os.path.normpath(kv) in changed and kv in self._loaded_kv]
+        for kv in changed_kv:
+            Logger.info(f"[HOT-RELOAD] Recarregando KV: {kv}")
+            try:
+                Builder.unload_file(kv)
+            except Exception as e:
+                Logger.warning(f"[HOT-RELOAD] Aviso ao descarregar {kv}: {e}")
+            try:
+                Builder.load_file(kv)
+            except Exception as e:
+                Logger.exception(f"[HOT-RELOAD] ERRO ao recarregar {kv}: {e}")
+
+        # 2) Módulos .py alterados (dependências antes das telas que as importam)
+        changed_mods = {m for m in (self._module_for(p) for p in changed if p.endswith(".py")) if m}
+        for name in sorted(changed_mods, key=lambda m: not m.startswith(("components.", "ui."))):
+            Logger.info(f"[HOT-RELOAD] Recarregando módulo: {name}")
+            self._reload_module(name)
+
+        # 3) Telas afetadas
+        if self.GLOBAL_KV & set(changed_kv) or self.GLOBAL_MODULES & changed_mods:
             current_name = self.root.current if self.root else "login"
-            new_root = self._build_root()
-            self._swap_root(new_root, current_name)
+            self._swap_root(self._build_root(), current_name)
+            affected = [s.name for s in self.SCREENS]
+        else:
+            affected = []
+            for spec in self.SCREENS:
+                if set(spec.kv) & set(changed_kv) or ({spec.module, *spec.deps} & changed_mods):
+                    # Dependência mudou: o módulo da tela precisa reimportar os novos objetos
+                    if spec.module not in changed_mods and set(spec.deps) & changed_mods:
+                        self._reload_module(spec.module)
+                        changed_mods.add(spec.module)
+                    self._rebuild_screen(spec)
+                    affected.append(spec.name)
+
+        ms = (time.perf_counter() - start) * 1000
+        Logger.info(f"[HOT-RELOAD] {sorted(changed)} -> telas {affected} em {ms:.1f} ms")
+        leak_monitor.schedule_checkpoint(f"hot reload {sorted(os.path.basename(p) for p in changed)}")
+
+    def _rebuild_screen(self, spec: ScreenSpec):
+        """Substitui uma única tela no ScreenManager, preservando a tela atual."""
+        sm = self.root
+        if spec.name not in sm.screen_names:
+            return  # ainda não construída: nascerá com o código novo
+        was_current = sm.current == spec.name
+        transition = sm.transition
+        sm.transition = NoTransition()
+        try:
+            old = sm.get_screen(spec.name)
+            sm.remove_widget(old)
+            leak_monitor.expect_collected(old, "tela reconstruída (hot reload)")
+            del old
+            sm.add_widget(self._create_screen(spec))
+            if was_current:
+                sm.current = spec.name
+        except Exception as e:
+            Logger.exception(f"[HOT-RELOAD] ERRO ao reconstruir tela {spec.name}: {e}")
+        finally:
+            sm.transition = transition
 
     def _swap_root(self, new_root: ScreenManager, current_name: str):
         """Troca o root preservando a tela (se existir)."""
@@ -208,106 +477,34 @@ class MyApp(MDApp):
         except Exception:
             pass
 
+        leak_monitor.expect_collected(self.root, "root antigo (hot reload)")
         self.root = new_root
         self.root_window.add_widget(self.root)
 
         # Restaura a tela atual se existir; senão volta pro login
-        self.root.current = current_name if current_name in self.root.screen_names else "login"
+        self.root.current = current_name if self.root.knows(current_name) else "login"
         self._debug_screens(self.root)
 
     # ==============
     # Helpers de UI
     # ==============
     
+    # -----------------------
+    # Feedback visual (widgets reaproveitados, ver ui/feedback.py)
+    # -----------------------
     def toast(self, msg: str):
-        """
-        Cross-platform 'toast':
-        - Android: usa kivymd.toast (Toast nativo do Android).
-        - Desktop (Win/Linux/macOS): usa MDSnackbar (KivyMD 2.x).
-        """
-        try:
-            if platform == "android":
-                # Android Toast
-                from kivymd.toast import toast as android_toast
-                android_toast(msg)
-            else:
-                # Snackbar no desktop
-                from kivymd.uix.snackbar import (
-                    MDSnackbar,
-                    MDSnackbarText,
-                )
-                MDSnackbar(
-                    MDSnackbarText(text=str(msg)),
-                    y=dp(24),
-                    pos_hint={"center_x": 0.5},
-                    size_hint_x=0.6,
-                ).open()
-        except Exception as e:
-            # Fallback: loga se algo der errado
-            from kivy.logger import Logger
-            Logger.exception(f"Toast/Snackbar fallback: {e}")
+        """Toast (Android) / snackbar (desktop); rajadas viram um só."""
+        self.feedback.toast(msg)
 
-    
     def notify_error(self, msg: str, title: str = "Erro"):
-        if self._error_dialog:
-            try:
-                self._error_dialog.dismiss()
-            except Exception:
-                pass
-            self._error_dialog = None
-
-        self._error_dialog = MDDialog(
-            title=title,
-            text=str(msg),
-            buttons=[
-                MDButton(
-                    style="text",
-                    on_release=lambda x: self._dismiss_error_dialog()
-                ,
-                children=[
-                    MDButtonText(text="OK")
-                ])
-            ],
-        )
-        self._error_dialog.open()
-
-
-    def _dismiss_error_dialog(self, *args):
-        if self._error_dialog:
-            self._error_dialog.dismiss()
-            self._error_dialog = None
+        self.feedback.notify_error(msg, title=title)
 
     def show_loader(self, text: str = "Carregando..."):
-        """Exibe um diálogo com spinner (loader)."""
-        if self._loader_dialog:
-            # Atualiza o texto se já existir
-            content = self._loader_dialog.content_cls
-            for child in content.children:
-                if isinstance(child, MDLabel):
-                    child.text = text
-            return
-
-        content = MDBoxLayout(
-            orientation="horizontal",
-            spacing=dp(16),
-            padding=(dp(16), dp(16)),
-            adaptive_height=True,
-        )
-        spinner = MDSpinner(size_hint=(None, None), size=(dp(32), dp(32)))
-        label = MDLabel(text=text)
-        content.add_widget(spinner)
-        content.add_widget(label)
-        self._loader_dialog = MDDialog(
-            type="custom",
-            content_cls=content,
-            auto_dismiss=False,
-        )
-        self._loader_dialog.open()
+        """Exibe o diálogo com spinner (mesmo widget a cada chamada)."""
+        self.feedback.show_loader(text)
 
     def hide_loader(self):
-        if self._loader_dialog:
-            self._loader_dialog.dismiss()
-            self._loader_dialog = None
+        self.feedback.hide_loader()
 
     def toggle_theme(self):
         """Alterna Light/Dark; usado pela Home."""
@@ -317,13 +514,56 @@ class MyApp(MDApp):
     def root_manager(self):
         return self.root
 
+    @property
+    def api(self) -> ApiClient:
+        """ApiClient compartilhado (criado sob demanda)."""
+        if self._api is None:
+            self._api = ApiClient(self.API_BASE_URL)
+        return self._api
+
+    @property
+    def repo(self) -> Repository:
+        """Dados locais (SQLite) + fila de sincronização (criados sob demanda)."""
+        if self._repo is None:
+            self._repo = Repository(self.api, on_rejected=self._on_sync_rejected)
+        return self._repo
+
+    def start_push(self):
+        """Abre o canal de push (idempotente); chamado ao entrar no dashboard."""
+        if self._push is None:
+            self._push = PushSubscriber(self.api)
+            self._push.add_listener(self._on_push)
+        self._push.start()
+
+    def _on_push(self, event: dict):
+        dashboard = self.root.get_screen("dashboard") if self.root and "dashboard" in self.root.screen_names else None
+        if event.get("type") in ("hello", "resync"):
+            # (Re)conectou ou perdeu eventos: um GET /me/dashboard completo
+            self.repo.refresh_dashboard(on_update=dashboard._apply_dashboard if dashboard else None, fresh=True)
+            return
+        if event.get("type") == "team":
+            self.toast(f"Novo time: {event.get('name', '')}")
+        data = self.repo.apply_push(event)
+        if data is not None and dashboard is not None:
+            dashboard._apply_dashboard(data)
+
+    def _on_sync_rejected(self, item: dict, status: int, data):
+        detail = data.get("detail") if isinstance(data, dict) else None
+        if item.get("rolled_back"):
+            # Favoritos recusados: a tela volta para a última seleção salva no servidor
+            if self.root and "choose_sports" in self.root.screen_names:
+                self.root.get_screen("choose_sports").reload_favorites()
+            self.toast(f"Favoritos não salvos ({detail or status}); seleção anterior restaurada")
+            return
+        self.toast(f"Não foi possível sincronizar: {detail or status}")
+
     # --------------------------
     # Navegação segura + debug
     # --------------------------
     def goto(self, screen_name: str):
         """Troca de tela com validação e logs amigáveis."""
-        if not self.root or screen_name not in self.root.screen_names:
-            msg = f"Tela '{screen_name}' não encontrada. Telas disponíveis: {self.root.screen_names if self.root else 'sem root'}"
+        if not self.root or not self.root.knows(screen_name):
+            msg = f"Tela '{screen_name}' não encontrada. Telas disponíveis: {[s.name for s in self.SCREENS] if self.root else 'sem root'}"
             Logger.error(f"Navegação: {msg}")
             try:
                 self.notify_error(msg, title="Navegação")
@@ -342,4 +582,6 @@ class MyApp(MDApp):
 
 
 if __name__ == "__main__":
-    MyApp().run()
\ No newline at end of file
+    with profiler.phase("MyApp.__init__"):
+        app = MyApp()
+    app.run()
\ No newline at end of file
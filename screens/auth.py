@@ -1,13 +1,13 @@
 import re
+import uuid
+import hashlib
 from kivy.app import App
 from kivy.properties import StringProperty
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.label import MDLabel
 from kivymd.uix.boxlayout import MDBoxLayout
 
-# Fallbacks (KivyMD 2.x / MD3)
-from kivy.metrics import dp
-from kivymd.uix.snackbar import MDSnackbar, MDSnackbarText
+from services.dispatcher import get_dispatcher
 
 EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
@@ -46,64 +46,67 @@ class BaseAuthScreen(MDScreen):
         if self.manager:
             self.manager.current = screen_name
 
-    # --- Loaders / feedback visual ---
+    # --- Idempotency-Key por ação ---
+    def idempotency_key(self, action: str, *parts: str) -> str:
+        """
+        Mesma chave enquanto a ação tiver os mesmos dados: duplo toque ou nova
+        tentativa após falha de rede não repetem o trabalho no backend.
+        """
+        if not hasattr(self, "_idem_keys"):
+            self._idem_keys = {}
+        digest = hashlib.sha256("\x00".join((action,) + parts).encode("utf-8")).hexdigest()
+        return self._idem_keys.setdefault(digest, uuid.uuid4().hex)
+
+    def release_idempotency_key(self, action: str, *parts: str):
+        """Chamado quando o backend respondeu: a próxima ação usa chave nova."""
+        digest = hashlib.sha256("\x00".join((action,) + parts).encode("utf-8")).hexdigest()
+        getattr(self, "_idem_keys", {}).pop(digest, None)
+
+    # --- Chamadas de rede fora da thread de UI ---
+    @property
+    def api(self):
+        """ApiClient compartilhado do App (um pool de conexões para todas as telas)."""
+        return self.app.api
+
+    @staticmethod
+    def error_detail(data) -> str:
+        if isinstance(data, dict):
+            return str(data.get("detail") or data.get("error") or data)
+        return str(data)
+
+    def run_request(self, fn, on_result, error_prefix: str, loader_text: str):
+        """
+        Mostra o loader, executa `fn` no dispatcher e chama `on_result(resultado)`
+        na thread principal. Sair da tela cancela a entrega (ver on_leave).
+        """
+        self.show_loader(loader_text)
+
+        def done(result):
+            self.hide_loader()
+            on_result(result)
+
+        def failed(err):
+            self.hide_loader()
+            self.notify_error(f"{error_prefix}: {err}")
+
+        return get_dispatcher().submit(fn, done, failed, owner=self)
+
+    def on_leave(self, *args):
+        if get_dispatcher().cancel_owner(self):
+            self.hide_loader()
+
+    # --- Loaders / feedback visual (widgets reaproveitados do App) ---
     def show_loader(self, text: str = "Carregando..."):
-        _app = self.app
-        if hasattr(_app, "show_loader"):
-            try:
-                _app.show_loader(text)
-                return
-            except Exception:
-                pass
-        # Fallback: snackbar
-        MDSnackbar(
-            MDSnackbarText(text=str(text)),
-            y=dp(24),
-            pos_hint={"center_x": 0.5},
-            size_hint_x=0.6,
-        ).open()
+        self.app.show_loader(text)
 
     def hide_loader(self):
-        _app = self.app
-        if hasattr(_app, "hide_loader"):
-            try:
-                _app.hide_loader()
-                return
-            except Exception:
-                pass
-        # Fallback: nada a fazer para snackbar simples
+        self.app.hide_loader()
 
     def notify_error(self, msg: str):
-        _app = self.app
-        if hasattr(_app, "notify_error"):
-            try:
-                _app.notify_error(str(msg))
-                return
-            except Exception:
-                pass
-        # Fallback: snackbar
-        MDSnackbar(
-            MDSnackbarText(text=str(msg)),
-            y=dp(24),
-            pos_hint={"center_x": 0.5},
-            size_hint_x=0.8,
-        ).open()
+        self.app.notify_error(str(msg))
 
     def toast(self, msg: str):
-        _app = self.app
-        if hasattr(_app, "toast"):
-            try:
-                _app.toast(str(msg))
-                return
-            except Exception:
-                pass
-        # Fallback: snackbar
-        MDSnackbar(
-            MDSnackbarText(text=str(msg)),
-            y=dp(24),
-            pos_hint={"center_x": 0.5},
-            size_hint_x=0.6,
-        ).open()
+        self.app.toast(str(msg))
 
 
 class LoginScreen(BaseAuthScreen):
@@ -123,31 +126,24 @@ class LoginScreen(BaseAuthScreen):
             self.notify_error("Informe e-mail e senha.")
             return
 
-        self.show_loader("Validando credenciais...")
-        try:
-            import requests
-
-            base_url = getattr(self.app, "API_BASE_URL", "http://127.0.0.1:8000")
-            url = f"{base_url}/auth/login"
-            payload = {"email": email, "password": password}
-
-            resp = requests.post(url, json=payload, timeout=15)
-            st = resp.status_code
-            ctype = resp.headers.get("content-type", "")
-            data = resp.json() if "application/json" in ctype else {"detail": resp.text}
-
-            if st == 200:
-                self.toast("Login realizado!")
-                # Ajuste a tela alvo conforme seu fluxo:
-                # "dashboard" (pelo seu log) ou "shell"/"home"
-                self.goto("dashboard")
-            else:
-                detail = data.get("detail") or str(data)
-                self.notify_error(detail)
-        except Exception as e:
-            self.notify_error(f"Erro ao fazer login: {e}")
-        finally:
-            self.hide_loader()
+        self.run_request(
+            lambda: self.api.login(email, password),
+            lambda result: self._on_login_result(email, result),
+            error_prefix="Erro ao fazer login",
+            loader_text="Validando credenciais...",
+        )
+
+    def _on_login_result(self, email: str, result):
+        st, data = result
+        if st == 200:
+            self.app.repo.remember_login(email.lower())
+            self.toast("Login realizado!")
+            # Ajuste a tela alvo conforme seu fluxo:
+            # "dashboard" (pelo seu log) ou "shell"/"home"
+            self.goto("dashboard")
+        else:
+            detail = self.error_detail(data)
+            self.notify_error(detail)
 
 
 class SignupScreen(BaseAuthScreen):
@@ -163,31 +159,31 @@ class SignupScreen(BaseAuthScreen):
             self.notify_error("As senhas não coincidem.")
             return
 
-        self.show_loader("Criando conta e enviando token...")
-        try:
-            import requests
-
-            base_url = getattr(self.app, "API_BASE_URL", "http://127.0.0.1:8000")
-            url = f"{base_url}/auth/signup"
-            payload = {"email": email, "password": password}
-
-            resp = requests.post(url, json=payload, timeout=15)
-            st = resp.status_code
-            ctype = resp.headers.get("content-type", "")
-            data = resp.json() if "application/json" in ctype else {"detail": resp.text}
-
-            if st in (200, 201):
-                self.toast("Conta criada! Enviamos um token para seu e-mail.")
-                verify_screen = self.manager.get_screen("verify")
-                verify_screen.email = email
-                self.goto("verify")
-            else:
-                detail = data.get("detail") or str(data)
-                self.notify_error(f"Falha ao criar conta: {detail}")
-        except Exception as e:
-            self.notify_error(f"Erro ao criar conta: {e}")
-        finally:
-            self.hide_loader()
+        key = self.idempotency_key("signup", email, password)
+
+        def call():
+            result = self.api.signup(email, password, idempotency_key=key)
+            if result[0]:  # houve resposta do backend (0 = falha de rede)
+                self.release_idempotency_key("signup", email, password)
+            return result
+
+        self.run_request(
+            call,
+            lambda result: self._on_signup_result(email, result),
+            error_prefix="Erro ao criar conta",
+            loader_text="Criando conta e enviando token...",
+        )
+
+    def _on_signup_result(self, email: str, result):
+        st, data = result
+        if st in (200, 201):
+            self.toast("Conta criada! Enviamos um token para seu e-mail.")
+            verify_screen = self.manager.get_screen("verify")
+            verify_screen.email = email
+            self.goto("verify")
+        else:
+            detail = self.error_detail(data)
+            self.notify_error(f"Falha ao criar conta: {detail}")
 
 
 class VerifyTokenScreen(BaseAuthScreen):
@@ -202,57 +198,51 @@ class VerifyTokenScreen(BaseAuthScreen):
             self.notify_error("E-mail não definido nesta verificação.")
             return
 
-        self.show_loader("Validando token...")
-        try:
-            import requests
-
-            base_url = getattr(self.app, "API_BASE_URL", "http://127.0.0.1:8000")
-            url = f"{base_url}/auth/verify-email"
-            payload = {"email": self.email, "token": token}
-
-            resp = requests.post(url, json=payload, timeout=15)
-            st = resp.status_code
-            ctype = resp.headers.get("content-type", "")
-            data = resp.json() if "application/json" in ctype else {"detail": resp.text}
-
-            if st == 200:
-                self.toast("Conta verificada! Faça login.")
-                self.goto("login")
-            else:
-                detail = data.get("detail") or str(data)
-                self.notify_error(f"Não foi possível verificar: {detail}")
-        except Exception as e:
-            self.notify_error(f"Erro ao verificar: {e}")
-        finally:
-            self.hide_loader()
+        email = self.email
+        self.run_request(
+            lambda: self.api.verify_email(email, token),
+            self._on_verify_result,
+            error_prefix="Erro ao verificar",
+            loader_text="Validando token...",
+        )
+
+    def _on_verify_result(self, result):
+        st, data = result
+        if st == 200:
+            self.toast("Conta verificada! Faça login.")
+            self.goto("login")
+        else:
+            detail = self.error_detail(data)
+            self.notify_error(f"Não foi possível verificar: {detail}")
 
     def resend_token(self):
         if not self.email:
             self.notify_error("E-mail não definido nesta verificação.")
             return
 
-        self.show_loader("Reenviando token...")
-        try:
-            import requests
-
-            base_url = getattr(self.app, "API_BASE_URL", "http://127.0.0.1:8000")
-            url = f"{base_url}/auth/resend-token"
-            payload = {"email": self.email}
-
-            resp = requests.post(url, json=payload, timeout=15)
-            st = resp.status_code
-            ctype = resp.headers.get("content-type", "")
-            data = resp.json() if "application/json" in ctype else {"detail": resp.text}
-
-            if st == 200:
-                self.toast(f"Novo token enviado para {self.email}.")
-            else:
-                detail = data.get("detail") or str(data)
-                self.notify_error(f"Falha ao reenviar token: {detail}")
-        except Exception as e:
-            self.notify_error(f"Erro ao reenviar: {e}")
-        finally:
-            self.hide_loader()
+        email = self.email
+        key = self.idempotency_key("resend", email)
+
+        def call():
+            result = self.api.resend_token(email, idempotency_key=key)
+            if result[0]:
+                self.release_idempotency_key("resend", email)
+            return result
+
+        self.run_request(
+            call,
+            lambda result: self._on_resend_result(email, result),
+            error_prefix="Erro ao reenviar",
+            loader_text="Reenviando token...",
+        )
+
+    def _on_resend_result(self, email: str, result):
+        st, data = result
+        if st == 200:
+            self.toast(f"Novo token enviado para {email}.")
+        else:
+            detail = self.error_detail(data)
+            self.notify_error(f"Falha ao reenviar token: {detail}")
 
 
 class ForgotPasswordScreen(BaseAuthScreen):
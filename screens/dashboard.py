@@ -1,12 +1,16 @@
 # screens/dashboard.py
 from datetime import datetime
 from kivymd.uix.screen import MDScreen
-from kivy.properties import StringProperty
+from kivy.properties import NumericProperty, StringProperty
 
 
 class DashboardScreen(MDScreen):
     greeting = StringProperty("Olá")
-    user_name = StringProperty("Carol")  # depois ligamos ao backend
+    user_name = StringProperty("")
+    # Cartão azul (TIMES | METAS); "--" até o 1º dado (local ou do backend)
+    teams_active = StringProperty("--")
+    goals_text = StringProperty("--/--")
+    goals_pct = NumericProperty(0)
 
     def on_pre_enter(self, *args):
         # Saudação dinâmica pelo horário local (com tz do SO)
@@ -22,6 +26,30 @@ class DashboardScreen(MDScreen):
         app = self._app()
         if hasattr(app, "current_user_name") and app.current_user_name:
             self.user_name = app.current_user_name
+        elif hasattr(app, "repo"):
+            # Perfil do armazenamento local (aparece na hora, mesmo offline)
+            self._apply_profile(app.repo.profile())
+        if hasattr(app, "repo"):
+            # Último dashboard salvo na hora + uma única chamada para atualizar
+            self._apply_dashboard(app.repo.dashboard())
+            app.repo.refresh_dashboard(on_update=self._apply_dashboard, owner=self)
+            # Depois disso, só deltas pelo canal de push (sem polling)
+            app.start_push()
+
+    def _apply_profile(self, profile):
+        name = profile.get("name") or (profile.get("email") or "").split("@")[0]
+        if name:
+            self.user_name = name
+
+    def _apply_dashboard(self, data):
+        if not data:
+            return
+        if not getattr(self._app(), "current_user_name", None):
+            self._apply_profile(data)
+        self.teams_active = f"{data.get('teams_active', 0):02d}"
+        done, total = data.get("goals_completed", 0), data.get("goals_total", 0)
+        self.goals_text = f"{done:02d}/{total:02d}"
+        self.goals_pct = 100.0 * done / total if total else 0
 
     def _app(self):
         from kivy.app import App
@@ -29,6 +57,10 @@ class DashboardScreen(MDScreen):
 
     # ---------- Busca (modal) ----------
     _search_dialog = None
+    _search_event = None   # Clock event do debounce
+    _search_seq = 0        # geração da busca; respostas antigas são descartadas
+    _search_task = None    # tarefa em voo no dispatcher
+    SEARCH_DEBOUNCE = 0.3  # segundos sem digitar antes de consultar o backend
 
     def open_search(self):
         from kivymd.uix.dialog import MDDialog
@@ -50,23 +82,90 @@ class DashboardScreen(MDScreen):
             helper_text="Digite sua pesquisa e pressione Enter",
             helper_text_mode="on_focus",
         )
+        self._search_field.bind(text=self._on_search_text)
+        self._search_field.bind(on_text_validate=self._confirm_search)
         content.add_widget(self._search_field)
 
+        self._search_results = MDBoxLayout(orientation="vertical", spacing=dp(4), adaptive_height=True)
+        content.add_widget(self._search_results)
+
         self._search_dialog = MDDialog(
             title="Buscar",
             type="custom",
             content_cls=content,
             buttons=[
-                MDFlatButton(text="Cancelar", on_release=lambda *_: self._search_dialog.dismiss()),
+                MDFlatButton(text="Cancelar", on_release=self._close_search),
                 MDFlatButton(text="Buscar", on_release=self._confirm_search),
             ],
         )
         self._search_dialog.open()
 
-    def _confirm_search(self, *_):
+    def _on_search_text(self, _field, _text):
+        # Debounce: reagenda a consulta a cada tecla
+        if self._search_event:
+            self._search_event.cancel()
+        from kivy.clock import Clock
+        self._search_event = Clock.schedule_once(lambda *_: self._run_search(), self.SEARCH_DEBOUNCE)
+
+    def _run_search(self):
+        from services.dispatcher import get_dispatcher
+
         query = getattr(self, "_search_field", None)
         text = (query.text or "").strip() if query else ""
-        if hasattr(self._app(), "toast"):
-            self._app().toast(f"Buscando por: {text or 'vazio'}")
+        # Nova geração: qualquer resposta em voo vira obsoleta
+        self._search_seq += 1
+        seq = self._search_seq
+        if self._search_task:
+            self._search_task.cancel()
+            self._search_task = None
+        if not text:
+            self._show_search_results(seq, [])
+            return
+
+        api = self._app().api
+
+        def call():
+            st, data = api.search(text)
+            return data.get("results", []) if st == 200 and isinstance(data, dict) else None
+
+        self._search_task = get_dispatcher().submit(
+            call,
+            lambda results: self._show_search_results(seq, results),
+            lambda err: self._show_search_results(seq, None),
+        )
+
+    def _show_search_results(self, seq: int, results):
+        from kivymd.uix.label import MDLabel
+
+        if seq != self._search_seq:
+            return  # resposta de uma busca já substituída
+        box = getattr(self, "_search_results", None)
+        if box is None:
+            return
+        box.clear_widgets()
+        if results is None:
+            box.add_widget(MDLabel(text="Falha ao buscar.", adaptive_height=True))
+            return
+        if not results and self._search_field.text.strip():
+            box.add_widget(MDLabel(text="Nenhum resultado.", adaptive_height=True))
+        for r in results:
+            prefix = "Esporte" if r.get("type") == "sport" else "Usuário"
+            box.add_widget(MDLabel(text=f"{prefix}: {r.get('label', '')}", adaptive_height=True))
+
+    def _confirm_search(self, *_):
+        # Enter/Buscar: consulta imediatamente, sem esperar o debounce
+        if self._search_event:
+            self._search_event.cancel()
+            self._search_event = None
+        self._run_search()
+
+    def _close_search(self, *_):
+        if self._search_event:
+            self._search_event.cancel()
+            self._search_event = None
+        self._search_seq += 1  # descarta respostas pendentes
+        if self._search_task:
+            self._search_task.cancel()
+            self._search_task = None
         if self._search_dialog:
-            self._search_dialog.dismiss()
\ No newline at end of file
+            self._search_dialog.dismiss()
@@ -2,72 +2,133 @@
 from kivy.uix.screenmanager import Screen
 from kivy.app import App
 from kivy.clock import Clock
-from components.checkbox_item import MDCheckboxItem
+from components.checkbox_item import MDCheckboxItem  # noqa: F401 (registra viewclass no Factory)
+from services.dispatcher import get_dispatcher
+from services.frame_monitor import frame_monitor
+from services.repository import FAVORITES_COUNT
+from ui.icons import sport_icon
+
+# (chave, nome) — a chave é a mesma do catálogo do backend e o id no atlas de ícones
+ESPORTES = [
+    ("futebol", "Futebol"),
+    ("volei", "Vôlei"),
+    ("basquete", "Basquete"),
+    ("tenis", "Tênis"),
+    ("natacao", "Natação"),
+    ("corrida", "Corrida"),
+    ("caminhada", "Caminhada"),
+    ("skate", "Skate"),
+    ("bmx", "BMX"),
+    ("badminton", "Badminton"),
+    ("jiujitsu", "Jiu-Jitsu"),
+    ("judo", "Judô"),
+    ("karate", "Karatê"),
+    ("boxe", "Boxe"),
+    ("muaythai", "Muay Thai"),
+    ("yoga", "Yoga"),
+    ("pilates", "Pilates"),
+    ("crossfit", "Crossfit"),
+    ("ciclismo", "Ciclismo"),
+    ("surf", "Surf"),
+    ("escalada", "Escalada"),
+    ("rugby", "Rugby"),
+    ("beisebol", "Beisebol"),
+    ("handebol", "Handebol"),
+    ("tenisdemesa", "Tênis de mesa"),
+    ("golfe", "Golfe"),
+    ("hoquei", "Hóquei"),
+    ("esgrima", "Esgrima"),
+]
+
+
+class SportSelection:
+    """Modelo de seleção, independente dos widgets reciclados."""
+
+    def __init__(self):
+        self._keys = set()
+
+    def set(self, key: str, value: bool):
+        if value:
+            self._keys.add(key)
+        else:
+            self._keys.discard(key)
+
+    def is_selected(self, key: str) -> bool:
+        return key in self._keys
+
+    def replace(self, keys):
+        self._keys = set(keys)
+
+    def keys(self, catalog=ESPORTES):
+        return [key for key, _ in self.selected(catalog)]
+
+    def selected(self, catalog=ESPORTES):
+        """Itens selecionados na ordem do catálogo."""
+        return [item for item in catalog if item[0] in self._keys]
+
+    def __len__(self):
+        return len(self._keys)
 
 
 class ChooseSportsScreen(Screen):
-    def on_pre_enter(self, *args):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.selection = SportSelection()
+        self.catalog = ESPORTES
 
+    def on_pre_enter(self, *args):
         """
         Chamado antes da tela entrar.
-        Aqui limpamos e repovoamos a lista de esportes.
+        Os dados são montados só na 1ª entrada; o RecycleView reaproveita as views.
+        Catálogo e favoritos vêm do armazenamento local; o catálogo é atualizado em background.
         """
-        esportes = [
-            ("Futebol", "assets/icons/futebol.png"),
-            ("Vôlei", "assets/icons/volei.png"),
-            ("Basquete", "assets/icons/basquete.png"),
-            ("Tênis", "assets/icons/tenis.png"),
-            ("Natação", "assets/icons/natacao.png"),
-            ("Corrida", "assets/icons/corrida.png"),
-            ("Caminhada", "assets/icons/caminhada.png"),
-            ("Skate", "assets/icons/skate.png"),
-            ("BMX", "assets/icons/bmx.png"),
-            ("Badminton", "assets/icons/badminton.png"),
-            ("Jiu-Jitsu", "assets/icons/jiujitsu.png"),
-            ("Judô", "assets/icons/judo.png"),
-            ("Karatê", "assets/icons/karate.png"),
-            ("Boxe", "assets/icons/boxe.png"),
-            ("Muay Thai", "assets/icons/muaythai.png"),
-            ("Yoga", "assets/icons/yoga.png"),
-            ("Pilates", "assets/icons/pilates.png"),
-            ("Crossfit", "assets/icons/crossfit.png"),
-            ("Ciclismo", "assets/icons/ciclismo.png"),
-            ("Surf", "assets/icons/surf.png"),
-            ("Escalada", "assets/icons/escalada.png"),
-            ("Rugby", "assets/icons/rugby.png"),
-            ("Beisebol", "assets/icons/beisebol.png"),
-            ("Handebol", "assets/icons/handebol.png"),
-            ("Tênis de mesa", "assets/icons/tenisdemesa.png"),
-            ("Golfe", "assets/icons/golfe.png"),
-            ("Hóquei", "assets/icons/hoquei.png"),
-            ("Esgrima", "assets/icons/esgrima.png"),
-        ]
-
-        # Garante que o id existe (caso o KV mude)        
+        # Garante que o id existe (caso o KV mude)
         lista = getattr(self.ids, "lista_esportes", None)
         if not lista:
             App.get_running_app().toast("Erro: container 'lista_esportes' não encontrado.")
             return
 
-        lista.clear_widgets()
-        for nome, icone in esportes:
-            lista.add_widget(MDCheckboxItem(text=nome, icon_path=icone))
+        if not lista.data:
+            repo = App.get_running_app().repo
+            self.catalog = repo.sports_catalog(default=ESPORTES)
+            self.selection.replace(repo.favorites())
+            self._fill(lista)
+            repo.refresh_sports_catalog(on_update=self._on_catalog, owner=self)
 
-        Clock.schedule_once(lambda *_: App.get_running_app().toast("Selecione pelo menos 3 esportes"), 0)
+        Clock.schedule_once(lambda *_: App.get_running_app().toast(f"Selecione {FAVORITES_COUNT} esportes"), 0)
 
-    def confirmar_escolhas(self):
+    def _fill(self, lista):
+        with frame_monitor.operation("sports:fill"):
+            lista.data = [
+                {"key": key, "text": nome, "icon_path": sport_icon(key), "selection": self.selection}
+                for key, nome in self.catalog
+            ]
+        # O RecycleView cria/atualiza as views no próximo layout
+        frame_monitor.hold("sports:layout", 0.1)
+
+    def _on_catalog(self, catalog):
+        self.catalog = catalog
         lista = getattr(self.ids, "lista_esportes", None)
-        if not lista:
-            App.get_running_app().toast("Erro: container 'lista_esportes' não encontrado.")
-            return
+        if lista:
+            self._fill(lista)
+
+    def reload_favorites(self):
+        """Volta a seleção para os favoritos locais (ex.: servidor recusou a última escolha)."""
+        self.selection.replace(App.get_running_app().repo.favorites())
+        lista = getattr(self.ids, "lista_esportes", None)
+        if lista and lista.data:
+            lista.refresh_from_data()
 
-        selecionados = []
-        for item in lista.children:
-            if hasattr(item, "active") and item.active:
-                selecionados.append(item.text)
+    def on_leave(self, *args):
+        get_dispatcher().cancel_owner(self)
+
+    def confirmar_escolhas(self):
+        selecionados = [nome for _, nome in self.selection.selected(self.catalog)]
 
-        if len(selecionados) < 3:
-            App.get_running_app().toast("Escolha pelo menos 3 esportes")
+        if len(selecionados) != FAVORITES_COUNT:
+            App.get_running_app().toast(f"Escolha exatamente {FAVORITES_COUNT} esportes")
         else:
+            # Salva local na hora; o envio ao backend vai pela fila de sincronização
+            App.get_running_app().repo.set_favorites(self.selection.keys(self.catalog))
             App.get_running_app().toast(f"Selecionados: {', '.join(selecionados)}")
             self.manager.current = "home"
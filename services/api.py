@@ -1,57 +1,250 @@
 # services/api.py
+import time
+import uuid
+import threading
+from contextlib import contextmanager
 import httpx
-from typing import Optional, Dict, Any, Tuple
-from services.session import load_tokens, save_tokens, clear_tokens, TokenBundle
+from typing import Optional, Dict, Any, Iterator, Tuple
+from services.session import token_store, TokenBundle, jwt_expiry
+from services.startup_profile import profiler
+from services.http_cache import ResponseCache
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa
+        return True
+    except Exception:
+        return False
+
+
+class RequestStats:
+    """Tempo por endpoint ("GET /me"): contagem, média, máximo e falhas de rede."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, float]] = {}
+
+    def record(self, key: str, elapsed_ms: float, ok: bool = True):
+        with self._lock:
+            d = self._data.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "errors": 0})
+            d["count"] += 1
+            d["total_ms"] += elapsed_ms
+            d["max_ms"] = max(d["max_ms"], elapsed_ms)
+            if not ok:
+                d["errors"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                k: {**d, "avg_ms": round(d["total_ms"] / d["count"], 2) if d["count"] else 0.0}
+                for k, d in self._data.items()
+            }
+
 
 class ApiClient:
-    def __init__(self, base_url: str = "http://127.0.0.1:8000"):
+    """
+    Cliente único do app: um httpx.Client de longa duração (pool + keep-alive,
+    HTTP/2 se o pacote h2 estiver instalado), seguro para uso entre threads.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8000", http2: Optional[bool] = None,
+                 cache_ttls: Optional[Dict[str, float]] = None):
         self.base_url = base_url.rstrip("/")
-        self._tokens = load_tokens()
+        # Leitura do keyring em background: não segura o primeiro frame
+        with profiler.phase("load_tokens (async start)", cat="io"):
+            token_store.start_load()
+        self.stats = RequestStats()
+        self.cache = ResponseCache(cache_ttls)  # GETs: TTL por endpoint + ETag
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            http2=_http2_available() if http2 is None else http2,
+            timeout=15,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60),
+        )
+        # Refresh único em voo (single-flight) + timer de refresh antes do exp
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._closed = False
+        token_store.add_listener(self._schedule_refresh)
+
+    def close(self):
+        self._closed = True
+        self._cancel_refresh_timer()
+        self._client.close()
+        token_store.flush(timeout=2)
+
+    def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Envia pelo cliente compartilhado e registra o tempo em self.stats."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            r = self._client.request(method, path, **kwargs)
+            ok = True
+            return r
+        finally:
+            self.stats.record(f"{method.upper()} {path}", (time.perf_counter() - start) * 1000, ok)
+
+    @property
+    def _tokens(self) -> TokenBundle:
+        return token_store.get()
 
     @property
     def authorized(self) -> bool:
-        return bool(self._tokens and self._tokens.access_token)
+        return bool(self._tokens.access_token)
 
     def _auth_headers(self) -> Dict[str, str]:
-        if self._tokens and self._tokens.access_token:
-            return {"Authorization": f"Bearer {self._tokens.access_token}"}
+        access = self._tokens.access_token
+        if access:
+            return {"Authorization": f"Bearer {access}"}
         return {}
 
     def _save(self, access: Optional[str], refresh: Optional[str]):
-        if access or refresh:
-            if access: self._tokens.access_token = access
-            if refresh: self._tokens.refresh_token = refresh
-            save_tokens(self._tokens)
+        # Memória na hora; keyring/arquivo em segundo plano
+        token_store.update(access, refresh)
+
+    # -----------------------
+    # Refresh do access token
+    # -----------------------
+    REFRESH_MARGIN = 60       # segundos antes do exp para renovar
+    REFRESH_RETRY = 30        # sem rede: tenta de novo depois disso
+    REFRESH_WAIT = 10         # quanto um request espera por um refresh em andamento
+
+    def _cancel_refresh_timer(self):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
 
-    def _refresh_if_needed(self) -> bool:
-        if not self._tokens or not self._tokens.refresh_token:
+    def _schedule_refresh(self, tokens: TokenBundle, delay: Optional[float] = None):
+        """Listener do token_store: agenda o refresh para REFRESH_MARGIN antes do exp."""
+        self._cancel_refresh_timer()
+        if self._closed or not tokens.refresh_token:
+            return
+        if delay is None:
+            exp = jwt_expiry(tokens.access_token)
+            if exp is None:
+                return  # token opaco: fica só o refresh reativo (401)
+            delay = max(0.0, exp - self.REFRESH_MARGIN - time.time())
+        timer = threading.Timer(delay, self._refresh_if_needed, args=(tokens.access_token,))
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _expiring(self, access: Optional[str]) -> bool:
+        exp = jwt_expiry(access)
+        return exp is not None and exp - time.time() < self.REFRESH_MARGIN
+
+    def _ensure_fresh(self):
+        """Antes de um request autenticado: renova se está para expirar ou espera o refresh em voo."""
+        access = self._tokens.access_token
+        if access and self._expiring(access):
+            self._refresh_if_needed(access)
+        elif self._refresh_lock.locked():
+            if self._refresh_lock.acquire(timeout=self.REFRESH_WAIT):
+                self._refresh_lock.release()
+
+    def _refresh_if_needed(self, stale_access: Optional[str] = None) -> bool:
+        """
+        Single-flight: quem chega durante um refresh espera por ele e reaproveita
+        o resultado. `stale_access` é o token que o chamador viu; se já mudou, nada a fazer.
+        """
+        if not self._refresh_lock.acquire(timeout=self.REFRESH_WAIT):
             return False
         try:
-            r = httpx.post(f"{self.base_url}/auth/refresh", params={"refresh_token": self._tokens.refresh_token}, timeout=10)
-            r.raise_for_status()
+            tokens = self._tokens
+            if stale_access is not None and tokens.access_token and tokens.access_token != stale_access:
+                return True
+            if not tokens.refresh_token:
+                return False
+            try:
+                r = self._send("POST", "/auth/refresh", params={"refresh_token": tokens.refresh_token}, timeout=10)
+            except httpx.RequestError:
+                # Sem rede: mantém a sessão e tenta mais tarde
+                self._schedule_refresh(tokens, delay=self.REFRESH_RETRY)
+                return False
+            if r.status_code != 200:
+                if 400 <= r.status_code < 500:
+                    token_store.clear()  # refresh token recusado: sessão acabou
+                else:
+                    self._schedule_refresh(tokens, delay=self.REFRESH_RETRY)
+                return False
             data = r.json()
             self._save(data.get("access_token"), data.get("refresh_token"))
             return True
-        except Exception:
-            clear_tokens()
-            self._tokens = TokenBundle()
-            return False
+        finally:
+            self._refresh_lock.release()
 
-    def request(self, method: str, path: str, *, json: Any = None, params: Dict[str, Any] = None, require_auth=False) -> Tuple[int, Any]:
-        url = f"{self.base_url}{path}"
+    # Tentativas extras em falha de rede, só para chamadas seguras de repetir
+    NETWORK_RETRIES = 2
+
+    @staticmethod
+    def new_idempotency_key() -> str:
+        return uuid.uuid4().hex
+
+    def request(self, method: str, path: str, *, json: Any = None, params: Dict[str, Any] = None, require_auth=False,
+                idempotency_key: Optional[str] = None, cache: bool = True) -> Tuple[int, Any]:
+        if require_auth:
+            self._ensure_fresh()
         headers = self._auth_headers() if require_auth else {}
+        sent_access = headers.get("Authorization", "")[len("Bearer "):] or None
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        is_get = method.upper() == "GET"
+        retries = self.NETWORK_RETRIES if (is_get or idempotency_key) else 0
+
+        def exchange(extra_headers: Dict[str, str]):
+            return self._exchange(method, path, json, params, {**headers, **extra_headers},
+                                  require_auth, sent_access, retries)
+
+        if is_get and cache:
+            return self.cache.get(self.cache.key(path, params, sent_access), path, exchange)
+        status, data, _ = exchange({})
+        return status, data
+
+    @contextmanager
+    def stream(self, method: str, path: str, *, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+               timeout: Any = None, require_auth: bool = False) -> Iterator[httpx.Response]:
+        """
+        Request com o corpo lido aos poucos (ex.: SSE em /me/events); fecha a resposta ao sair.
+        Com require_auth, renova a sessão antes se preciso e repete uma vez após um 401.
+        """
+        if require_auth:
+            self._ensure_fresh()
+        auth = self._auth_headers() if require_auth else {}
+        sent_access = auth.get("Authorization", "")[len("Bearer "):] or None
+        with self._client.stream(method, path, params=params, headers={**(headers or {}), **auth},
+                                 timeout=timeout) as r:
+            if not (r.status_code == 401 and require_auth):
+                yield r
+                return
+        if not self._refresh_if_needed(sent_access):
+            # Sessão acabou (ou sem rede para renovar): devolve um 401 sintético ao chamador
+            yield httpx.Response(401, request=r.request)
+            return
+        with self._client.stream(method, path, params=params, headers={**(headers or {}), **self._auth_headers()},
+                                 timeout=timeout) as r:
+            yield r
+
+    def _exchange(self, method, path, json, params, headers, require_auth, sent_access, retries):
+        """Uma ida ao servidor (retries de rede + refresh no 401). Retorna (status, dados, headers)."""
         try:
-            r = httpx.request(method, url, json=json, params=params, headers=headers, timeout=15)
+            for attempt in range(retries + 1):
+                try:
+                    r = self._send(method, path, json=json, params=params, headers=headers)
+                    break
+                except httpx.TransportError:
+                    if attempt >= retries:
+                        raise
             if r.status_code == 401 and require_auth:
-                # tenta refresh
-                if self._refresh_if_needed():
-                    headers = self._auth_headers()
-                    r = httpx.request(method, url, json=json, params=params, headers=headers, timeout=15)
+                # tenta refresh (ou aproveita o que outra thread acabou de fazer)
+                if self._refresh_if_needed(sent_access):
+                    headers = {**headers, **self._auth_headers()}
+                    r = self._send(method, path, json=json, params=params, headers=headers)
             status = r.status_code
             data = r.json() if r.headers.get("content-type", "").startswith("application/json") else r.text
-            return status, data
+            return status, data, r.headers
         except httpx.RequestError as e:
-            return 0, {"error": f"Falha de rede: {e}"}
+            return 0, {"error": f"Falha de rede: {e}"}, {}
 
     # ------ Endpoints ------
     def login(self, email: str, password: str):
@@ -60,18 +253,38 @@ class ApiClient:
             self._save(data.get("access_token"), data.get("refresh_token"))
         return st, data
 
-    def signup(self, name: str, email: str, password: str):
-        st, data = self.request("POST", "/auth/signup", json={"name": name, "email": email, "password": password})
+    def signup(self, email: str, password: str, name: Optional[str] = None, idempotency_key: Optional[str] = None):
+        body = {"email": email, "password": password}
+        if name:
+            body["name"] = name
+        st, data = self.request("POST", "/auth/signup", json=body,
+                                idempotency_key=idempotency_key or self.new_idempotency_key())
         if st == 200:
             self._save(data.get("access_token"), data.get("refresh_token"))
         return st, data
 
+    def verify_email(self, email: str, token: str):
+        return self.request("POST", "/auth/verify-email", json={"email": email, "token": token})
+
+    def resend_token(self, email: str, idempotency_key: Optional[str] = None):
+        return self.request("POST", "/auth/resend-token", json={"email": email},
+                            idempotency_key=idempotency_key or self.new_idempotency_key())
+
     def forgot(self, email: str):
         return self.request("POST", "/auth/forgot", params={"email": email})
 
     def me(self):
         return self.request("GET", "/me", require_auth=True)
 
+    def dashboard(self, cache: bool = True):
+        return self.request("GET", "/me/dashboard", require_auth=True, cache=cache)
+
+    def sports(self):
+        return self.request("GET", "/sports")
+
+    def search(self, query: str, limit: int = 20):
+        return self.request("GET", "/search", params={"q": query, "limit": limit})
+
     def logout(self):
-        clear_tokens()
-        self._tokens = TokenBundle()
\ No newline at end of file
+        token_store.clear()
+        self.cache.invalidate()
\ No newline at end of file
@@ -0,0 +1,32 @@
+# services/debug_flags.py
+"""
+Ativação dos modos de debug opcionais (startup_profile, frame_monitor, leak_monitor).
+
+Sem import do Kivy: estes módulos são importados no topo do main.py, e a flag
+precisa sair do sys.argv antes de o Kivy ler a linha de comando.
+"""
+import os
+import sys
+from typing import Optional
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+def env_flag(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in _TRUE
+
+
+def output_path(flag: str, env_var: str, default_path: str) -> Optional[str]:
+    """
+    Caminho de saída se o modo foi pedido, senão None.
+    `--flag[=caminho]` (removida do sys.argv) ou env_var=1 / env_var=caminho.
+    """
+    for i, arg in enumerate(list(sys.argv[1:]), start=1):
+        if arg == flag or arg.startswith(flag + "="):
+            del sys.argv[i]
+            return arg.partition("=")[2] or default_path
+    val = (os.getenv(env_var) or "").strip()
+    if not val or val.lower() in _FALSE:
+        return None
+    return default_path if val.lower() in _TRUE else val
@@ -0,0 +1,104 @@
+# services/dispatcher.py
+"""
+Despacha chamadas bloqueantes (rede, disco) para threads de trabalho e entrega o
+resultado na thread principal do Kivy via Clock.schedule_once.
+
+    task = dispatcher.submit(lambda: api.login(email, pw), on_result, on_error, owner=self)
+    dispatcher.cancel_owner(self)   # ex.: no on_leave da tela
+
+Cancelar uma tarefa impede o callback; se ela ainda estiver na fila, nem executa.
+(Uma chamada HTTP já em andamento termina em segundo plano, mas seu resultado é descartado.)
+"""
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+class Task:
+    __slots__ = ("_future", "_cancelled", "__weakref__")
+
+    def __init__(self):
+        self._future: Optional[Future] = None
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def cancel(self):
+        self._cancelled = True
+        if self._future is not None:
+            self._future.cancel()  # só tem efeito se ainda não começou
+
+
+class RequestDispatcher:
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api")
+        self._lock = threading.Lock()
+        # owner -> tarefas pendentes (weak: tela descartada não fica presa aqui)
+        self._by_owner: "weakref.WeakKeyDictionary[Any, weakref.WeakSet]" = weakref.WeakKeyDictionary()
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        owner: Any = None,
+    ) -> Task:
+        task = Task()
+
+        def deliver(fut: Future):
+            if task.cancelled or fut.cancelled():
+                return
+            err = fut.exception()
+
+            def on_main(_dt):
+                if task.cancelled:
+                    return
+                try:
+                    if err is not None:
+                        if on_error:
+                            on_error(err)
+                        else:
+                            Logger.exception(f"Dispatcher: erro em tarefa: {err!r}")
+                    elif on_result:
+                        on_result(fut.result())
+                except Exception as e:
+                    Logger.exception(f"Dispatcher: erro no callback: {e}")
+
+            Clock.schedule_once(on_main, 0)
+
+        task._future = self._executor.submit(fn)
+        if owner is not None:
+            with self._lock:
+                self._by_owner.setdefault(owner, weakref.WeakSet()).add(task)
+        task._future.add_done_callback(deliver)
+        return task
+
+    def cancel_owner(self, owner: Any) -> int:
+        """Cancela todas as tarefas pendentes de um dono. Retorna quantas foram canceladas."""
+        with self._lock:
+            tasks = list(self._by_owner.pop(owner, ()))
+        # Inclui tarefas já concluídas cujo callback ainda não rodou na thread principal
+        pending = [t for t in tasks if not t.cancelled]
+        for t in pending:
+            t.cancel()
+        return len(pending)
+
+
+_dispatcher: Optional[RequestDispatcher] = None
+
+
+def get_dispatcher() -> RequestDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = RequestDispatcher()
+    return _dispatcher
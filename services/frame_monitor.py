@@ -0,0 +1,248 @@
+# services/frame_monitor.py
+"""
+Monitor de tempo de frame (jank) do cliente Kivy. Desligado por padrão.
+
+Ativação (uma das duas):
+    python main.py --frame-monitor[=frame_report.json]
+    JOGAMOS_FRAME_MONITOR=1 (ou =caminho.json) python main.py
+F12 liga/desliga um overlay com FPS, p95 e % de frames lentos.
+O relatório (histogramas por tela/operação + piores frames) é gravado ao fechar o app.
+
+Marcando operações (sem custo quando desligado):
+    with frame_monitor.operation("sports:fill"):     # trabalho síncrono
+        ...
+    frame_monitor.hold("dialog:loader", 0.3)         # animação que ocupa os próximos frames
+"""
+import heapq
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from services import debug_flags
+
+DEFAULT_PATH = "frame_report.json"
+_FLAG = "--frame-monitor"
+
+TARGET_FPS = 60
+FRAME_BUDGET_MS = 1000.0 / TARGET_FPS
+JANK_MS = FRAME_BUDGET_MS * 2  # perdeu pelo menos um vsync inteiro
+BUCKETS_MS = (8.3, 16.7, 25.0, 33.3, 50.0, 100.0, 250.0, 500.0)  # limites superiores; o último balde é "acima"
+
+
+class _Histogram:
+    __slots__ = ("counts", "total_ms", "max_ms", "jank")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.jank = 0
+
+    def add(self, ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if ms > JANK_MS:
+            self.jank += 1
+
+    @property
+    def frames(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, p: float) -> float:
+        """Aproximação pelo limite superior do balde."""
+        n = self.frames
+        if not n:
+            return 0.0
+        target = p * n
+        acc = 0
+        for i, c in enumerate(self.counts):
+            acc += c
+            if acc >= target:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        n = self.frames
+        labels = [f"<={b}" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "frames": n,
+            "avg_ms": round(self.total_ms / n, 2) if n else 0.0,
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 2),
+            "jank_frames": self.jank,
+            "jank_pct": round(100.0 * self.jank / n, 2) if n else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class FrameMonitor:
+    WORST_KEPT = 50
+
+    def __init__(self, output_path: Optional[str]):
+        self.output_path = output_path
+        self.enabled = output_path is not None
+        self._app = None
+        self._last: Optional[float] = None
+        self._t0 = time.perf_counter()
+        self._active: Dict[str, int] = {}         # operações em andamento (contador p/ aninhar)
+        self._touched: Set[str] = set()           # operações que rodaram durante o frame atual
+        self._holds: Dict[str, float] = {}        # operação -> até quando (perf_counter)
+        self._by_tag: Dict[Tuple[str, str], _Histogram] = {}
+        self._overall = _Histogram()
+        self._worst: List[Tuple[float, int, Dict[str, Any]]] = []  # min-heap dos piores
+        self._seq = 0
+        self._overlay = None
+        self._recent: List[float] = []
+
+    # -----------------------
+    # Ciclo de vida
+    # -----------------------
+    def start(self, app):
+        """Chamado no on_start do App: passa a medir todos os frames."""
+        if not self.enabled or self._app is not None:
+            return
+        from kivy.clock import Clock
+        from kivy.core.window import Window
+        self._app = app
+        self._last = time.perf_counter()
+        Clock.schedule_interval(self._tick, 0)  # 0 = todo frame
+        Window.bind(on_key_down=self._on_key_down)
+
+    def stop(self) -> Optional[str]:
+        if not self.enabled or self._app is None:
+            return None
+        path = self.write()
+        self._app = None
+        return path
+
+    # -----------------------
+    # Marcação de operações
+    # -----------------------
+    def operation(self, name: str):
+        """Context manager: frames que passarem por este trecho levam a tag `name`."""
+        if not self.enabled:
+            return nullcontext()
+        return self._operation(name)
+
+    @contextmanager
+    def _operation(self, name: str):
+        self._active[name] = self._active.get(name, 0) + 1
+        self._touched.add(name)
+        try:
+            yield
+        finally:
+            n = self._active.get(name, 1) - 1
+            if n > 0:
+                self._active[name] = n
+            else:
+                self._active.pop(name, None)
+
+    def hold(self, name: str, seconds: float):
+        """Marca os frames dos próximos `seconds` (ex.: animação de dialog/transição)."""
+        if self.enabled:
+            self._holds[name] = max(self._holds.get(name, 0.0), time.perf_counter() + seconds)
+            self._touched.add(name)
+
+    # -----------------------
+    # Medição
+    # -----------------------
+    def _current_screen(self) -> str:
+        root = getattr(self._app, "root", None)
+        return getattr(root, "current", None) or "-"
+
+    def _tick(self, _dt):
+        now = time.perf_counter()
+        ms = (now - self._last) * 1000.0
+        self._last = now
+
+        self._holds = {k: v for k, v in self._holds.items() if v >= now}
+        ops = sorted(set(self._active) | self._touched | set(self._holds))
+        self._touched = set()
+        screen = self._current_screen()
+        op = "+".join(ops) or "-"
+
+        self._overall.add(ms)
+        hist = self._by_tag.get((screen, op))
+        if hist is None:
+            hist = self._by_tag[(screen, op)] = _Histogram()
+        hist.add(ms)
+
+        self._seq += 1
+        if ms > FRAME_BUDGET_MS:
+            frame = {"ms": round(ms, 2), "t_s": round(now - self._t0, 3), "screen": screen, "op": op}
+            item = (ms, self._seq, frame)
+            if len(self._worst) < self.WORST_KEPT:
+                heapq.heappush(self._worst, item)
+            elif ms > self._worst[0][0]:
+                heapq.heapreplace(self._worst, item)
+
+        if self._overlay is not None:
+            self._recent.append(ms)
+
+    # -----------------------
+    # Relatório
+    # -----------------------
+    def report(self) -> Dict[str, Any]:
+        return {
+            "target_fps": TARGET_FPS,
+            "jank_threshold_ms": round(JANK_MS, 2),
+            "overall": self._overall.to_dict(),
+            "by_screen_op": [
+                {"screen": screen, "op": op, **hist.to_dict()}
+                for (screen, op), hist in sorted(self._by_tag.items(), key=lambda kv: -kv[1].jank)
+            ],
+            "worst_frames": [f for _, _, f in sorted(self._worst, reverse=True)],
+        }
+
+    def write(self) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=1)
+        return self.output_path
+
+    # -----------------------
+    # Overlay (F12)
+    # -----------------------
+    def _on_key_down(self, _window, key, *_args):
+        if key == 293:  # F12
+            self.toggle_overlay()
+            return True
+        return False
+
+    def toggle_overlay(self):
+        from kivy.clock import Clock
+        from kivy.core.window import Window
+        from kivy.uix.label import Label
+
+        if self._overlay is not None:
+            Window.remove_widget(self._overlay)
+            self._overlay_event.cancel()
+            self._overlay = None
+            return
+        self._overlay = Label(
+            size_hint=(None, None), size=(360, 24), pos=(8, 8),
+            color=(1, 0.2, 0.2, 1), halign="left", valign="middle",
+        )
+        self._overlay.text_size = self._overlay.size
+        Window.add_widget(self._overlay)
+        self._recent = []
+        self._overlay_event = Clock.schedule_interval(self._update_overlay, 0.5)
+
+    def _update_overlay(self, _dt):
+        frames, self._recent = self._recent, []
+        if not frames or self._overlay is None:
+            return
+        frames.sort()
+        fps = 1000.0 * len(frames) / sum(frames)
+        p95 = frames[min(len(frames) - 1, int(0.95 * len(frames)))]
+        jank = 100.0 * sum(1 for f in frames if f > JANK_MS) / len(frames)
+        self._overlay.text = f"{fps:5.1f} fps  p95 {p95:5.1f} ms  lentos {jank:4.1f}%  [{self._current_screen()}]"
+
+
+frame_monitor = FrameMonitor(debug_flags.output_path(_FLAG, "JOGAMOS_FRAME_MONITOR", DEFAULT_PATH))
@@ -0,0 +1,150 @@
+# services/http_cache.py
+"""
+Cache de respostas GET do ApiClient.
+
+- TTL por endpoint (path exato, ou subárvore com "/" no fim): dentro do TTL responde da memória.
+- Vencido: revalida com If-None-Match / If-Modified-Since; 304 reaproveita o corpo.
+- GETs idênticos simultâneos viram uma única chamada de rede (os demais esperam).
+- stats() mostra acertos, revalidações e quanto tráfego foi economizado.
+- Quem chama recebe uma cópia: alterar o resultado não mexe no que está guardado.
+"""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.session import jwt_claims
+
+# (status, dados, headers da resposta)
+Fetched = Tuple[int, Any, Dict[str, str]]
+
+# Path -> segundos sem revalidar. Chave terminada em "/" vale para todos os paths abaixo dela
+# (o mais longo ganha). Sem entrada: 0 (sempre revalida se houver validador).
+DEFAULT_TTLS = {
+    "/sports": 24 * 3600,  # catálogo quase nunca muda
+    "/me": 30,
+    "/me/dashboard": 30,   # o push invalida a cópia a cada delta; o TTL só cobre o app sem push
+    "/me/events": 0,       # SSE: stream, nunca cacheado
+    "/search": 10,
+}
+
+
+class _Entry:
+    __slots__ = ("status", "data", "etag", "last_modified", "stored_at")
+
+    def __init__(self, status, data, etag, last_modified):
+        self.status = status
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+
+
+class ResponseCache:
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 256):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "coalesced": 0}
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]], auth: Optional[str]) -> str:
+        # Usuário = `sub` do JWT (o mesmo entre refreshes, que trocam o token a cada 15 min);
+        # token opaco entra como hash. Respostas de usuários diferentes nunca se misturam.
+        sub = jwt_claims(auth).get("sub") if auth else None
+        if sub is not None:
+            user = f"sub:{sub}"
+        else:
+            user = hashlib.sha1(auth.encode()).hexdigest()[:12] if auth else "-"
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params)) if params else ""
+        return f"{user} {path}?{query}"
+
+    def ttl_for(self, path: str) -> float:
+        if path in self.ttls:
+            return self.ttls[path]
+        best = ""
+        for prefix in self.ttls:
+            if prefix.endswith("/") and path.startswith(prefix) and len(prefix) > len(best):
+                best = prefix
+        return self.ttls[best] if best else 0
+
+    def get(self, key: str, path: str, fetch: Callable[[Dict[str, str]], Fetched]) -> Tuple[int, Any]:
+        """
+        Devolve (status, dados) do cache ou de `fetch(headers_condicionais)`.
+        Só respostas 200 são guardadas; os dados devolvidos são sempre uma cópia.
+        """
+        status, data = self._get(key, path, fetch)
+        return status, copy.deepcopy(data)
+
+    def _get(self, key: str, path: str, fetch: Callable[[Dict[str, str]], Fetched]) -> Tuple[int, Any]:
+        leader = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at < self.ttl_for(path):
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry.status, entry.data
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self._stats["coalesced"] += 1
+            else:
+                pending = self._inflight[key] = Future()
+                leader = True
+        if not leader:
+            return pending.result()  # espera a chamada que já está em voo
+
+        try:
+            result = self._fetch(key, entry, fetch)
+            pending.set_result(result)
+            return result
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _fetch(self, key: str, entry: Optional[_Entry], fetch) -> Tuple[int, Any]:
+        conditional = {}
+        if entry is not None:
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+        status, data, headers = fetch(conditional)
+
+        with self._lock:
+            if status == 304 and entry is not None:
+                entry.stored_at = time.monotonic()
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self._stats["revalidated"] += 1
+                return entry.status, entry.data
+            self._stats["misses"] += 1
+            if status == 200:
+                self._entries[key] = _Entry(status, data, headers.get("etag"), headers.get("last-modified"))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return status, data
+
+    def invalidate(self, path_prefix: str = ""):
+        """Remove entradas cujo path começa com o prefixo (vazio = tudo)."""
+        with self._lock:
+            for k in [k for k in self._entries if k.split(" ", 1)[1].startswith(path_prefix)]:
+                del self._entries[k]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s = dict(self._stats)
+            s["entries"] = len(self._entries)
+        total = s["hits"] + s["revalidated"] + s["misses"] + s["coalesced"]
+        # Economia: tudo que não baixou corpo novo do servidor
+        s["hit_rate"] = round((s["hits"] + s["revalidated"] + s["coalesced"]) / total, 3) if total else 0.0
+        s["network_saved_rate"] = round((s["hits"] + s["coalesced"]) / total, 3) if total else 0.0
+        return s
@@ -0,0 +1,177 @@
+# services/leak_monitor.py
+"""
+Detecção de vazamento de widgets (modo debug, desligado por padrão).
+
+Ativação (uma das duas):
+    python main.py --leak-check[=leak_report.json]
+    JOGAMOS_LEAK_CHECK=1 (ou =caminho.json) python main.py
+
+- Conta instâncias vivas de Widget por classe (WeakSet: o contador não segura ninguém).
+- checkpoint(rótulo) após hot reload / navegação: gc + contagem + snapshot do
+  tracemalloc, com a diferença em relação ao checkpoint anterior.
+- expect_collected(obj, rótulo): objetos que deveriam morrer (root antigo, tela
+  reconstruída). Se ainda estiverem vivos no próximo checkpoint, vão para o
+  relatório com quem os referencia.
+- Classes cuja contagem só cresce por vários checkpoints seguidos são sinalizadas.
+"""
+import gc
+import json
+import time
+import tracemalloc
+import types
+import weakref
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from services import debug_flags
+
+DEFAULT_PATH = "leak_report.json"
+_FLAG = "--leak-check"
+
+GROWTH_CHECKPOINTS = 3  # crescimento em N checkpoints seguidos = suspeito
+TOP_ALLOCATIONS = 10
+SETTLE_SECONDS = 1.0    # espera animações/Clock antes de contar
+
+
+def _describe(obj: Any) -> str:
+    name = getattr(obj, "name", None) or getattr(obj, "id", None)
+    return f"{type(obj).__module__}.{type(obj).__name__}" + (f"({name!r})" if isinstance(name, str) and name else "")
+
+
+def _referrers(obj: Any, limit: int = 8) -> List[str]:
+    """Quem segura `obj` (um nível; frames desta análise ficam de fora)."""
+    out = []
+    for ref in gc.get_referrers(obj):
+        if isinstance(ref, types.FrameType):
+            continue
+        if isinstance(ref, dict):
+            owners = [o for o in gc.get_referrers(ref) if getattr(o, "__dict__", None) is ref]
+            out.append(f"dict de {_describe(owners[0])}" if owners else f"dict ({len(ref)} chaves)")
+        else:
+            out.append(_describe(ref))
+        if len(out) >= limit:
+            break
+    return out
+
+
+class LeakMonitor:
+    def __init__(self, output_path: Optional[str]):
+        self.output_path = output_path
+        self.enabled = output_path is not None
+        self._widgets: "weakref.WeakSet" = weakref.WeakSet()
+        self._expected: List[Tuple[weakref.ref, str, float]] = []
+        self._reported = set()  # weakrefs já levados a self.survivors
+        self._last_counts: Counter = Counter()
+        self._growth: Counter = Counter()  # checkpoints seguidos em que a classe cresceu
+        self._last_snapshot = None
+        self._pending_label: Optional[str] = None
+        self.checkpoints: List[Dict[str, Any]] = []
+        self.survivors: List[Dict[str, Any]] = []
+        if self.enabled:
+            self._install()
+
+    def _install(self):
+        """Registra toda instância de Widget criada a partir de agora."""
+        from kivy.uix.widget import Widget
+        original = Widget.__init__
+        widgets = self._widgets
+
+        def __init__(self, *args, **kwargs):
+            original(self, *args, **kwargs)
+            widgets.add(self)
+
+        Widget.__init__ = __init__
+        tracemalloc.start(10)
+
+    # -----------------------
+    # API para o app
+    # -----------------------
+    def expect_collected(self, obj: Any, label: str):
+        """`obj` não deveria sobreviver ao próximo checkpoint."""
+        if self.enabled and obj is not None:
+            self._expected.append((weakref.ref(obj), f"{label}: {_describe(obj)}", time.monotonic()))
+
+    def schedule_checkpoint(self, label: str):
+        """Checkpoint após SETTLE_SECONDS (rajadas viram um só, com o rótulo mais recente)."""
+        if not self.enabled:
+            return
+        from kivy.clock import Clock
+        if self._pending_label is None:
+            Clock.schedule_once(lambda *_: self._run_pending(), SETTLE_SECONDS)
+        self._pending_label = label
+
+    def _run_pending(self):
+        label, self._pending_label = self._pending_label, None
+        if label:
+            self.checkpoint(label)
+
+    def checkpoint(self, label: str) -> Dict[str, Any]:
+        gc.collect()
+        counts = Counter(type(w).__name__ for w in list(self._widgets))
+        delta = {k: counts[k] - self._last_counts.get(k, 0)
+                 for k in set(counts) | set(self._last_counts) if counts[k] != self._last_counts.get(k, 0)}
+        for cls in set(counts) | set(self._growth):
+            self._growth[cls] = self._growth[cls] + 1 if delta.get(cls, 0) > 0 else 0
+        growing = sorted(cls for cls, n in self._growth.items() if n >= GROWTH_CHECKPOINTS)
+
+        survivors = []
+        still_expected = []
+        for ref, desc, since in self._expected:
+            obj = ref()
+            if obj is None:
+                continue
+            item = {"object": desc, "alive_s": round(time.monotonic() - since, 1), "referrers": _referrers(obj)}
+            survivors.append(item)
+            if ref not in self._reported:
+                self._reported.add(ref)
+                self.survivors.append(item)
+            still_expected.append((ref, desc, since))
+            del obj
+        self._expected = still_expected
+        self._reported &= {ref for ref, _, _ in still_expected}
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        top = []
+        if self._last_snapshot is not None:
+            for stat in snapshot.compare_to(self._last_snapshot, "lineno")[:TOP_ALLOCATIONS]:
+                frame = stat.traceback[0]
+                top.append({"where": f"{frame.filename}:{frame.lineno}",
+                            "size_diff_kb": round(stat.size_diff / 1024, 1), "count_diff": stat.count_diff})
+        self._last_snapshot = snapshot
+        self._last_counts = counts
+
+        entry = {
+            "label": label,
+            "t": time.strftime("%H:%M:%S"),
+            "widgets_total": sum(counts.values()),
+            "traced_kb": round(tracemalloc.get_traced_memory()[0] / 1024, 1),
+            "delta": dict(sorted(delta.items(), key=lambda kv: -abs(kv[1]))),
+            "growing": growing,
+            "survivors": survivors,
+            "top_allocations": top,
+        }
+        self.checkpoints.append(entry)
+        self._log(entry)
+        return entry
+
+    def _log(self, entry: Dict[str, Any]):
+        from kivy.logger import Logger
+        Logger.info(f"Leak: [{entry['label']}] {entry['widgets_total']} widgets, "
+                    f"{entry['traced_kb']} KB rastreados, delta {entry['delta']}")
+        for s in entry["survivors"]:
+            Logger.warning(f"Leak: ainda vivo após {s['alive_s']}s: {s['object']} <- {s['referrers']}")
+        if entry["growing"]:
+            Logger.warning(f"Leak: contagem só cresce há {GROWTH_CHECKPOINTS}+ checkpoints: {entry['growing']}")
+
+    def write(self) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump({"checkpoints": self.checkpoints, "survivors": self.survivors}, f, ensure_ascii=False, indent=1)
+        return self.output_path
+
+
+leak_monitor = LeakMonitor(debug_flags.output_path(_FLAG, "JOGAMOS_LEAK_CHECK", DEFAULT_PATH))
@@ -0,0 +1,134 @@
+# services/local_store.py
+"""
+Armazenamento local (SQLite) do app: cache de leitura + fila de saída durável.
+
+- cache: chave -> JSON (perfil, catálogo de esportes, favoritos).
+- outbox: escritas pendentes para o backend; sobrevivem a reinício do app.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    body TEXT,
+    dedupe_key TEXT,
+    idempotency_key TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_next ON outbox (next_attempt_at);
+"""
+
+
+def default_path() -> str:
+    """Pasta de dados do app (Kivy) ou ~/.jogamos fora dele."""
+    try:
+        from kivy.app import App
+        app = App.get_running_app()
+        if app is not None:
+            return os.path.join(app.user_data_dir, "jogamos_local.db")
+    except Exception:
+        pass
+    base = os.path.join(os.path.expanduser("~"), ".jogamos")
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, "jogamos_local.db")
+
+
+class LocalStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_path()
+        self._lock = threading.Lock()
+        # Uma conexão compartilhada (UI + worker de sync), serializada pelo lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------ cache ------
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key=?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO cache (key, value, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at",
+                (key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+
+    # ------ outbox ------
+    def enqueue(self, method: str, path: str, body: Any, idempotency_key: str, dedupe_key: Optional[str] = None) -> int:
+        """Grava uma escrita pendente. Com dedupe_key, substitui a pendente anterior (só a última vale)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if dedupe_key:
+                    self._conn.execute("DELETE FROM outbox WHERE dedupe_key=?", (dedupe_key,))
+                cur = self._conn.execute(
+                    "INSERT INTO outbox (method, path, body, dedupe_key, idempotency_key, next_attempt_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (method, path, json.dumps(body, ensure_ascii=False), dedupe_key, idempotency_key, now, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return cur.lastrowid
+
+    def due(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, method, path, body, idempotency_key, attempts, dedupe_key FROM outbox "
+                "WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (time.time(), limit),
+            ).fetchall()
+        return [
+            {"id": r[0], "method": r[1], "path": r[2], "body": json.loads(r[3]) if r[3] else None,
+             "idempotency_key": r[4], "attempts": r[5], "dedupe_key": r[6]}
+            for r in rows
+        ]
+
+    def next_due_at(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt_at) FROM outbox").fetchone()
+        return row[0] if row else None
+
+    def has_pending(self, dedupe_key: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM outbox WHERE dedupe_key=? LIMIT 1", (dedupe_key,)).fetchone() is not None
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def ack(self, item_id: int):
+        with self._lock:
+            self._conn.execute("DELETE FROM outbox WHERE id=?", (item_id,))
+
+    def retry_later(self, item_id: int, delay: float, error: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET attempts=attempts+1, next_attempt_at=?, last_error=? WHERE id=?",
+                (time.time() + delay, error, item_id),
+            )
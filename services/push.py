@@ -0,0 +1,118 @@
+# services/push.py
+"""
+Assinante do canal de push do backend (GET /me/events, Server-Sent Events).
+
+Uma thread mantém a conexão aberta, lê os eventos e os entrega na thread
+principal (Clock.schedule_once) para os listeners. Caiu a conexão: reconecta
+com backoff exponencial (o mesmo da fila de sync), zerado a cada conexão boa.
+O servidor manda "hello" a cada conexão; é a deixa para recarregar o dashboard.
+O usuário vem do access token (Authorization: Bearer); 401 renova a sessão antes de reconectar.
+"""
+import json
+import threading
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+from services.sync import backoff_delay
+
+Listener = Callable[[Dict], None]
+
+
+class PushSubscriber:
+    # Sem nada (nem o ping de keep-alive do servidor) por este tempo: conexão morta
+    READ_TIMEOUT = 60.0
+
+    def __init__(self, api):
+        self.api = api
+        self._listeners: List[Listener] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_listener(self, fn: Listener):
+        self._listeners.append(fn)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running and not self._stop.is_set():
+            return
+        # Cada thread tem o seu evento de parada: num stop() seguido de start() rápido
+        # (on_pause/on_resume), a thread velha ainda presa no iter_lines sai no próximo
+        # ping e a nova assume, em vez de o start() ver `running` e não fazer nada
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, args=(self._stop,), name="jogamos-push", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Encerra (ex.: app em segundo plano, para poupar bateria). A thread sai no
+        próximo ping do servidor: fechar a resposta daqui não destrava o recv da
+        outra thread e libera o fd para ser reaproveitado por uma conexão nova.
+        """
+        self._stop.set()
+
+    # -----------------------
+    # Thread do assinante
+    # -----------------------
+    def _loop(self, stop: threading.Event):
+        failures = 0
+        while not stop.is_set():
+            if not self.api.authorized:
+                stop.wait(5.0)  # ainda sem usuário logado
+                continue
+            try:
+                if self._listen(stop):
+                    failures = 0
+            except Exception as e:
+                if stop.is_set():
+                    break
+                Logger.info(f"Push: conexão caiu ({e.__class__.__name__})")
+            if stop.is_set():
+                break
+            delay = backoff_delay(failures, base=1.0, cap=60.0)
+            failures += 1
+            stop.wait(delay)
+
+    def _listen(self, stop: threading.Event) -> bool:
+        """Lê eventos até a conexão cair. True se chegou a receber algo (conexão boa)."""
+        received = False
+        timeout = httpx.Timeout(10.0, read=self.READ_TIMEOUT)
+        # 401: o stream já renova a sessão e repete; se ainda assim falhar, o loop tenta com backoff
+        with self.api.stream("GET", "/me/events", headers={"Accept": "text/event-stream"}, timeout=timeout,
+                             require_auth=True) as response:
+            if response.status_code != 200:
+                Logger.warning(f"Push: /me/events respondeu {response.status_code}")
+                return False
+            data_lines: List[str] = []
+            for line in response.iter_lines():
+                if stop.is_set():
+                    break
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+                elif not line and data_lines:
+                    # Linha em branco fecha o evento
+                    received = True
+                    self._deliver("\n".join(data_lines))
+                    data_lines = []
+                # "id:", "event:" e comentários (": ping") não precisam de tratamento
+        return received
+
+    def _deliver(self, raw: str):
+        try:
+            event = json.loads(raw)
+        except ValueError:
+            Logger.warning(f"Push: evento inválido: {raw[:200]}")
+            return
+        Clock.schedule_once(lambda *_: self._notify(event), 0)
+
+    def _notify(self, event: Dict):
+        for fn in list(self._listeners):
+            try:
+                fn(event)
+            except Exception as e:
+                Logger.exception(f"Push: listener falhou: {e}")
@@ -0,0 +1,165 @@
+# services/repository.py
+"""
+Dados do app com leitura local primeiro (offline-first).
+
+Leituras devolvem na hora o que está no LocalStore e, se pedido, atualizam em
+segundo plano pelo dispatcher (callback na thread principal só se o dado mudou).
+Escritas gravam local e entram na fila de saída; o SyncWorker envia quando der.
+"""
+from typing import Any, Callable, List, Optional
+
+from kivy.logger import Logger
+
+from services.dispatcher import get_dispatcher
+from services.local_store import LocalStore
+from services.sync import SyncWorker
+
+PROFILE = "profile"
+SPORTS_CATALOG = "sports_catalog"
+FAVORITES = "favorites"
+FAVORITES_SYNCED = "favorites_synced"  # última seleção confirmada pelo servidor
+FAVORITES_PATH = "/user/favorites"
+FAVORITES_COUNT = 3  # o backend aceita exatamente 3
+DASHBOARD = "dashboard"
+
+
+class Repository:
+    def __init__(self, api, store: Optional[LocalStore] = None, on_rejected=None):
+        self.api = api
+        self.store = store or LocalStore()
+        self._on_rejected_cb = on_rejected
+        self.sync = SyncWorker(self.store, api, on_rejected=self._on_rejected, on_sent=self._on_sent)
+
+    STOP_TIMEOUT = 5.0  # espera o envio em andamento antes de fechar o SQLite
+
+    def close(self):
+        if not self.sync.stop(timeout=self.STOP_TIMEOUT):
+            # Worker ainda preso num request: fechar a conexão agora quebraria a escrita dele
+            Logger.warning("Repository: sync não terminou a tempo; LocalStore fica aberto")
+            return
+        self.store.close()
+
+    def _refresh(self, key: str, fetch: Callable[[], Any], on_update: Optional[Callable[[Any], None]], owner=None):
+        """Busca no backend em background; grava e avisa se vier diferente do cache."""
+        def work():
+            st, data = fetch()
+            if st != 200:
+                return None
+            if data == self.store.get(key):
+                return None
+            self.store.put(key, data)
+            return data
+
+        def done(data):
+            if data is not None and on_update is not None:
+                on_update(data)
+
+        return get_dispatcher().submit(work, done, owner=owner)
+
+    # ------ Perfil ------
+    def profile(self) -> dict:
+        return self.store.get(PROFILE, {})
+
+    def remember_login(self, email: str):
+        """Guarda o e-mail do usuário logado (usado pelas escritas em fila)."""
+        profile = self.profile()
+        if profile.get("email") != email:
+            profile = {"email": email}
+            self.store.put(PROFILE, profile)
+            self.store.put(FAVORITES, [])
+            self.store.put(FAVORITES_SYNCED, [])
+            self.store.put(DASHBOARD, {})
+
+    def refresh_profile(self, on_update=None, owner=None):
+        if not self.api.authorized:
+            return None
+
+        def fetch():
+            st, data = self.api.me()
+            if st == 200 and isinstance(data, dict):
+                data = {**self.profile(), **data}
+            return st, data
+
+        return self._refresh(PROFILE, fetch, on_update, owner)
+
+    # ------ Dashboard ------
+    def dashboard(self) -> dict:
+        return self.store.get(DASHBOARD, {})
+
+    def refresh_dashboard(self, on_update=None, owner=None, fresh: bool = False):
+        """Uma chamada (GET /me/dashboard) traz tudo que a tela precisa. fresh=True ignora o cache HTTP."""
+        if not self.api.authorized:
+            return None
+        return self._refresh(DASHBOARD, lambda: self.api.dashboard(cache=not fresh), on_update, owner)
+
+    def apply_push(self, event: dict) -> Optional[dict]:
+        """
+        Aplica um delta do canal de push ao dashboard local.
+        Retorna o dashboard novo, ou None se o evento não muda os números
+        (hello/resync pedem um refresh_dashboard completo).
+        """
+        kind = event.get("type")
+        dashboard = dict(self.dashboard())
+        if kind == "counters" and dashboard:
+            for name, delta in (event.get("delta") or {}).items():
+                dashboard[name] = max(0, int(dashboard.get(name, 0)) + int(delta))
+        elif kind == "favorites":
+            self.store.put(FAVORITES, list(event.get("sports") or []))
+            self.store.put(FAVORITES_SYNCED, list(event.get("sports") or []))
+            if not dashboard:
+                return None
+            dashboard["favorites"] = list(event.get("sports") or [])
+        else:
+            return None
+        self.store.put(DASHBOARD, dashboard)
+        self.api.cache.invalidate("/me/dashboard")  # a cópia HTTP ficou velha
+        return dashboard
+
+    # ------ Catálogo de esportes ------
+    def sports_catalog(self, default: List[tuple]) -> List[tuple]:
+        """[(chave, nome), ...] do último catálogo baixado; `default` se nunca baixou."""
+        cached = self.store.get(SPORTS_CATALOG)
+        return [(s["key"], s["name"]) for s in cached] if cached else list(default)
+
+    def refresh_sports_catalog(self, on_update=None, owner=None):
+        def done(data):
+            if on_update is not None:
+                on_update([(s["key"], s["name"]) for s in data])
+        return self._refresh(SPORTS_CATALOG, self.api.sports, done, owner)
+
+    # ------ Favoritos ------
+    def favorites(self) -> List[str]:
+        return self.store.get(FAVORITES, [])
+
+    def set_favorites(self, keys: List[str]) -> bool:
+        """
+        Salva local e enfileira o envio. False se não há usuário conhecido (fica só local).
+        Exige exatamente FAVORITES_COUNT esportes distintos (mesma regra do backend).
+        """
+        keys = list(dict.fromkeys(keys))
+        if len(keys) != FAVORITES_COUNT:
+            raise ValueError(f"Escolha exatamente {FAVORITES_COUNT} esportes.")
+        self.store.put(FAVORITES, keys)
+        email = self.profile().get("email")
+        if not email:
+            return False
+        # dedupe_key: só a última seleção pendente importa
+        self.store.enqueue("POST", FAVORITES_PATH, {"email": email, "sports": keys},
+                           idempotency_key=self.api.new_idempotency_key(), dedupe_key=f"favorites:{email}")
+        self.sync.kick()
+        return True
+
+    # ------ Retorno da fila de sincronização ------
+    def _on_sent(self, item: dict):
+        # Thread do worker: só grava no LocalStore (que tem lock próprio)
+        if item["path"] == FAVORITES_PATH:
+            self.store.put(FAVORITES_SYNCED, list(item["body"].get("sports") or []))
+
+    def _on_rejected(self, item: dict, status: int, data):
+        """Servidor recusou: favoritos locais voltam à última seleção confirmada."""
+        if item["path"] == FAVORITES_PATH and not self.store.has_pending(item.get("dedupe_key") or ""):
+            # Sem seleção mais nova na fila: a local não vai chegar ao servidor
+            self.store.put(FAVORITES, self.store.get(FAVORITES_SYNCED, []))
+            item = {**item, "rolled_back": True}
+        if self._on_rejected_cb is not None:
+            self._on_rejected_cb(item, status, data)
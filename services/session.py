@@ -1,60 +1,256 @@
 # services/session.py
+"""
+Tokens de autenticação: cache em memória único no processo, com persistência
+em segundo plano (keyring, ou arquivo JSON na home como fallback).
+
+- Leitura: carregada uma vez, numa thread (start_load no startup); get() só
+  espera se alguém pedir antes de terminar.
+- Escrita: atualiza a memória na hora e agenda a gravação numa thread própria;
+  gravações em rajada (refresh, refresh...) viram uma só, com o valor mais novo.
+"""
+import base64
 import json, os
-from typing import Optional
-from dataclasses import dataclass
+import tempfile
+import threading
+from typing import Callable, List, Optional
+from dataclasses import dataclass, replace
+
+from kivy.logger import Logger
 
 KEYRING_SERVICE = "JogamosApp"
 KEYRING_USER = "auth"
+TOKENS_PATH = os.path.join(os.path.expanduser("~"), ".jogamos_tokens.json")
 
 @dataclass
 class TokenBundle:
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
 
-def _keyring_available():
+def jwt_claims(token: Optional[str]) -> dict:
+    """Payload do JWT, sem validar assinatura (quem valida é o servidor); {} se não der para ler."""
     try:
-        import keyring  # noqa
-        return True
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return claims if isinstance(claims, dict) else {}
     except Exception:
-        return False
+        return {}
 
-def save_tokens(tokens: TokenBundle):
-    if _keyring_available():
-        import keyring
-        keyring.set_password(KEYRING_SERVICE, "access_token", tokens.access_token or "")
-        keyring.set_password(KEYRING_SERVICE, "refresh_token", tokens.refresh_token or "")
-    else:
-        # Fallback: arquivo na home do usuário
-        path = os.path.join(os.path.expanduser("~"), ".jogamos_tokens.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"access_token": tokens.access_token, "refresh_token": tokens.refresh_token}, f)
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """Campo `exp` (epoch) do payload do JWT; None se não der para ler."""
+    exp = jwt_claims(token).get("exp")
+    try:
+        return float(exp) if exp is not None else None
+    except (TypeError, ValueError):
+        return None
 
-def load_tokens() -> TokenBundle:
-    if _keyring_available():
-        import keyring
+# -----------------------
+# Backends (bloqueantes; só rodam nas threads do TokenStore)
+# -----------------------
+_keyring = None
+_keyring_checked = False
+
+def _get_keyring():
+    """Importa o keyring uma única vez; None se indisponível."""
+    global _keyring, _keyring_checked
+    if not _keyring_checked:
+        try:
+            import keyring
+            _keyring = keyring
+        except Exception:
+            _keyring = None
+        _keyring_checked = True
+    return _keyring
+
+def _write_file_atomic(path: str, data: dict):
+    # Grava em arquivo temporário na mesma pasta e troca de uma vez (nunca fica JSON pela metade)
+    fd, tmp = tempfile.mkstemp(prefix=".jogamos_tokens.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _read_tokens() -> TokenBundle:
+    keyring = _get_keyring()
+    if keyring is not None:
         a = keyring.get_password(KEYRING_SERVICE, "access_token")
         r = keyring.get_password(KEYRING_SERVICE, "refresh_token")
         return TokenBundle(a, r)
+    if not os.path.exists(TOKENS_PATH):
+        return TokenBundle()
+    with open(TOKENS_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+        return TokenBundle(data.get("access_token"), data.get("refresh_token"))
+
+def _write_tokens(tokens: TokenBundle):
+    keyring = _get_keyring()
+    if keyring is not None:
+        keyring.set_password(KEYRING_SERVICE, "access_token", tokens.access_token or "")
+        keyring.set_password(KEYRING_SERVICE, "refresh_token", tokens.refresh_token or "")
     else:
-        path = os.path.join(os.path.expanduser("~"), ".jogamos_tokens.json")
-        if not os.path.exists(path):
-            return TokenBundle()
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return TokenBundle(data.get("access_token"), data.get("refresh_token"))
+        # Fallback: arquivo na home do usuário
+        _write_file_atomic(TOKENS_PATH, {"access_token": tokens.access_token, "refresh_token": tokens.refresh_token})
 
-def clear_tokens():
-    if _keyring_available():
-        import keyring
+def _delete_tokens():
+    keyring = _get_keyring()
+    if keyring is not None:
         for key in ("access_token", "refresh_token"):
             try:
                 keyring.delete_password(KEYRING_SERVICE, key)
             except Exception:
                 pass
     # também limpa fallback
-    path = os.path.join(os.path.expanduser("~"), ".jogamos_tokens.json")
-    if os.path.exists(path):
+    if os.path.exists(TOKENS_PATH):
         try:
-            os.remove(path)
+            os.remove(TOKENS_PATH)
         except Exception:
-            pass
\ No newline at end of file
+            pass
+
+# -----------------------
+# Cache em memória + write-behind
+# -----------------------
+_NOTHING = object()  # nenhuma gravação pendente
+_DELETE = object()   # gravação pendente = apagar
+
+
+class TokenStore:
+    LOAD_TIMEOUT = 5.0  # keyring travado não pode congelar o app para sempre
+
+    def __init__(self):
+        self._lock = threading.Condition()
+        self._tokens = TokenBundle()
+        self._dirty = False  # memória mudou antes do load terminar: vence a memória
+        self._load_started = False
+        self._loaded = threading.Event()
+        self._pending = _NOTHING
+        self._writer: Optional[threading.Thread] = None
+        self._idle = threading.Event()
+        self._idle.set()
+        self._listeners: List[Callable[[TokenBundle], None]] = []
+
+    def add_listener(self, fn: Callable[[TokenBundle], None]):
+        """fn(tokens) após o load e a cada troca; roda na thread que causou a mudança."""
+        self._listeners.append(fn)
+        if self._loaded.is_set():
+            fn(self.get())
+
+    def _notify(self, tokens: TokenBundle):
+        for fn in list(self._listeners):
+            try:
+                fn(tokens)
+            except Exception as e:
+                Logger.warning(f"Session: listener de tokens falhou: {e}")
+
+    # ------ leitura ------
+    def start_load(self):
+        """Dispara a leitura do armazenamento numa thread (chamar cedo, no startup)."""
+        with self._lock:
+            if self._load_started:
+                return
+            self._load_started = True
+        threading.Thread(target=self._load, name="jogamos-tokens-load", daemon=True).start()
+
+    def _load(self):
+        try:
+            tokens = _read_tokens()
+        except Exception as e:
+            Logger.warning(f"Session: falha ao ler tokens: {e}")
+            tokens = TokenBundle()
+        with self._lock:
+            if not self._dirty:
+                self._tokens = tokens
+            current = replace(self._tokens)
+        self._loaded.set()
+        self._notify(current)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded.is_set()
+
+    def get(self) -> TokenBundle:
+        """Cópia dos tokens atuais (espera o load inicial, se ainda em andamento)."""
+        self.start_load()
+        if not self._loaded.wait(self.LOAD_TIMEOUT):
+            Logger.warning("Session: leitura dos tokens demorou demais; seguindo sem eles")
+        with self._lock:
+            return replace(self._tokens)
+
+    # ------ escrita ------
+    def set(self, tokens: TokenBundle):
+        with self._lock:
+            self._tokens = replace(tokens)
+            self._dirty = True
+            self._schedule(replace(tokens))
+            current = replace(self._tokens)
+        self._notify(current)
+
+    def update(self, access: Optional[str] = None, refresh: Optional[str] = None):
+        """Troca só os tokens informados (ex.: resposta de /auth/refresh)."""
+        if not (access or refresh):
+            return
+        with self._lock:
+            if access:
+                self._tokens.access_token = access
+            if refresh:
+                self._tokens.refresh_token = refresh
+            self._dirty = True
+            current = replace(self._tokens)
+            self._schedule(replace(current))
+        self._notify(current)
+
+    def clear(self):
+        with self._lock:
+            self._tokens = TokenBundle()
+            self._dirty = True
+            self._schedule(_DELETE)
+        self._notify(TokenBundle())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Espera as gravações pendentes (ex.: ao fechar o app). False se estourou o timeout."""
+        return self._idle.wait(timeout)
+
+    def _schedule(self, value):
+        # Chamado com o lock: só o valor mais recente será gravado
+        self._pending = value
+        self._idle.clear()
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="jogamos-tokens-write", daemon=True)
+            self._writer.start()
+        self._lock.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                while self._pending is _NOTHING:
+                    self._idle.set()
+                    self._lock.wait()
+                value, self._pending = self._pending, _NOTHING
+            try:
+                if value is _DELETE:
+                    _delete_tokens()
+                else:
+                    _write_tokens(value)
+            except Exception as e:
+                Logger.warning(f"Session: falha ao gravar tokens: {e}")
+
+
+token_store = TokenStore()
+
+# Atalhos (mesma API de antes; agora não bloqueiam a thread chamadora para gravar)
+def save_tokens(tokens: TokenBundle):
+    token_store.set(tokens)
+
+def load_tokens() -> TokenBundle:
+    return token_store.get()
+
+def clear_tokens():
+    token_store.clear()
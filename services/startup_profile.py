@@ -0,0 +1,112 @@
+# services/startup_profile.py
+"""
+Perfil de cold start do cliente, exportado como Chrome trace (chrome://tracing / Perfetto).
+
+Ativação (uma das duas):
+    python main.py --profile-startup[=startup_trace.json]
+    JOGAMOS_PROFILE_STARTUP=1 (ou =caminho.json) python main.py
+Com JOGAMOS_PROFILE_EXIT=1 o app fecha após o primeiro frame (CI/headless).
+
+Este módulo só usa a stdlib e deve ser importado ANTES do Kivy: ele também remove
+a flag do sys.argv (o parser de argumentos do Kivy não a conhece).
+"""
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+from services import debug_flags
+
+DEFAULT_PATH = "startup_trace.json"
+_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    def __init__(self, output_path: Optional[str]):
+        self.output_path = output_path
+        self.enabled = output_path is not None
+        self.exit_after = debug_flags.env_flag("JOGAMOS_PROFILE_EXIT")
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._written = False
+
+    def _us(self, t: float) -> float:
+        return round((t - self._t0) * 1e6, 1)
+
+    def phase(self, name: str, cat: str = "startup", **args):
+        """Context manager: registra tempo de parede e de CPU do trecho."""
+        if not self.enabled:
+            return nullcontext()
+        return self._phase(name, cat, args)
+
+    @contextmanager
+    def _phase(self, name: str, cat: str, args: Dict[str, Any]):
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            cpu_ms = (time.thread_time() - cpu_start) * 1000
+            event = {
+                "name": name, "cat": cat, "ph": "X",
+                "ts": self._us(start), "dur": round((end - start) * 1e6, 1),
+                "pid": os.getpid(), "tid": threading.get_ident(),
+                "args": {"cpu_ms": round(cpu_ms, 3), **args},
+            }
+            with self._lock:
+                self._events.append(event)
+
+    def mark(self, name: str, **args):
+        """Evento instantâneo (ex.: 'first frame')."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._events.append({
+                "name": name, "cat": "mark", "ph": "i", "s": "g",
+                "ts": self._us(time.perf_counter()),
+                "pid": os.getpid(), "tid": threading.get_ident(),
+                "args": {"process_cpu_ms": round((time.process_time() - self._cpu0) * 1000, 3), **args},
+            })
+
+    def write(self) -> Optional[str]:
+        """Grava o trace (uma vez). Retorna o caminho ou None se desativado."""
+        if not self.enabled or self._written:
+            return None
+        with self._lock:
+            events = sorted(self._events, key=lambda e: e["ts"])
+        doc = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "jogamos"}},
+                *events,
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "argv": sys.argv,
+            },
+        }
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=1)
+        self._written = True
+        return self.output_path
+
+    def summary(self) -> List[str]:
+        """Fases em ordem de duração (para log)."""
+        with self._lock:
+            phases = [e for e in self._events if e["ph"] == "X"]
+        phases.sort(key=lambda e: e["dur"], reverse=True)
+        return [
+            f"{e['dur'] / 1000:8.1f} ms  cpu {e['args']['cpu_ms']:8.1f} ms  {e['name']}"
+            for e in phases
+        ]
+
+
+profiler = StartupProfiler(debug_flags.output_path(_FLAG, "JOGAMOS_PROFILE_STARTUP", DEFAULT_PATH))
@@ -0,0 +1,105 @@
+# services/sync.py
+"""
+Envia a fila de saída (LocalStore.outbox) ao backend em segundo plano.
+
+- 2xx: item confirmado e removido; `on_sent` é chamado na própria thread do worker.
+- Falha de rede, 408, 429 ou 5xx: nova tentativa com backoff exponencial + jitter.
+- Demais 4xx: o servidor recusou; o item sai da fila e `on_rejected` é chamado
+  na thread principal (repetir não adiantaria).
+Cada item leva sua Idempotency-Key, então reenviar após um timeout é seguro.
+"""
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+from services.local_store import LocalStore
+
+RETRY_STATUSES = {0, 408, 429}
+
+
+def backoff_delay(attempts: int, base: float = 2.0, cap: float = 300.0) -> float:
+    """2s, 4s, 8s... até `cap`, com jitter de ±50% para não sincronizar clientes."""
+    delay = min(cap, base * (2 ** attempts))
+    return delay * random.uniform(0.5, 1.5)
+
+
+class SyncWorker:
+    IDLE_WAIT = 60.0  # sem nada pendente, reavalia a fila a cada minuto
+
+    def __init__(self, store: LocalStore, api, on_rejected: Optional[Callable[[dict, int, object], None]] = None,
+                 on_sent: Optional[Callable[[dict], None]] = None):
+        self.store = store
+        self.api = api
+        self.on_rejected = on_rejected
+        self.on_sent = on_sent
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="jogamos-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Para o worker; com timeout, espera o envio em andamento terminar. True se a thread saiu."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is None:
+            return True
+        if timeout is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return not thread.is_alive()
+
+    def kick(self):
+        """Acorda o worker (novo item na fila, app voltou ao primeiro plano...)."""
+        self._wake.set()
+
+    # -----------------------
+    # Thread do worker
+    # -----------------------
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.drain()
+            except Exception as e:
+                Logger.exception(f"Sync: erro inesperado: {e}")
+            self._wake.wait(self._wait_time())
+            self._wake.clear()
+
+    def _wait_time(self) -> float:
+        next_at = self.store.next_due_at()
+        if next_at is None:
+            return self.IDLE_WAIT
+        return max(0.0, min(self.IDLE_WAIT, next_at - time.time()))
+
+    def drain(self) -> int:
+        """Envia os itens vencidos, em ordem. Para no 1º erro transitório. Retorna quantos saíram da fila."""
+        sent = 0
+        for item in self.store.due():
+            if self._stop.is_set():
+                break
+            st, data = self.api.request(item["method"], item["path"], json=item["body"],
+                                        require_auth=True, idempotency_key=item["idempotency_key"])
+            if 200 <= st < 300:
+                self.store.ack(item["id"])
+                sent += 1
+                if self.on_sent is not None:
+                    self.on_sent(item)
+            elif st in RETRY_STATUSES or st >= 500:
+                delay = backoff_delay(item["attempts"])
+                self.store.retry_later(item["id"], delay, str(data)[:500])
+                Logger.info(f"Sync: {item['method']} {item['path']} falhou ({st}); nova tentativa em {delay:.0f}s")
+                break  # provavelmente offline: não insiste no resto agora
+            else:
+                self.store.ack(item["id"])
+                sent += 1
+                Logger.warning(f"Sync: {item['method']} {item['path']} recusado ({st}): {data}")
+                if self.on_rejected is not None:
+                    Clock.schedule_once(lambda *_, i=item, s=st, d=data: self.on_rejected(i, s, d), 0)
+        return sent
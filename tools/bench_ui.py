@@ -0,0 +1,292 @@
+# tools/bench_ui.py
+"""
+Benchmark headless do cliente (Kivy/KivyMD), com comparação contra baseline.
+
+Mede, dentro de um MyApp de verdade:
+  1) import de cada módulo de tela;
+  2) Builder.load_file de cada arquivo em MyApp.KV_FILES (mediana de N);
+  3) construtor de cada tela em MyApp.SCREENS (mediana de N) + nº de widgets e memória;
+  4) ChooseSportsScreen.on_pre_enter (1ª entrada e reentrada);
+  5) navegação roteirizada via MyApp.goto (parte síncrona + até a transição terminar).
+
+Uso (na raiz do projeto; Linux sem display via Xvfb):
+    xvfb-run -a python tools/bench_ui.py --out bench_ui.json
+    xvfb-run -a python tools/bench_ui.py --update-baseline          # grava tools/bench_ui_baseline.json
+    xvfb-run -a python tools/bench_ui.py --baseline tools/bench_ui_baseline.json   # exit 1 se regrediu
+Com --gl mock nenhuma chamada OpenGL é feita (mede só o custo Python; útil em CI sem GPU).
+
+O baseline não é versionado: os tempos dependem da máquina. --baseline com
+arquivo inexistente sai com 2 (caminho errado não pode passar no CI); só
+--create-baseline cria o arquivo a partir desta execução. No CI: rode primeiro
+no commit base e depois no commit do PR, mesmo runner:
+    git checkout $BASE && xvfb-run -a python tools/bench_ui.py --gl mock --baseline tools/bench_ui_baseline.json --create-baseline
+    git checkout $HEAD && xvfb-run -a python tools/bench_ui.py --gl mock --baseline tools/bench_ui_baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "tools", "bench_ui_baseline.json")
+
+# Roteiro de navegação (telas de MyApp.SCREENS)
+NAV_SCRIPT = ["login", "signup", "verify", "login", "dashboard", "choose_sports", "home", "dashboard", "login"]
+
+# Métricas de tempo só regridem se piorarem mais que a tolerância E mais que este piso (ruído)
+MIN_DELTA_MS = 2.0
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--out", default="bench_ui.json", help="arquivo JSON de saída")
+    p.add_argument("--iterations", type=int, default=5, help="repetições de KV/construtores (mediana)")
+    p.add_argument("--baseline", default=None,
+                   help="compara com este JSON; sai com 1 se regrediu, 2 se o arquivo não existe")
+    p.add_argument("--create-baseline", action="store_true",
+                   help="com --baseline: grava este resultado no arquivo (sobrescreve) em vez de comparar")
+    p.add_argument("--update-baseline", action="store_true", help=f"grava o resultado em {DEFAULT_BASELINE}")
+    p.add_argument("--tolerance", type=float, default=0.25, help="piora relativa aceita (0.25 = 25%%)")
+    p.add_argument("--gl", default=None, help="KIVY_GL_BACKEND (ex.: mock)")
+    p.add_argument("--size", default="400x800", help="tamanho da janela LxA")
+    return p.parse_args()
+
+
+def prepare_env(args):
+    """Ambiente antes de qualquer import do Kivy: sem argv do Kivy, dados em pasta temporária."""
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    if args.gl:
+        os.environ["KIVY_GL_BACKEND"] = args.gl
+    # keyring/arquivo de tokens e SQLite local não tocam os dados reais do usuário
+    home = tempfile.mkdtemp(prefix="jogamos-bench-")
+    os.environ["HOME"] = home
+    os.environ["KIVY_HOME"] = os.path.join(home, ".kivy")
+    w, h = args.size.split("x")
+    from kivy.config import Config
+    Config.set("graphics", "width", w)
+    Config.set("graphics", "height", h)
+    Config.set("input", "mouse", "mouse,disable_multitouch")
+    return home
+
+
+def ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def count_widgets(widget) -> int:
+    return sum(1 for _ in widget.walk(restrict=True))
+
+
+def median_ms(samples) -> float:
+    return ms(statistics.median(samples))
+
+
+def run_bench(args, home: str) -> dict:
+    import importlib
+    from kivy.clock import Clock
+    from kivy.lang import Builder
+
+    import main
+    from services.local_store import LocalStore
+    from services.repository import Repository
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "gl_backend": os.environ.get("KIVY_GL_BACKEND", "default"),
+            "iterations": args.iterations,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "imports_ms": {},
+        "kv_load_ms": {},
+        "screens": {},
+        "choose_sports_pre_enter_ms": {},
+        "navigation": [],
+    }
+
+    class BenchApp(main.MyApp):
+        def _start_hot_reload(self):
+            pass  # sem observer de arquivos durante a medição
+
+        @property
+        def repo(self):
+            if self._repo is None:
+                self._repo = Repository(self.api, LocalStore(os.path.join(home, "bench_local.db")))
+            return self._repo
+
+        def on_start(self):
+            Clock.schedule_once(lambda *_: self._bench_static(), 0)
+
+        # ---------- 1-4: medições síncronas ----------
+        def _bench_static(self):
+            n = args.iterations
+
+            # 1) imports (módulos antes dos KV: as classes precisam estar no Factory)
+            for spec in self.SCREENS:
+                for mod in (*spec.deps, spec.module):
+                    if mod in sys.modules:
+                        continue
+                    t = time.perf_counter()
+                    importlib.import_module(mod)
+                    results["imports_ms"][mod] = ms(time.perf_counter() - t)
+
+            # 2) KV: descarrega e recarrega cada arquivo N vezes
+            for kv in self.KV_FILES:
+                if not os.path.exists(kv):
+                    continue
+                samples = []
+                for _ in range(n):
+                    Builder.unload_file(kv)
+                    t = time.perf_counter()
+                    Builder.load_file(kv)
+                    samples.append(time.perf_counter() - t)
+                self._loaded_kv.add(kv)
+                results["kv_load_ms"][kv.replace(os.sep, "/")] = median_ms(samples)
+
+            # 3) construtores (instâncias avulsas, fora do ScreenManager)
+            tracemalloc.start()
+            for spec in self.SCREENS:
+                cls = self._screen_class(spec)
+                samples, widgets, mem = [], 0, 0
+                for _ in range(n):
+                    gc.collect()
+                    before = tracemalloc.get_traced_memory()[0]
+                    t = time.perf_counter()
+                    screen = cls(name=f"bench_{spec.name}")
+                    samples.append(time.perf_counter() - t)
+                    widgets = count_widgets(screen)
+                    mem = tracemalloc.get_traced_memory()[0] - before
+                    del screen
+                results["screens"][spec.name] = {
+                    "construct_ms": median_ms(samples),
+                    "widgets": widgets,
+                    "mem_kb": round(mem / 1024, 1),
+                }
+            tracemalloc.stop()
+
+            # 4) on_pre_enter da escolha de esportes (1ª entrada monta os dados)
+            screen = self.root.get_screen("choose_sports")
+            for label in ("first", "again"):
+                t = time.perf_counter()
+                screen.on_pre_enter()
+                results["choose_sports_pre_enter_ms"][label] = ms(time.perf_counter() - t)
+
+            self._nav_steps = list(NAV_SCRIPT)
+            Clock.schedule_once(lambda *_: self._nav_next(), 0)
+
+        # ---------- 5: navegação (um passo por vez, esperando a transição) ----------
+        def _nav_next(self):
+            if not self._nav_steps:
+                self.stop()
+                return
+            name = self._nav_steps.pop(0)
+            sm = self.root
+            if sm.current == name:
+                Clock.schedule_once(lambda *_: self._nav_next(), 0)
+                return
+            t0 = time.perf_counter()
+            self.goto(name)
+            step = {"to": name, "goto_ms": ms(time.perf_counter() - t0), "frames": 0}
+            results["navigation"].append(step)
+
+            def wait(_dt):
+                step["frames"] += 1
+                if sm.transition.is_active:
+                    return  # continua agendado
+                step["transition_ms"] = ms(time.perf_counter() - t0)
+                ev.cancel()
+                Clock.schedule_once(lambda *_: self._nav_next(), 0)
+
+            ev = Clock.schedule_interval(wait, 0)
+
+    app = BenchApp()
+    t = time.perf_counter()
+    app.run()
+    results["meta"]["wall_ms"] = ms(time.perf_counter() - t)
+    results["root_widgets"] = {
+        name: count_widgets(app.root.get_screen(name)) for name in app.root.screen_names
+    } if app.root else {}
+    return results
+
+
+def metrics(results: dict) -> dict:
+    """Achata o resultado em {nome: valor} para comparação."""
+    flat = {}
+    for kv, v in results.get("kv_load_ms", {}).items():
+        flat[f"kv:{kv}"] = v
+    for name, s in results.get("screens", {}).items():
+        flat[f"screen:{name}:construct_ms"] = s["construct_ms"]
+        flat[f"screen:{name}:widgets"] = s["widgets"]
+    for label, v in results.get("choose_sports_pre_enter_ms", {}).items():
+        flat[f"choose_sports_pre_enter:{label}"] = v
+    for i, step in enumerate(results.get("navigation", [])):
+        flat[f"nav:{i}:{step['to']}:goto_ms"] = step["goto_ms"]
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float):
+    """Lista de regressões (métrica, baseline, atual)."""
+    cur, base = metrics(current), metrics(baseline)
+    regressions = []
+    for key, old in base.items():
+        new = cur.get(key)
+        if new is None:
+            continue
+        if key.endswith(":widgets"):
+            worse = new > old  # widget a mais é regressão determinística
+        else:
+            worse = new > old * (1 + tolerance) and new - old > MIN_DELTA_MS
+        if worse:
+            regressions.append((key, old, new))
+    return regressions
+
+
+def main_cli():
+    args = parse_args()
+    if args.create_baseline and not args.baseline:
+        sys.exit("--create-baseline precisa de --baseline <arquivo>")
+    home = prepare_env(args)
+    results = run_bench(args, home)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=1)
+    print(f"Resultado gravado em {args.out}")
+    for key, value in metrics(results).items():
+        print(f"  {key:60s} {value}")
+
+    if args.update_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+        print(f"Baseline atualizado: {DEFAULT_BASELINE}")
+
+    if args.create_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+        print(f"\nBaseline criado: {args.baseline}")
+    elif args.baseline and not os.path.exists(args.baseline):
+        print(f"\nBaseline não encontrado: {args.baseline} (use --create-baseline para criá-lo)")
+        sys.exit(2)
+    elif args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.tolerance:.0%}:")
+            for key, old, new in regressions:
+                print(f"  {key:60s} {old} -> {new}")
+            sys.exit(1)
+        print("\nSem regressões em relação ao baseline.")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,98 @@
+# tools/build_atlas.py
+"""
+Gera os atlas de ícones de esportes por densidade de tela.
+
+Cada PNG de assets/icons (512x512) é reduzido para ICON_DP na densidade alvo
+e todos são empacotados num único atlas Kivy por densidade:
+
+    assets/atlas/icons-<densidade>.atlas  (+ .png)
+
+Uso (na raiz do projeto, antes do buildozer):
+    python tools/build_atlas.py [--densities hdpi,xhdpi,xxhdpi]
+"""
+import glob
+import math
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT, "assets", "icons")
+OUT_DIR = os.path.join(ROOT, "assets", "atlas")
+
+ICON_DP = 40   # tamanho exibido no MDCheckboxItem / SportPill
+PADDING = 2
+# Densidades empacotadas no APK. mdpi/xxxhdpi ficam de fora por padrão: o app usa
+# a mais próxima (reduzir 60->40 ou ampliar 120->160 é imperceptível a 40dp) e
+# o total fica abaixo dos PNGs originais. Outras: --densities mdpi,xxxhdpi,...
+ALL_DENSITIES = {
+    "mdpi": 1.0,
+    "hdpi": 1.5,
+    "xhdpi": 2.0,
+    "xxhdpi": 3.0,
+    "xxxhdpi": 4.0,
+}
+DEFAULT_DENSITIES = ("hdpi", "xhdpi", "xxhdpi")
+
+
+def atlas_size(count: int, px: int) -> int:
+    """Menor potência de 2 que comporta `count` ícones de `px` em grade."""
+    cols = math.ceil(math.sqrt(count))
+    side = cols * (px + PADDING * 2)
+    return 1 << max(6, math.ceil(math.log2(side)))
+
+
+def build(density_name: str, scale: float, sources) -> str:
+    from kivy.atlas import Atlas  # importa Kivy só aqui (lento)
+
+    px = round(ICON_DP * scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for src in sources:
+            im = Image.open(src).convert("RGBA")
+            im = im.resize((px, px), Image.LANCZOS)
+            dst = os.path.join(tmp, os.path.basename(src))
+            im.save(dst, optimize=True)
+            files.append(dst)
+
+        outname = os.path.join(OUT_DIR, f"icons-{density_name}")
+        Atlas.create(outname, files, atlas_size(len(files), px), padding=PADDING, use_path=False)
+    return outname + ".atlas"
+
+
+def main(argv) -> int:
+    names = list(DEFAULT_DENSITIES)
+    if "--densities" in argv:
+        names = argv[argv.index("--densities") + 1].split(",")
+    unknown = [n for n in names if n not in ALL_DENSITIES]
+    if unknown:
+        print(f"Densidades desconhecidas: {unknown} (opções: {', '.join(ALL_DENSITIES)})")
+        return 2
+
+    sources = sorted(glob.glob(os.path.join(SRC_DIR, "*.png")))
+    if not sources:
+        print(f"Nenhum PNG em {SRC_DIR}")
+        return 1
+    os.makedirs(OUT_DIR, exist_ok=True)
+    # Remove atlas antigos (ex.: páginas extras de uma versão maior)
+    for old in glob.glob(os.path.join(OUT_DIR, "icons-*")):
+        os.remove(old)
+
+    total_kb = 0.0
+    for name in names:
+        scale = ALL_DENSITIES[name]
+        path = build(name, scale, sources)
+        pages = glob.glob(os.path.join(OUT_DIR, f"icons-{name}*.png"))
+        size_kb = sum(os.path.getsize(p) for p in pages) / 1024
+        total_kb += size_kb
+        print(f"{name:8s} {round(ICON_DP * scale):4d}px  {len(pages)} página(s)  {size_kb:7.1f} KB  -> {os.path.relpath(path, ROOT)}")
+
+    src_kb = sum(os.path.getsize(p) for p in sources) / 1024
+    print(f"total atlas {total_kb:.1f} KB  (PNGs originais: {src_kb:.1f} KB em {len(sources)} arquivos)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
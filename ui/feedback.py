@@ -0,0 +1,173 @@
+# ui/feedback.py
+"""
+Feedback visual do app (loader, diálogo de erro, toast) com widgets reaproveitados.
+
+Cada widget é montado uma única vez (prewarm() com o app ocioso, ou no 1º uso);
+depois disso mostrar/esconder só troca texto e chama open()/dismiss(), sem
+alocar widgets nem aplicar regras KV no caminho quente.
+Toasts em rajada são agrupados num só (ver TOAST_COALESCE).
+"""
+from typing import List
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.metrics import dp
+from kivy.utils import platform
+
+from services.frame_monitor import frame_monitor
+
+
+class UIFeedback:
+    TOAST_COALESCE = 0.25   # segundos: toasts dentro da janela viram um só
+    TOAST_DURATION = 2.5
+    TOAST_MAX_LINES = 3
+
+    def __init__(self):
+        self._loader = None
+        self._loader_label = None
+        self._spinner = None
+        self._loader_open = False
+        self._error = None
+        self._error_open = False
+        self._snackbar = None
+        self._snackbar_text = None
+        self._snackbar_open = False
+        self._pending_toasts: List[str] = []
+        self._toast_flush = None
+
+    def prewarm(self, *args):
+        """Monta os widgets fora do caminho quente (chamar com o app ocioso)."""
+        with frame_monitor.operation("feedback:prewarm"):
+            self._build_loader()
+            self._build_error()
+            if platform != "android":
+                self._build_snackbar()
+
+    # -----------------------
+    # Loader
+    # -----------------------
+    def _build_loader(self):
+        if self._loader is not None:
+            return
+        from kivymd.uix.boxlayout import MDBoxLayout
+        from kivymd.uix.dialog import MDDialog
+        from kivymd.uix.label import MDLabel
+        from kivymd.uix.spinner import MDSpinner
+
+        content = MDBoxLayout(
+            orientation="horizontal",
+            spacing=dp(16),
+            padding=(dp(16), dp(16)),
+            adaptive_height=True,
+        )
+        self._spinner = MDSpinner(size_hint=(None, None), size=(dp(32), dp(32)), active=False)
+        self._loader_label = MDLabel(text="")
+        content.add_widget(self._spinner)
+        content.add_widget(self._loader_label)
+        self._loader = MDDialog(type="custom", content_cls=content, auto_dismiss=False)
+
+    def show_loader(self, text: str = "Carregando..."):
+        self._build_loader()
+        self._loader_label.text = text
+        if not self._loader_open:
+            self._loader_open = True
+            self._spinner.active = True
+            frame_monitor.hold("dialog:loader", 0.3)
+            self._loader.open()
+
+    def hide_loader(self):
+        if self._loader_open:
+            self._loader_open = False
+            self._spinner.active = False  # spinner parado não agenda animação
+            self._loader.dismiss()
+
+    # -----------------------
+    # Diálogo de erro
+    # -----------------------
+    def _build_error(self):
+        if self._error is not None:
+            return
+        from kivymd.uix.button import MDButton, MDButtonText
+        from kivymd.uix.dialog import MDDialog
+
+        self._error = MDDialog(
+            title="Erro",
+            text="",
+            buttons=[
+                MDButton(
+                    MDButtonText(text="OK"),
+                    style="text",
+                    on_release=lambda *_: self.dismiss_error(),
+                )
+            ],
+        )
+        self._error.bind(on_dismiss=self._on_error_dismiss)
+
+    def notify_error(self, msg: str, title: str = "Erro"):
+        self._build_error()
+        # Já aberto: só troca o conteúdo (erro mais recente vence)
+        self._error.title = title
+        self._error.text = str(msg)
+        if not self._error_open:
+            self._error_open = True
+            frame_monitor.hold("dialog:error", 0.3)
+            self._error.open()
+
+    def dismiss_error(self):
+        if self._error_open:
+            self._error.dismiss()
+
+    def _on_error_dismiss(self, *args):
+        self._error_open = False
+
+    # -----------------------
+    # Toast (coalescido)
+    # -----------------------
+    def _build_snackbar(self):
+        if self._snackbar is not None:
+            return
+        from kivymd.uix.snackbar import MDSnackbar, MDSnackbarText
+
+        self._snackbar_text = MDSnackbarText(text="")
+        self._snackbar = MDSnackbar(
+            self._snackbar_text,
+            y=dp(24),
+            pos_hint={"center_x": 0.5},
+            size_hint_x=0.6,
+            duration=self.TOAST_DURATION,
+        )
+        self._snackbar.bind(on_dismiss=self._on_snackbar_dismiss)
+
+    def toast(self, msg: str):
+        msg = str(msg)
+        if msg not in self._pending_toasts:
+            self._pending_toasts.append(msg)
+        if self._toast_flush is None:
+            self._toast_flush = Clock.schedule_once(self._flush_toasts, self.TOAST_COALESCE)
+
+    def _flush_toasts(self, *args):
+        self._toast_flush = None
+        msgs, self._pending_toasts = self._pending_toasts, []
+        if not msgs:
+            return
+        shown = msgs[-self.TOAST_MAX_LINES:]  # os mais recentes
+        text = "\n".join(shown)
+        if len(msgs) > len(shown):
+            text += f"\n(+{len(msgs) - len(shown)})"
+        try:
+            if platform == "android":
+                from kivymd.toast import toast as android_toast
+                android_toast(text)
+                return
+            self._build_snackbar()
+            self._snackbar_text.text = text
+            # Já visível: só troca o texto em vez de empilhar outro snackbar
+            if not self._snackbar_open:
+                self._snackbar_open = True
+                frame_monitor.hold("snackbar", 0.3)
+                self._snackbar.open()
+        except Exception as e:
+            Logger.exception(f"Toast/Snackbar fallback: {e}")
+
+    def _on_snackbar_dismiss(self, *args):
+        self._snackbar_open = False
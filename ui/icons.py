@@ -0,0 +1,53 @@
+# ui/icons.py
+"""
+Resolve o ícone de um esporte para o atlas da densidade mais próxima
+(gerado por tools/build_atlas.py). Fora do atlas, cai para o PNG original se
+ele existir (rodando do código-fonte) ou para "" (no APK os PNGs não vão:
+buildozer.spec exclui assets/icons/*.png). Os widgets escondem a imagem com "".
+"""
+import json
+import os
+from typing import Dict, Optional, Set, Tuple
+
+from kivy.metrics import Metrics
+
+ATLAS_DIR = os.path.join("assets", "atlas")
+ICONS_DIR = os.path.join("assets", "icons")
+DENSITIES = {"mdpi": 1.0, "hdpi": 1.5, "xhdpi": 2.0, "xxhdpi": 3.0, "xxxhdpi": 4.0}
+
+_atlas: Optional[Tuple[str, Set[str]]] = None  # (nome do atlas, ids disponíveis)
+
+
+def _available() -> Dict[str, float]:
+    return {
+        name: scale for name, scale in DENSITIES.items()
+        if os.path.exists(os.path.join(ATLAS_DIR, f"icons-{name}.atlas"))
+    }
+
+
+def _load_atlas() -> Tuple[str, Set[str]]:
+    """Escolhe uma única densidade (uma textura na GPU) e lê os ids do .atlas."""
+    global _atlas
+    if _atlas is None:
+        available = _available()
+        if not available:
+            _atlas = ("", set())
+            return _atlas
+        density = Metrics.density
+        # Menor densidade >= a da tela; senão a maior disponível
+        above = [n for n, s in available.items() if s >= density]
+        name = min(above, key=available.get) if above else max(available, key=available.get)
+        with open(os.path.join(ATLAS_DIR, f"icons-{name}.atlas"), encoding="utf-8") as f:
+            ids = {key for page in json.load(f).values() for key in page}
+        _atlas = (f"icons-{name}", ids)
+    return _atlas
+
+
+def sport_icon(key: str) -> str:
+    """'futebol' -> 'atlas://assets/atlas/icons-xhdpi/futebol'; fora do atlas, o PNG ou ""."""
+    name, ids = _load_atlas()
+    if key in ids:
+        return f"atlas://{ATLAS_DIR}/{name}/{key}".replace(os.sep, "/")
+    # Ex.: esporte novo vindo de /sports (refresh_sports_catalog) que o atlas ainda não tem
+    png = os.path.join(ICONS_DIR, f"{key}.png")
+    return png if os.path.exists(png) else ""